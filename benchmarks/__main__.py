@@ -0,0 +1,62 @@
+import argparse
+import sys
+
+from . import runner
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmarks tick, render and parse on standard worlds.')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser('run', help='run benchmarks')
+    run_parser.add_argument('--output', help='JSON file to write results to, '
+                                             'defaults to stdout')
+    run_parser.add_argument('--quick', action='store_true',
+                            help='small workloads only, for smoke testing')
+    run_parser.add_argument('--generations', type=int, default=None)
+    run_parser.add_argument('--repeats', type=int,
+                            default=runner.DEFAULT_REPEATS)
+    run_parser.add_argument('--seed', type=int, default=runner.DEFAULT_SEED)
+
+    compare_parser = subparsers.add_parser(
+        'compare', help='flag regressions between two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float,
+                                default=runner.DEFAULT_THRESHOLD,
+                                help='tolerated slowdown, as a fraction')
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.command == 'run':
+        results = runner.run(quick=args.quick, generations=args.generations,
+                             repeats=args.repeats, seed=args.seed)
+        if args.output:
+            with open(args.output, 'w') as file:
+                runner.dump(results, file)
+        else:
+            runner.dump(results, sys.stdout)
+
+        return 0
+
+    regressions = runner.compare(runner.load(args.baseline),
+                                 runner.load(args.current), args.threshold)
+    for workload, operation, slowdown in regressions:
+        print('REGRESSION {} {}: {:.0%} slower'.format(workload, operation,
+                                                      slowdown))
+
+    if not regressions:
+        print('No regressions above {:.0%}'.format(args.threshold))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+from functools import partial
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from game_of_life.location import Location
+from game_of_life.render_to_world import render_to_world
+from game_of_life.snapshot import load_snapshot, save_snapshot
+from game_of_life.world_renderer import WorldRenderer
+
+from .workloads import standard_workloads
+
+DEFAULT_GENERATIONS = 20
+QUICK_GENERATIONS = 3
+DEFAULT_REPEATS = 3
+DEFAULT_SEED = 0
+DEFAULT_THRESHOLD = 0.1
+
+
+def parseable_render(world):
+    """ Returns rendering of world in the '+'/'-' format render_to_world
+    reads """
+    x_range = range(world.min_location.x, world.max_location.x + 1)
+    y_range = range(world.max_location.y, world.min_location.y - 1, -1)
+    return '\n'.join(
+        ''.join('+' if world.is_alive_at(Location(x, y)) else '-'
+                for x in x_range)
+        for y in y_range)
+
+
+def _tick(world, generations):
+    for _ in range(generations):
+        world.tick()
+
+
+def _render(world, generations):
+    for _ in range(generations):
+        WorldRenderer(world).render()
+
+
+def _parse(render, generations):
+    for _ in range(generations):
+        render_to_world(render)
+
+
+def _snapshot_path(directory):
+    """ Returns path of the snapshot file used by snapshot benchmarks in
+    given directory """
+    return os.path.join(directory, 'benchmark.snapshot')
+
+
+def _save(path, world, generations):
+    for _ in range(generations):
+        with open(path, 'wb') as file:
+            save_snapshot(world, file)
+
+
+def _saved(path, world):
+    _save(path, world, 1)
+    return path
+
+
+def _load(path, generations):
+    for _ in range(generations):
+        load_snapshot(path)
+
+
+# Factories of (function, argument) pairs, called with a fresh world and the
+# temporary directory of the operation being timed
+OPERATIONS = {
+    'tick': lambda world, directory: (_tick, world),
+    'render': lambda world, directory: (_render, world),
+    'parse': lambda world, directory: (_parse, parseable_render(world)),
+    'snapshot_save': lambda world, directory: (
+        partial(_save, _snapshot_path(directory)), world),
+    'snapshot_load': lambda world, directory: (
+        _load, _saved(_snapshot_path(directory), world)),
+}
+
+
+def time_operation(operation, workload, generations, repeats=DEFAULT_REPEATS,
+                   seed=DEFAULT_SEED):
+    """ Times given operation on a fresh world of given workload, keeping the
+    best of repeats runs, then measures its peak memory in one more run.
+    Returns a result dict.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        return _time_operation(operation, workload, generations, repeats,
+                               seed, directory)
+
+
+def _time_operation(operation, workload, generations, repeats, seed,
+                    directory):
+    best_seconds = None
+    cell_count = 0
+
+    for _ in range(repeats):
+        random.seed(seed)
+        world = workload.make_world()
+        x_length, y_length = world.dimensions
+        cell_count = x_length * y_length
+        function, argument = OPERATIONS[operation](world, directory)
+
+        start = time.perf_counter()
+        function(argument, generations)
+        seconds = time.perf_counter() - start
+
+        if best_seconds is None or seconds < best_seconds:
+            best_seconds = seconds
+
+    random.seed(seed)
+    function, argument = OPERATIONS[operation](workload.make_world(),
+                                               directory)
+    tracemalloc.start()
+    try:
+        function(argument, generations)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    seconds = max(best_seconds, 1e-9)
+    return {
+        'workload': workload.name,
+        'operation': operation,
+        'generations': generations,
+        'seconds': best_seconds,
+        'generations_per_sec': generations / seconds,
+        'cells_per_sec': generations * cell_count / seconds,
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def run(quick=False, generations=None, repeats=DEFAULT_REPEATS,
+        seed=DEFAULT_SEED, operations=None, workloads=None):
+    """ Runs every operation on every standard workload, returning the
+    results as a JSON serializable dict.
+    """
+    if generations is None:
+        generations = QUICK_GENERATIONS if quick else DEFAULT_GENERATIONS
+
+    if workloads is None:
+        workloads = standard_workloads(quick=quick)
+
+    results = [time_operation(operation, workload, generations, repeats,
+                              seed)
+               for workload in workloads
+               for operation in (operations or sorted(OPERATIONS))]
+
+    return {'seed': seed, 'results': results}
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """ Returns list of (workload, operation, slowdown) tuples for results of
+    current that are slower than in baseline by more than threshold, a
+    fraction of the baseline's generations per second.
+    """
+    baseline_results = {(result['workload'], result['operation']): result
+                        for result in baseline['results']}
+    regressions = []
+
+    for result in current['results']:
+        key = (result['workload'], result['operation'])
+        if key not in baseline_results:
+            continue
+
+        baseline_rate = baseline_results[key]['generations_per_sec']
+        slowdown = 1 - result['generations_per_sec'] / baseline_rate
+        if slowdown > threshold:
+            regressions.append((key[0], key[1], slowdown))
+
+    return regressions
+
+
+def load(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def dump(results, file):
+    json.dump(results, file, indent=2, sort_keys=True)
+    file.write('\n')
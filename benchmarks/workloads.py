@@ -0,0 +1,81 @@
+from collections import namedtuple
+
+from game_of_life.location import Location
+from game_of_life.render_to_world import render_to_world
+from game_of_life.world import World
+
+GOSPER_GLIDER_GUN = ('------------------------+-----------\n'
+                     '----------------------+-+-----------\n'
+                     '------------++------++------------++\n'
+                     '-----------+---+----++------------++\n'
+                     '++--------+-----+---++--------------\n'
+                     '++--------+---+-++----+-+-----------\n'
+                     '----------+-----+-------+-----------\n'
+                     '-----------+---+--------------------\n'
+                     '------------++----------------------')
+
+R_PENTOMINO = ('-++\n'
+               '++-\n'
+               '-+-')
+
+SOUP_SIZES = (32, 128, 256)
+SOUP_DENSITIES = (0.1, 0.3, 0.5)
+QUICK_SOUP_SIZES = (16,)
+QUICK_SOUP_DENSITIES = (0.3,)
+
+
+class Workload(namedtuple('Workload', ['name', 'make_world'])):
+    """ A named world factory; make_world returns a fresh world each call so
+    that every timed run starts from the same generation.
+    """
+
+
+def soup(size, density):
+    def make_world():
+        return World.random(min_location=Location(0, 0),
+                            max_location=Location(size - 1, size - 1),
+                            cell_count=int(size * size * density))
+
+    return Workload('soup-{}x{}-{}'.format(size, size, density), make_world)
+
+
+def placed_pattern(name, render, size):
+    """ Workload with given '+'/'-' rendering placed at the center of a
+    size by size world.
+    """
+    def make_world():
+        pattern = render_to_world(render)
+        world = World(min_location=Location(0, 0),
+                      max_location=Location(size - 1, size - 1))
+        x_offset = (size - pattern.dimensions[0]) // 2
+        y_offset = (size - pattern.dimensions[1]) // 2
+        for location in pattern.living_locations:
+            world.set_living_at(Location(location.x + x_offset,
+                                         location.y + y_offset))
+
+        return world
+
+    return Workload(name, make_world)
+
+
+def empty_box(size):
+    def make_world():
+        return World.empty(min_location=Location(0, 0),
+                           max_location=Location(size - 1, size - 1))
+
+    return Workload('empty-{}x{}'.format(size, size), make_world)
+
+
+def standard_workloads(quick=False):
+    sizes = QUICK_SOUP_SIZES if quick else SOUP_SIZES
+    densities = QUICK_SOUP_DENSITIES if quick else SOUP_DENSITIES
+    pattern_size = 64 if quick else 256
+
+    workloads = [soup(size, density)
+                 for size in sizes for density in densities]
+    workloads.append(placed_pattern('glider-gun', GOSPER_GLIDER_GUN,
+                                    pattern_size))
+    workloads.append(placed_pattern('r-pentomino', R_PENTOMINO,
+                                    pattern_size))
+    workloads.append(empty_box(pattern_size))
+    return workloads
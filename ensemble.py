@@ -0,0 +1,57 @@
+import argparse
+
+from game_of_life.ensemble import DEFAULT_CHUNK_SIZE, Ensemble, collect
+from game_of_life.rule import Rule
+
+
+def run_ensemble(densities, runs, size, generations, seed=0, workers=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, rule='B3/S23', csv_path=None):
+    """
+    Runs random soups across worker processes and prints histograms of their
+    lifespans, final populations and periods.
+    """
+    ensemble = Ensemble(densities, runs, size, generations, seed=seed,
+                        workers=workers, chunk_size=chunk_size,
+                        rule=Rule.from_string(rule))
+
+    if csv_path is None:
+        statistics = collect(ensemble.results())
+    else:
+        with open(csv_path, 'w', newline='') as csv_file:
+            statistics = collect(ensemble.results(), csv_file)
+
+    for density in statistics.densities:
+        print('Density {}: {} unsettled'.format(
+            density, statistics.unsettled_counts[density]))
+        for field in ('lifespan', 'final_population', 'period'):
+            print('  {}: {}'.format(field, ', '.join(
+                '{}: {}'.format(value, count)
+                for value, count in statistics.histogram(field, density))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=run_ensemble.__doc__)
+    parser.add_argument('--densities', type=float, nargs='+',
+                        default=[0.375])
+    parser.add_argument('--runs', type=int, default=100,
+                        help='number of soups per density')
+    parser.add_argument('--size', type=int, default=32,
+                        help='width and height of soups')
+    parser.add_argument('--generations', type=int, default=1000,
+                        help='maximum generations a soup is run for')
+    parser.add_argument('--seed', type=int, default=0, help='master seed')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='number of soups sent to a worker at once')
+    parser.add_argument('--rule', default='B3/S23')
+    parser.add_argument('--csv', default=None,
+                        help='CSV file to write every soup result to')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    run_ensemble(args.densities, args.runs, args.size, args.generations,
+                 seed=args.seed, workers=args.workers,
+                 chunk_size=args.chunk_size, rule=args.rule,
+                 csv_path=args.csv)
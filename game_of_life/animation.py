@@ -0,0 +1,327 @@
+""" Export of generations as animated GIFs or indexed-colour PNG frames,
+using only the standard library.
+
+Generations are any objects with min_location, max_location and
+living_locations, such as worlds yielded by generations() or Frames of a
+FramePipeline. Each is packed into rows (see pack_rows) covering a fixed
+viewport, by default the bounds of the first generation; cells outside of it
+are left out. Every cell is drawn as a cell_size by cell_size square.
+
+GIF frames after the first only cover the rectangle of cells that changed
+since the previous frame, which is found by XORing packed rows, and
+generations identical to the previous one extend its delay rather than
+adding a frame. Each frame is compressed with GIF's LZW.
+"""
+import struct
+import zlib
+
+from .rows import pack_row, x_indexes_by_y
+
+DEFAULT_CELL_SIZE = 4
+# Dead and living cell colours, as (red, green, blue) tuples
+DEFAULT_COLORS = ((255, 255, 255), (0, 0, 0))
+# In hundredths of a second, GIF's unit for delays
+DEFAULT_FRAME_DELAY = 10
+MAX_FRAME_DELAY = 0xFFFF
+
+GIF_HEADER = b'GIF89a'
+GIF_TRAILER = b'\x3b'
+# Global colour table of 2 colours, with 8 bit colour resolution
+GIF_SCREEN_FLAGS = 0xf0
+# Leave frames in place for the next ones to be drawn over
+GIF_DISPOSAL_FLAGS = 1 << 2
+LZW_MIN_CODE_SIZE = 2
+LZW_MAX_CODE_SIZE = 12
+SUB_BLOCK_SIZE = 255
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_INDEXED_COLOR = 3
+
+
+def generations(world, turns):
+    """ Yields world for its current generation, then after each of turns
+    ticks, like turn_renderings does with renderings. The same world is
+    yielded every time, so each generation must be used before the next.
+    """
+    yield world
+    for _ in range(turns):
+        yield world.tick()
+
+
+def pack_rows(world, min_location, max_location):
+    """ Returns list of the rows of cells within given bounds, from the
+    highest y coordinate down as images are drawn. Each row is an int where
+    bit i is set if the cell at min_location.x + i is living.
+    """
+    width = max_location.x - min_location.x + 1
+    x_indexes = x_indexes_by_y(
+        ((x, y) for x, y in world.living_locations
+         if (min_location.x <= x <= max_location.x and
+             min_location.y <= y <= max_location.y)),
+        min_location.x)
+
+    return [pack_row(x_indexes[y], width) if y in x_indexes else 0
+            for y in range(max_location.y, min_location.y - 1, -1)]
+
+
+class GifWriter():
+    """ Writes frames of packed rows to a binary file as an animated GIF.
+
+    args:
+        file: binary file object
+        width, height: size of frames, in cells
+        cell_size: width and height of cells, in pixels
+        colors: colours of dead and living cells
+        delay: time frames are shown for, in hundredths of a second
+        loop: if set, the animation repeats forever
+    """
+
+    def __init__(self, file, width, height, cell_size=DEFAULT_CELL_SIZE,
+                 colors=DEFAULT_COLORS, delay=DEFAULT_FRAME_DELAY,
+                 loop=True):
+        self.file = file
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.delay = delay
+        self.frame_count = 0
+        self._rows = None
+        # Frame written once it is known not to be repeated, as a list of
+        # [left, top, width, height, pixels, delay] in pixels
+        self._pending_frame = None
+        self._scale = _scale_table(cell_size)
+
+        file.write(GIF_HEADER)
+        file.write(struct.pack('<HHBBB', width * cell_size,
+                               height * cell_size, GIF_SCREEN_FLAGS, 0, 0))
+        file.write(bytes(channel for color in colors for channel in color))
+        if loop:
+            file.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00')
+
+    def write(self, rows):
+        """ Adds frame of given packed rows (see pack_rows) """
+        if self._rows is None:
+            top, bottom, left, right = 0, self.height - 1, 0, self.width - 1
+        else:
+            changed_indexes = [index for index, (row, previous_row)
+                               in enumerate(zip(rows, self._rows))
+                               if row != previous_row]
+            if not changed_indexes:
+                self._pending_frame[5] = min(
+                    self._pending_frame[5] + self.delay, MAX_FRAME_DELAY)
+                return
+
+            top, bottom = changed_indexes[0], changed_indexes[-1]
+            changes = 0
+            for index in changed_indexes:
+                changes |= rows[index] ^ self._rows[index]
+
+            left = (changes & -changes).bit_length() - 1
+            right = changes.bit_length() - 1
+
+        self._flush()
+        self._rows = list(rows)
+
+        width = right - left + 1
+        mask = (1 << width) - 1
+        pixels = bytearray()
+        for row in rows[top:bottom + 1]:
+            pixel_row = _pixel_digits((row >> left) & mask, width,
+                                      self._scale).encode('ascii')
+            pixels += pixel_row.translate(_DIGIT_INDEXES) * self.cell_size
+
+        cell_size = self.cell_size
+        self._pending_frame = [left * cell_size, top * cell_size,
+                               width * cell_size,
+                               (bottom - top + 1) * cell_size, pixels,
+                               self.delay]
+
+    def close(self):
+        """ Writes the last frame and ends the GIF, leaving the file open """
+        self._flush()
+        self.file.write(GIF_TRAILER)
+
+    def _flush(self):
+        if self._pending_frame is None:
+            return
+
+        left, top, width, height, pixels, delay = self._pending_frame
+        self._pending_frame = None
+
+        self.file.write(struct.pack('<BBBBHBB', 0x21, 0xf9, 4,
+                                    GIF_DISPOSAL_FLAGS, delay, 0, 0))
+        self.file.write(struct.pack('<BHHHHB', 0x2c, left, top, width,
+                                    height, 0))
+        self.file.write(bytes([LZW_MIN_CODE_SIZE]))
+
+        data = lzw_encode(pixels, LZW_MIN_CODE_SIZE)
+        for start in range(0, len(data), SUB_BLOCK_SIZE):
+            block = data[start:start + SUB_BLOCK_SIZE]
+            self.file.write(bytes([len(block)]) + block)
+
+        self.file.write(b'\x00')
+        self.frame_count += 1
+
+
+def save_gif(generations, file, viewport=None, cell_size=DEFAULT_CELL_SIZE,
+             colors=DEFAULT_COLORS, delay=DEFAULT_FRAME_DELAY, loop=True):
+    """ Writes given generations to a binary file as an animated GIF,
+    returning the number of frames written.
+
+    args:
+        viewport: optional (min_location, max_location) tuple of the cells
+            drawn, defaults to the bounds of the first generation
+    """
+    writer = None
+    for world in generations:
+        if viewport is None:
+            viewport = (world.min_location, world.max_location)
+
+        if writer is None:
+            min_location, max_location = viewport
+            writer = GifWriter(file, max_location.x - min_location.x + 1,
+                               max_location.y - min_location.y + 1,
+                               cell_size, colors, delay, loop)
+
+        writer.write(pack_rows(world, *viewport))
+
+    if writer is None:
+        raise ValueError('Cannot save a GIF without any generation')
+
+    writer.close()
+    return writer.frame_count
+
+
+def write_png(rows, width, file, cell_size=DEFAULT_CELL_SIZE,
+              colors=DEFAULT_COLORS):
+    """ Writes given packed rows (see pack_rows), each of given width in
+    cells, to a binary file as a 1 bit indexed-colour PNG.
+    """
+    scale = _scale_table(cell_size)
+    pixel_width = width * cell_size
+    row_padding = '0' * (-pixel_width % 8)
+    row_byte_count = (pixel_width + 7) // 8
+
+    compressor = zlib.compressobj()
+    data = []
+    for row in rows:
+        digits = _pixel_digits(row, width, scale) + row_padding
+        # Every row starts with its filter type, none
+        scanline = b'\x00' + int(digits, 2).to_bytes(row_byte_count, 'big')
+        data.append(compressor.compress(scanline * cell_size))
+
+    data.append(compressor.flush())
+
+    file.write(PNG_SIGNATURE)
+    _write_png_chunk(file, b'IHDR', struct.pack(
+        '>IIBBBBB', pixel_width, len(rows) * cell_size, 1,
+        PNG_INDEXED_COLOR, 0, 0, 0))
+    _write_png_chunk(file, b'PLTE', bytes(channel for color in colors
+                                          for channel in color))
+    _write_png_chunk(file, b'IDAT', b''.join(data))
+    _write_png_chunk(file, b'IEND', b'')
+
+
+def save_png_frames(generations, path_format, viewport=None,
+                    cell_size=DEFAULT_CELL_SIZE, colors=DEFAULT_COLORS):
+    """ Writes every given generation as a PNG, to the path given by
+    formatting path_format (such as 'frame_{:04}.png') with its index.
+    Returns the number of frames written.
+
+    args:
+        viewport: optional (min_location, max_location) tuple of the cells
+            drawn, defaults to the bounds of the first generation
+    """
+    frame_count = 0
+    for world in generations:
+        if viewport is None:
+            viewport = (world.min_location, world.max_location)
+
+        min_location, max_location = viewport
+        with open(path_format.format(frame_count), 'wb') as file:
+            write_png(pack_rows(world, *viewport),
+                      max_location.x - min_location.x + 1, file, cell_size,
+                      colors)
+
+        frame_count += 1
+
+    return frame_count
+
+
+def lzw_encode(indexes, min_code_size=LZW_MIN_CODE_SIZE):
+    """ Returns GIF LZW compression of given bytes of colour indexes, below
+    2^min_code_size. Codes are packed least significant bit first and the
+    code table is cleared whenever it fills up.
+    """
+    clear_code = 1 << min_code_size
+    end_code = clear_code + 1
+    output = bytearray()
+    codes = {}
+    next_code = end_code + 1
+    code_size = min_code_size + 1
+    # Bits not yet written to output, starting with a clear code
+    bit_buffer, bit_count = clear_code, code_size
+
+    prefix = indexes[0] if indexes else None
+    for index in indexes[1:]:
+        # Strings are keyed by the code of their prefix and their last index
+        key = prefix << 8 | index
+        code = codes.get(key)
+        if code is not None:
+            prefix = code
+            continue
+
+        bit_buffer |= prefix << bit_count
+        bit_count += code_size
+
+        if next_code < 1 << LZW_MAX_CODE_SIZE:
+            codes[key] = next_code
+            if next_code == 1 << code_size:
+                code_size += 1
+            next_code += 1
+        else:
+            bit_buffer |= clear_code << bit_count
+            bit_count += code_size
+            codes = {}
+            next_code = end_code + 1
+            code_size = min_code_size + 1
+
+        prefix = index
+
+        if bit_count >= 8:
+            byte_count = bit_count // 8
+            output += (bit_buffer & ((1 << byte_count * 8) - 1)).to_bytes(
+                byte_count, 'little')
+            bit_buffer >>= byte_count * 8
+            bit_count -= byte_count * 8
+
+    if prefix is not None:
+        bit_buffer |= prefix << bit_count
+        bit_count += code_size
+
+    bit_buffer |= end_code << bit_count
+    bit_count += code_size
+    output += bit_buffer.to_bytes((bit_count + 7) // 8, 'little')
+    return bytes(output)
+
+
+# Maps the ASCII binary digits of pixels to their colour indexes
+_DIGIT_INDEXES = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def _scale_table(cell_size):
+    """ Returns str.translate table repeating binary digits cell_size times
+    """
+    return {ord('0'): '0' * cell_size, ord('1'): '1' * cell_size}
+
+
+def _pixel_digits(row, width, scale):
+    """ Returns str of the binary digits of given packed row's pixels, from
+    the lowest x coordinate up """
+    return '{:0{}b}'.format(row, width)[::-1].translate(scale)
+
+
+def _write_png_chunk(file, chunk_type, data):
+    file.write(struct.pack('>I', len(data)))
+    file.write(chunk_type + data)
+    file.write(struct.pack('>I', zlib.crc32(chunk_type + data)))
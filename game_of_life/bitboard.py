@@ -0,0 +1,328 @@
+import sys
+
+from .location import (Location, get_max_coordinates_location,
+                       get_min_coordinates_location, pack)
+from .rows import pack_row, x_indexes_by_y
+from .rule import CONWAY
+from .world import World, DEFAULT_MIN_LOCATION, DEFAULT_MAX_LOCATION
+
+
+class Bitboard():
+    """ Bit-packed board using one Python int per row and one bit per cell.
+
+    Bit i of rows[j] represents Location(min_location.x + i,
+    min_location.y + j). Nothing lives outside of the board's bounds, so a
+    tick never gives birth beyond them.
+    """
+
+    def __init__(self, min_location, max_location, rows=None):
+        self.min_location = min_location
+        self.max_location = max_location
+
+        if rows is None:
+            rows = [0] * self.height
+
+        self.rows = rows
+
+    @classmethod
+    def from_locations(cls, locations, min_location, max_location):
+        bitboard = cls(min_location, max_location)
+        for location in locations:
+            bitboard.set_alive_at(location, True)
+
+        return bitboard
+
+    @property
+    def width(self):
+        return self.max_location.x - self.min_location.x + 1
+
+    @property
+    def height(self):
+        return self.max_location.y - self.min_location.y + 1
+
+    @property
+    def population(self):
+        return sum(bin(row).count('1') for row in self.rows)
+
+    @property
+    def memory_bytes(self):
+        """ Number of bytes taken by the row list and its row ints """
+        return (sys.getsizeof(self.rows) +
+                sum(sys.getsizeof(row) for row in self.rows))
+
+    @property
+    def bytes_per_cell(self):
+        return self.memory_bytes / (self.width * self.height)
+
+    def contains(self, location):
+        return (self.min_location.x <= location.x <= self.max_location.x and
+                self.min_location.y <= location.y <= self.max_location.y)
+
+    def is_alive_at(self, location):
+        if not self.contains(location):
+            return False
+
+        row = self.rows[location.y - self.min_location.y]
+        return bool(row >> (location.x - self.min_location.x) & 1)
+
+    def set_alive_at(self, location, alive):
+        if not self.contains(location):
+            raise ValueError('{} is outside of bitboard bounds'
+                             .format(location))
+
+        y_index = location.y - self.min_location.y
+        bit = 1 << (location.x - self.min_location.x)
+
+        if alive:
+            self.rows[y_index] |= bit
+        else:
+            self.rows[y_index] &= ~bit
+
+    def keys(self, rows=None):
+        """ Yields keys of the living locations, or of the set bits of given
+        rows over the same bounds, row by row in ascending y order """
+        if rows is None:
+            rows = self.rows
+
+        for y_index, row in enumerate(rows):
+            # Keys of a row only differ by their x offsets
+            row_key = pack(self.min_location.x, self.min_location.y + y_index)
+            while row:
+                lowest_bit = row & -row
+                yield row_key + lowest_bit.bit_length() - 1
+                row ^= lowest_bit
+
+    def locations(self):
+        """ Yields living locations, row by row in ascending y order """
+        for y_index, row in enumerate(self.rows):
+            y = self.min_location.y + y_index
+            while row:
+                lowest_bit = row & -row
+                yield Location(self.min_location.x +
+                               lowest_bit.bit_length() - 1, y)
+                row ^= lowest_bit
+
+    def resized(self, min_location, max_location):
+        """ Returns bitboard over the given bounds holding the living cells of
+        this one that fall within them.
+        """
+        shift = self.min_location.x - min_location.x
+        width_mask = (1 << (max_location.x - min_location.x + 1)) - 1
+        rows = []
+
+        for y in range(min_location.y, max_location.y + 1):
+            y_index = y - self.min_location.y
+            if not 0 <= y_index < self.height:
+                rows.append(0)
+                continue
+
+            row = self.rows[y_index]
+            row = row << shift if shift >= 0 else row >> -shift
+            rows.append(row & width_mask)
+
+        return Bitboard(min_location, max_location, rows)
+
+    def tick(self, rule=CONWAY):
+        """ Advances the board by one generation of given Rule, in place """
+        width_mask = (1 << self.width) - 1
+        survival_counts = sorted(rule.survival_counts)
+        birth_counts = sorted(rule.birth_counts)
+
+        padded_rows = [0] + self.rows + [0]
+        next_rows = []
+
+        for y_index, row in enumerate(self.rows, start=1):
+            below, above = padded_rows[y_index - 1], padded_rows[y_index + 1]
+            neighbor_rows = (below << 1, below, below >> 1,
+                             row << 1, row >> 1,
+                             above << 1, above, above >> 1)
+            count_bits = _count_bits(neighbor_rows)
+
+            survivals = _count_in(count_bits, survival_counts)
+            births = _count_in(count_bits, birth_counts)
+            next_rows.append(((row & survivals) | (~row & births)) &
+                             width_mask)
+
+        self.rows = next_rows
+        return self
+
+
+class BitboardWorld(World):
+    """ World backed by a Bitboard, taking one bit per cell within its bounds.
+    The bitboard is resized whenever a living cell is set outside of them.
+    """
+
+    def __init__(self, min_location=DEFAULT_MIN_LOCATION,
+                 max_location=DEFAULT_MAX_LOCATION, engine=None, rule=None):
+        super().__init__(min_location, max_location, engine=engine,
+                         rule=rule)
+        self._bitboard = Bitboard(min_location, max_location)
+
+    @classmethod
+    def from_world(cls, world):
+        bitboard_world = cls(world.min_location, world.max_location,
+                             rule=world.rule)
+        bitboard_world.set_living_many(world.living_locations)
+
+        return bitboard_world
+
+    def to_world(self):
+        world = World(self.min_location, self.max_location, rule=self.rule)
+        world.set_living_many(self._bitboard.locations())
+
+        return world
+
+    def set_dead_at(self, location):
+        if self._bitboard.contains(location):
+            self._bitboard.set_alive_at(location, False)
+            self._mark_bulk_edited()
+
+    def set_living_at(self, location):
+        self._expand_bounds_to(location)
+
+        if not self._bitboard.contains(location):
+            self._bitboard = self._bitboard.resized(self.min_location,
+                                                    self.max_location)
+
+        self._bitboard.set_alive_at(location, True)
+        self._mark_bulk_edited()
+
+    def set_living_many(self, locations):
+        """ Sets every location of given iterable living, resizing the
+        bitboard at most once """
+        locations = [Location(x, y) for x, y in locations]
+        if not locations:
+            return
+
+        self._expand_bounds_to(get_min_coordinates_location(locations))
+        self._expand_bounds_to(get_max_coordinates_location(locations))
+        if ((self._bitboard.min_location, self._bitboard.max_location) !=
+                (self.min_location, self.max_location)):
+            self._bitboard = self._bitboard.resized(self.min_location,
+                                                    self.max_location)
+
+        for location in locations:
+            self._bitboard.set_alive_at(location, True)
+        self._mark_bulk_edited()
+
+    def _set_living_indexes(self, indexes):
+        x_length, _ = self.dimensions
+        x_indexes = x_indexes_by_y(
+            ((index % x_length, index // x_length) for index in indexes), 0)
+
+        rows = self._bitboard.rows
+        for y_index, row_x_indexes in x_indexes.items():
+            rows[y_index] |= pack_row(row_x_indexes, x_length)
+        self._mark_bulk_edited()
+
+    def set_dead_many(self, locations):
+        for x, y in locations:
+            self.set_dead_at(Location(x, y))
+
+    def is_alive_at(self, location):
+        return self._bitboard.is_alive_at(location)
+
+    @property
+    def living_locations(self):
+        return list(self._bitboard.locations())
+
+    def count_living_in(self, min_location, max_location):
+        bounds = self._bounds_within(min_location, max_location)
+        if bounds is None:
+            return 0
+
+        return self._bitboard.resized(*bounds).population
+
+    def living_in(self, min_location, max_location):
+        bounds = self._bounds_within(min_location, max_location)
+        if bounds is None:
+            return []
+
+        return list(self._bitboard.resized(*bounds).locations())
+
+    def tick(self):
+        stats = self._new_tick_stats()
+        previous_rows = self._bitboard.rows
+        if stats is None:
+            self._bitboard.tick(self.rule)
+        else:
+            with stats.phase('rule_evaluation'):
+                self._bitboard.tick(self.rule)
+
+        self.generation += 1
+        if stats is None and self.history is None:
+            return self
+
+        # Changed cells are found by XORing rows with their previous ones
+        rows = self._bitboard.rows
+        birth_rows = [row & (row ^ previous_row)
+                      for row, previous_row in zip(rows, previous_rows)]
+        death_rows = [previous_row & (row ^ previous_row)
+                      for row, previous_row in zip(rows, previous_rows)]
+
+        if stats is not None:
+            stats.locations_evaluated = self._bitboard.width * len(rows)
+            self._record_tick_stats(
+                stats, sum(bin(row).count('1') for row in birth_rows),
+                sum(bin(row).count('1') for row in death_rows))
+
+        if self.history is not None:
+            self.history.record(self.generation, self._bitboard.keys(),
+                                self._bitboard.keys(birth_rows),
+                                self._bitboard.keys(death_rows),
+                                self.min_location, self.max_location)
+
+        return self
+
+    @property
+    def living_cell_count(self):
+        return self._bitboard.population
+
+    def _living_key_iterable(self):
+        return self._bitboard.keys()
+
+    def _restore(self, living_keys, min_location, max_location):
+        self.min_location = min_location
+        self.max_location = max_location
+        self._bitboard = Bitboard.from_locations(
+            map(Location.from_key, living_keys), min_location, max_location)
+
+
+def _half_add(a, b):
+    return a ^ b, a & b
+
+
+def _full_add(a, b, c):
+    partial_sum = a ^ b
+    return partial_sum ^ c, (a & b) | (partial_sum & c)
+
+
+def _count_bits(neighbor_rows):
+    """ Adds up eight neighbor rows bit-wise, returning the four bit planes
+    (ones, twos, fours, eights) of every cell's neighbor count.
+    """
+    n0, n1, n2, n3, n4, n5, n6, n7 = neighbor_rows
+
+    ones_a, twos_a = _full_add(n0, n1, n2)
+    ones_b, twos_b = _full_add(n3, n4, n5)
+    ones_c, twos_c = _half_add(n6, n7)
+    ones, twos_d = _full_add(ones_a, ones_b, ones_c)
+
+    twos_e, fours_a = _full_add(twos_a, twos_b, twos_c)
+    twos, fours_b = _half_add(twos_e, twos_d)
+    fours, eights = _half_add(fours_a, fours_b)
+
+    return ones, twos, fours, eights
+
+
+def _count_in(count_bits, counts):
+    """ Returns mask of the cells whose neighbor count is one of counts """
+    mask = 0
+    for count in counts:
+        count_mask = -1
+        for bit_index, bits in enumerate(count_bits):
+            count_mask &= bits if count >> bit_index & 1 else ~bits
+
+        mask |= count_mask
+
+    return mask
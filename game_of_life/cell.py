@@ -1,9 +1,31 @@
+import warnings
+
+from .rule import CONWAY
+
+
 class Cell():
-    STABLE_NEIGHBOR_RANGE = range(2, 4)
-    FERTILE_NEIGHBOR_COUNT = 3
+    """ A single cell. Engines look next states up in a Rule's table rather
+    than going through cells; is_alive_next_generation does the same lookup.
+
+    STABLE_NEIGHBOR_RANGE and FERTILE_NEIGHBOR_COUNT are deprecated: they
+    only describe Conway's rule, from which they are derived, and nothing
+    reads them. Give cells and worlds a Rule instead.
+    """
+    STABLE_NEIGHBOR_RANGE = range(min(CONWAY.survival_counts),
+                                  max(CONWAY.survival_counts) + 1)
+    FERTILE_NEIGHBOR_COUNT = min(CONWAY.birth_counts)
 
-    def __init__(self, alive=True):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in ('STABLE_NEIGHBOR_RANGE', 'FERTILE_NEIGHBOR_COUNT'):
+            if name in vars(cls):
+                warnings.warn('{}.{} is ignored, give cells a Rule '
+                              'instead'.format(cls.__name__, name),
+                              DeprecationWarning, stacklevel=2)
+
+    def __init__(self, alive=True, rule=CONWAY):
         self.alive = alive
+        self.rule = rule
 
     def die(self):
         self.alive = False
@@ -13,13 +35,4 @@ class Cell():
         return self.alive
 
     def is_alive_next_generation(self, neighbor_count):
-        if self.is_alive:
-            return self._has_stable_neighborhood(neighbor_count)
-        else:
-            return self._has_fertile_neighborhood(neighbor_count)
-
-    def _has_stable_neighborhood(self, neighbor_count):
-        return neighbor_count in self.STABLE_NEIGHBOR_RANGE
-
-    def _has_fertile_neighborhood(self, neighbor_count):
-        return neighbor_count == self.FERTILE_NEIGHBOR_COUNT
+        return self.rule.next_state(self.is_alive, neighbor_count)
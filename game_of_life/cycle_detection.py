@@ -0,0 +1,92 @@
+from collections import OrderedDict, namedtuple
+import hashlib
+
+from .location import get_min_coordinates_location
+
+DEFAULT_MAX_HISTORY = 1024
+DIGEST_BYTES = 16
+
+
+class Cycle(namedtuple('Cycle', ['start_generation', 'period', 'offset'])):
+    """ A repeating sequence of generations. The generation period
+    generations after start_generation is the start generation's living
+    cells translated by offset, an (x, y) tuple that is (0, 0) for still
+    lifes and oscillators.
+    """
+
+    def equivalent_generation(self, generation):
+        """ For a generation at or after the cycle start, returns a tuple
+        of the generation within the first period it repeats, and the (x, y)
+        offset it is translated by relative to that generation.
+        """
+        periods, remainder = divmod(generation - self.start_generation,
+                                    self.period)
+        offset = (self.offset[0] * periods, self.offset[1] * periods)
+        return self.start_generation + remainder, offset
+
+
+class CycleDetector():
+    """ Remembers hashes of the most recent generations' living cells, to spot
+    when a generation repeats one of them.
+
+    Each generation is remembered as a BLAKE2b digest of its sorted living
+    cells along with its population, rather than as the cells themselves,
+    so memory does not grow with the population. A digest match only closes
+    a cycle if the population of the remembered generation matches too.
+
+    args:
+        max_history: number of generations remembered
+        normalize_translation: if set, generations that are translations of
+            each other count as repeats, which catches spaceships
+    """
+
+    def __init__(self, max_history=DEFAULT_MAX_HISTORY,
+                 normalize_translation=True):
+        self.max_history = max_history
+        self.normalize_translation = normalize_translation
+        self._history = OrderedDict()
+
+    def observe(self, generation, living_locations):
+        """ Records given generation, returning the Cycle it closes if it
+        repeats a remembered generation, otherwise None.
+        """
+        living_locations = list(living_locations)
+        key, origin = self._key(living_locations)
+
+        remembered = self._history.get(key)
+        if (remembered is not None and
+                remembered[2] == len(living_locations)):
+            previous_generation, previous_origin, _ = remembered
+            offset = (origin[0] - previous_origin[0],
+                      origin[1] - previous_origin[1])
+            return Cycle(previous_generation,
+                         generation - previous_generation, offset)
+
+        self._history[key] = (generation, origin, len(living_locations))
+        if len(self._history) > self.max_history:
+            self._history.popitem(last=False)
+
+        return None
+
+    def _key(self, living_locations):
+        """ Returns digest of given living locations, relative to their
+        minimum coordinates, and those coordinates when normalizing
+        translation, otherwise (0, 0) with the coordinates in the digest.
+        """
+        digest = hashlib.blake2b(digest_size=DIGEST_BYTES)
+        if not living_locations:
+            return digest.digest(), (0, 0)
+
+        origin = get_min_coordinates_location(living_locations)
+        width = max(location.x for location in living_locations) - origin.x + 1
+        # Row-major indexes of the cells within their bounding box
+        indexes = sorted((location.y - origin.y) * width +
+                         location.x - origin.x
+                         for location in living_locations)
+        digest.update(repr((width, indexes)).encode('ascii'))
+
+        if not self.normalize_translation:
+            digest.update(repr(tuple(origin)).encode('ascii'))
+            return digest.digest(), (0, 0)
+
+        return digest.digest(), (origin.x, origin.y)
@@ -0,0 +1,247 @@
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    numpy = None
+
+from .location import (Location, get_max_coordinates_location,
+                       get_min_coordinates_location, pack, unpack)
+from .world import World, DEFAULT_MIN_LOCATION, DEFAULT_MAX_LOCATION
+
+
+class DenseWorld(World):
+    """ World backed by a 2D NumPy bool array instead of per-location cells.
+
+    The array (the "board") covers at least the world's bounds; rows are
+    indexed by y and columns by x, both relative to the board's origin. The
+    board is grown, with some slack, whenever a living cell is set outside of
+    it, so that set_living_at keeps expanding the world as it does for World.
+    Requires numpy.
+    """
+
+    def __init__(self, min_location=DEFAULT_MIN_LOCATION,
+                 max_location=DEFAULT_MAX_LOCATION, engine=None, rule=None):
+        if numpy is None:
+            raise ImportError('DenseWorld requires numpy to be installed')
+
+        super().__init__(min_location, max_location, engine=engine,
+                         rule=rule)
+        x_length, y_length = self.dimensions
+        self._origin = min_location
+        self._board = numpy.zeros((y_length, x_length), dtype=bool)
+
+    @classmethod
+    def from_world(cls, world):
+        dense_world = cls(world.min_location, world.max_location,
+                          rule=world.rule)
+        dense_world.set_living_many(world.living_locations)
+
+        return dense_world
+
+    def set_dead_at(self, location):
+        if self._board_contains(location):
+            self._board[self._board_index(location)] = False
+            self._mark_bulk_edited()
+
+    def set_living_at(self, location):
+        old_min_location, old_bounded_board = (self.min_location,
+                                               self._bounded_board)
+        self._expand_bounds_to(location)
+
+        if not self._board_contains(location):
+            self._grow_board(old_min_location, old_bounded_board)
+
+        self._board[self._board_index(location)] = True
+        self._mark_bulk_edited()
+
+    def set_living_many(self, locations):
+        """ Sets every location of given iterable living, growing the board
+        at most once """
+        locations = [Location(x, y) for x, y in locations]
+        if not locations:
+            return
+
+        old_min_location, old_bounded_board = (self.min_location,
+                                               self._bounded_board)
+        min_location = get_min_coordinates_location(locations)
+        max_location = get_max_coordinates_location(locations)
+        self._expand_bounds_to(min_location)
+        self._expand_bounds_to(max_location)
+
+        if not (self._board_contains(min_location) and
+                self._board_contains(max_location)):
+            self._grow_board(old_min_location, old_bounded_board)
+
+        x_indexes = numpy.fromiter((location.x for location in locations),
+                                   dtype=numpy.intp, count=len(locations))
+        y_indexes = numpy.fromiter((location.y for location in locations),
+                                   dtype=numpy.intp, count=len(locations))
+        self._board[y_indexes - self._origin.y,
+                    x_indexes - self._origin.x] = True
+        self._mark_bulk_edited()
+
+    def _set_living_indexes(self, indexes):
+        x_length, _ = self.dimensions
+        y_indexes, x_indexes = numpy.divmod(
+            numpy.fromiter(indexes, numpy.intp), x_length)
+        self._bounded_board[y_indexes, x_indexes] = True
+        self._mark_bulk_edited()
+
+    def set_dead_many(self, locations):
+        for x, y in locations:
+            self.set_dead_at(Location(x, y))
+
+    def is_alive_at(self, location):
+        if not self._board_contains(location):
+            return False
+
+        return bool(self._board[self._board_index(location)])
+
+    @property
+    def living_locations(self):
+        y_indexes, x_indexes = numpy.nonzero(self._bounded_board)
+        return [Location(int(x) + self.min_location.x,
+                         int(y) + self.min_location.y)
+                for x, y in zip(x_indexes, y_indexes)]
+
+    def count_living_in(self, min_location, max_location):
+        bounds = self._bounds_within(min_location, max_location)
+        if bounds is None:
+            return 0
+
+        return int(numpy.count_nonzero(self._board_region(*bounds)))
+
+    def living_in(self, min_location, max_location):
+        bounds = self._bounds_within(min_location, max_location)
+        if bounds is None:
+            return []
+
+        region_min_location, _ = bounds
+        y_indexes, x_indexes = numpy.nonzero(self._board_region(*bounds))
+        return [Location(int(x) + region_min_location.x,
+                         int(y) + region_min_location.y)
+                for x, y in zip(x_indexes, y_indexes)]
+
+    def tick(self):
+        stats = self._new_tick_stats()
+        board = self._bounded_board
+        # Rule table as a (2, 9) array, indexed by [alive, neighbor_count]
+        table = numpy.array(self.rule.table).reshape(2, -1)
+
+        # Only kept to find births and deaths when they are needed
+        previous_board = None
+        if stats is not None or self.history is not None:
+            previous_board = board.copy()
+
+        if stats is None:
+            board[...] = table[board.astype(numpy.intp),
+                               _count_neighbors(board)]
+        else:
+            with stats.phase('neighbor_count'):
+                neighbor_counts = _count_neighbors(board)
+
+            with stats.phase('rule_evaluation'):
+                board[...] = table[board.astype(numpy.intp),
+                                   neighbor_counts]
+
+        self.generation += 1
+        if previous_board is None:
+            return self
+
+        births, deaths = board & ~previous_board, previous_board & ~board
+
+        if stats is not None:
+            stats.locations_evaluated = board.size
+            self._record_tick_stats(stats, int(numpy.count_nonzero(births)),
+                                    int(numpy.count_nonzero(deaths)))
+
+        if self.history is not None:
+            self.history.record(self.generation, self._living_key_iterable(),
+                                self._keys_of(births), self._keys_of(deaths),
+                                self.min_location, self.max_location)
+
+        return self
+
+    @property
+    def living_cell_count(self):
+        return int(numpy.count_nonzero(self._bounded_board))
+
+    def _living_key_iterable(self):
+        return self._keys_of(self._bounded_board)
+
+    def _restore(self, living_keys, min_location, max_location):
+        """ Replaces the board by one over exactly given bounds """
+        x_length = max_location.x - min_location.x + 1
+        y_length = max_location.y - min_location.y + 1
+        self.min_location = self._origin = min_location
+        self.max_location = max_location
+        self._board = numpy.zeros((y_length, x_length), dtype=bool)
+
+        coordinates = numpy.array([unpack(key) for key in living_keys],
+                                  dtype=numpy.intp).reshape(-1, 2)
+        self._board[coordinates[:, 1] - min_location.y,
+                    coordinates[:, 0] - min_location.x] = True
+
+    def _keys_of(self, bounded_board):
+        """ Yields keys of the cells set in given array over the world's
+        bounds """
+        y_indexes, x_indexes = numpy.nonzero(bounded_board)
+        min_x, min_y = self.min_location
+        for x_index, y_index in zip(x_indexes.tolist(), y_indexes.tolist()):
+            yield pack(min_x + x_index, min_y + y_index)
+
+    @property
+    def _bounded_board(self):
+        """ View of the board restricted to the world's bounds """
+        x_offset = self.min_location.x - self._origin.x
+        y_offset = self.min_location.y - self._origin.y
+        x_length, y_length = self.dimensions
+        return self._board[y_offset:y_offset + y_length,
+                           x_offset:x_offset + x_length]
+
+    def _board_region(self, min_location, max_location):
+        """ View of the board over given bounds, which it must contain """
+        min_y_index, min_x_index = self._board_index(min_location)
+        max_y_index, max_x_index = self._board_index(max_location)
+        return self._board[min_y_index:max_y_index + 1,
+                           min_x_index:max_x_index + 1]
+
+    def _board_contains(self, location):
+        y_length, x_length = self._board.shape
+        return (0 <= location.x - self._origin.x < x_length and
+                0 <= location.y - self._origin.y < y_length)
+
+    def _board_index(self, location):
+        return (location.y - self._origin.y, location.x - self._origin.x)
+
+    def _grow_board(self, old_min_location, old_bounded_board):
+        """ Replaces the board by one covering the world's bounds with as much
+        slack again on every side, copying over the previous bounded board.
+        """
+        x_length, y_length = self.dimensions
+        self._origin = Location(self.min_location.x - x_length // 2,
+                                self.min_location.y - y_length // 2)
+        self._board = numpy.zeros((y_length * 2, x_length * 2), dtype=bool)
+
+        old_y_length, old_x_length = old_bounded_board.shape
+        y_offset, x_offset = self._board_index(old_min_location)
+        self._board[y_offset:y_offset + old_y_length,
+                    x_offset:x_offset + old_x_length] = old_bounded_board
+
+
+def _count_neighbors(board):
+    """ Returns array of the same shape as board, with the number of living
+    neighbors of every location, treating everything beyond board as dead.
+    """
+    padded = numpy.pad(board.astype(numpy.uint8), 1)
+    y_length, x_length = board.shape
+    neighbor_counts = numpy.zeros(board.shape, dtype=numpy.uint8)
+
+    for y_offset in range(3):
+        for x_offset in range(3):
+            if (x_offset, y_offset) == (1, 1):
+                continue
+
+            neighbor_counts += padded[y_offset:y_offset + y_length,
+                                      x_offset:x_offset + x_length]
+
+    return neighbor_counts
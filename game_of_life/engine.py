@@ -0,0 +1,47 @@
+from .location import Location
+from .rule import CONWAY
+
+
+class Engine():
+    """ Base class of tick engines.
+
+    Engines work on packed location keys (see location.pack): subclasses
+    implement next_living_keys, and next_living_locations wraps it for sets
+    of Locations.
+    """
+
+    def next_living_keys(self, living_keys, min_location=None,
+                         max_location=None, stats=None, rule=CONWAY):
+        """ Returns set of keys of locations that are alive in the generation
+        following the one made up of given living keys.
+
+        args:
+            living_keys: set of keys of locations currently alive
+            min_location, max_location: optional bounds of the world; no cell
+                is born outside of them
+            stats: optional TickStats to record phase timings in
+            rule: Rule giving the next state of cells
+        """
+        raise NotImplementedError
+
+    def next_changes(self, living_keys, changed_keys, min_location=None,
+                     max_location=None, stats=None, rule=CONWAY):
+        """ Returns (births, deaths) sets of keys of the generation following
+        the one made up of given living keys, given the keys of the cells
+        that changed state since the generation before it. Only those cells
+        and their neighbors can change state.
+
+        Subclasses may override this to only evaluate those cells; by default
+        every cell is evaluated by next_living_keys.
+        """
+        next_living_keys = self.next_living_keys(
+            living_keys, min_location, max_location, stats=stats, rule=rule)
+        return next_living_keys - living_keys, living_keys - next_living_keys
+
+    def next_living_locations(self, living_locations, min_location=None,
+                              max_location=None, stats=None, rule=CONWAY):
+        """ Same as next_living_keys, for sets of Locations """
+        next_living_keys = self.next_living_keys(
+            {location.key for location in living_locations}, min_location,
+            max_location, stats=stats, rule=rule)
+        return {Location.from_key(key) for key in next_living_keys}
@@ -0,0 +1,211 @@
+""" Monte Carlo ensembles of random soups, run across a pool of worker
+processes to collect statistics on how soups settle.
+
+A soup is a square world with a given density of cells made living at
+random, which is ticked until one of its generations repeats (it settled
+into still lifes, oscillators or nothing) or until a maximum number of
+generations. Every soup is drawn from its own seed, itself drawn from the
+ensemble's master seed, so an ensemble reproduces the same results whatever
+the number of workers or the order results come back in.
+"""
+import csv
+from collections import Counter, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+import os
+from random import Random
+
+from .cycle_detection import DEFAULT_MAX_HISTORY
+from .location import Location
+from .rule import CONWAY
+from .sparse_engine import SparseEngine
+from .world import World
+
+DEFAULT_CHUNK_SIZE = 16
+# Chunks submitted ahead per worker, so that workers do not wait for the
+# parent to submit more, without queuing every soup at once
+CHUNKS_PER_WORKER = 2
+DEFAULT_BIN_WIDTH = 10
+SEED_BITS = 64
+
+Soup = namedtuple('Soup', ['index', 'seed', 'density'])
+# lifespan (the generation the soup settled at) and period are None for soups
+# that did not settle within the maximum number of generations
+SoupResult = namedtuple('SoupResult', ['index', 'seed', 'density', 'lifespan',
+                                       'final_population', 'period'])
+
+# Engine of the current worker process, reused by every soup it runs
+_worker_engine = None
+
+
+class Ensemble():
+    """ Ensemble of soups, runs_per_density of them at every given density.
+
+    args:
+        densities: fractions of cells made living in soups
+        runs_per_density: number of soups run at each density
+        size: width and height of soups, in cells
+        max_generations: generations a soup is ticked for at most
+        seed: master seed the seeds of soups are drawn from
+        workers: number of worker processes, defaults to the CPU count
+        chunk_size: number of soups sent to a worker at once
+        rule: Rule soups follow
+        engine_factory: callable returning the tick engine of a worker,
+            called once per worker process
+        max_history: number of generations remembered to detect repeats
+    """
+
+    def __init__(self, densities, runs_per_density, size, max_generations,
+                 seed=0, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 rule=CONWAY, engine_factory=SparseEngine,
+                 max_history=DEFAULT_MAX_HISTORY):
+        self.densities = list(densities)
+        self.runs_per_density = runs_per_density
+        self.size = size
+        self.max_generations = max_generations
+        self.seed = seed
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.rule = rule
+        self.engine_factory = engine_factory
+        self.max_history = max_history
+
+    def __len__(self):
+        return len(self.densities) * self.runs_per_density
+
+    def soups(self):
+        """ Yields every Soup of the ensemble, in index order """
+        rng = Random(self.seed)
+        index = 0
+        for density in self.densities:
+            for _ in range(self.runs_per_density):
+                yield Soup(index, rng.getrandbits(SEED_BITS), density)
+                index += 1
+
+    def results(self):
+        """ Yields the SoupResult of every soup as soon as its chunk is done,
+        so in no particular order; sort them by index to get the soups'.
+        Only a few chunks per worker are submitted ahead of the results
+        consumed.
+        """
+        workers = self.workers or os.cpu_count() or 1
+        soups = self.soups()
+        chunks = iter(lambda: list(islice(soups, self.chunk_size)), [])
+        executor = ProcessPoolExecutor(max_workers=workers,
+                                       initializer=_start_worker,
+                                       initargs=(self.engine_factory,))
+
+        try:
+            pending = {self._submit(executor, chunk)
+                       for chunk in islice(chunks,
+                                           workers * CHUNKS_PER_WORKER)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = next(chunks, None)
+                    if chunk is not None:
+                        pending.add(self._submit(executor, chunk))
+
+                    yield from future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(self, executor, chunk):
+        return executor.submit(_run_chunk, chunk, self.size,
+                               self.max_generations, self.rule,
+                               self.max_history)
+
+
+def run_soup(soup, size, max_generations, rule=CONWAY,
+             max_history=DEFAULT_MAX_HISTORY, engine=None):
+    """ Runs given Soup in a world of size by size cells, returning its
+    SoupResult """
+    world = World.random(min_location=Location(0, 0),
+                         max_location=Location(size - 1, size - 1),
+                         density=soup.density, rng=Random(soup.seed),
+                         engine=engine, rule=rule, active_region=True)
+    cycle = world.run(max_generations, max_history=max_history)
+
+    if cycle is None:
+        return SoupResult(soup.index, soup.seed, soup.density, None,
+                          world.living_cell_count, None)
+
+    return SoupResult(soup.index, soup.seed, soup.density,
+                      cycle.start_generation, world.living_cell_count,
+                      cycle.period)
+
+
+class EnsembleStatistics():
+    """ Histograms of soup results by density, built one result at a time so
+    that results need not be kept.
+
+    Lifespans and final populations are counted in bins of bin_width, and
+    periods exactly. Soups that did not settle only count towards final
+    populations and unsettled_counts.
+    """
+
+    def __init__(self, bin_width=DEFAULT_BIN_WIDTH):
+        self.bin_width = bin_width
+        self.run_count = 0
+        self.unsettled_counts = Counter()
+        self._histograms = {}
+
+    @property
+    def densities(self):
+        return sorted({density for _, density in self._histograms})
+
+    def add(self, result):
+        self.run_count += 1
+        self._count('final_population', result.density,
+                    self._bin(result.final_population))
+
+        if result.period is None:
+            self.unsettled_counts[result.density] += 1
+        else:
+            self._count('lifespan', result.density,
+                        self._bin(result.lifespan))
+            self._count('period', result.density, result.period)
+
+    def histogram(self, field, density):
+        """ Returns list of (value, count) pairs, by ascending value, of
+        given field ('lifespan', 'final_population' or 'period') over soups
+        of given density. Binned values are the lower bounds of their bins.
+        """
+        return sorted(self._histograms.get((field, density), {}).items())
+
+    def _count(self, field, density, value):
+        self._histograms.setdefault((field, density), Counter())[value] += 1
+
+    def _bin(self, value):
+        return value - value % self.bin_width
+
+
+def collect(results, csv_file=None, statistics=None):
+    """ Consumes given SoupResults, writing each as a row of csv_file when
+    given, and returns EnsembleStatistics of them.
+    """
+    if statistics is None:
+        statistics = EnsembleStatistics()
+
+    writer = None
+    if csv_file is not None:
+        writer = csv.writer(csv_file)
+        writer.writerow(SoupResult._fields)
+
+    for result in results:
+        statistics.add(result)
+        if writer is not None:
+            writer.writerow(result)
+
+    return statistics
+
+
+def _start_worker(engine_factory):
+    global _worker_engine
+    _worker_engine = engine_factory()
+
+
+def _run_chunk(soups, size, max_generations, rule, max_history):
+    return [run_soup(soup, size, max_generations, rule, max_history,
+                     engine=_worker_engine)
+            for soup in soups]
@@ -0,0 +1,188 @@
+""" Asyncio pipeline computing generations of a world ahead of rendering and
+displaying them.
+
+The pipeline has three stages, connected by bounded queues:
+
+    producer: ticks the world in an executor, snapshotting every generation
+        into an immutable Frame
+    renderer: renders frames in order, also in an executor
+    consumer: whoever iterates over FramePipeline.frames(), such as a
+        terminal display, a file or a socket
+
+When the consumer falls behind and the frame queue fills up, the producer
+either waits for room in it (BACKPRESSURE) or keeps ticking and drops the
+oldest frame not yet rendered (DROP_FRAMES). Frames are only dropped before
+being rendered, so stateful renderers (such as TerminalDisplay.draw, which
+draws frames over the previous one) see every frame they are asked to draw.
+"""
+import asyncio
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .world_renderer import WorldRenderer
+
+BACKPRESSURE = 'backpressure'
+DROP_FRAMES = 'drop_frames'
+OVERFLOW_POLICIES = (BACKPRESSURE, DROP_FRAMES)
+DEFAULT_QUEUE_SIZE = 4
+
+RenderedFrame = namedtuple('RenderedFrame', ['frame', 'rendering'])
+
+
+class Frame(namedtuple('Frame', ['generation', 'min_location',
+                                 'max_location', 'living_locations',
+                                 'tick_stats'])):
+    """ Immutable snapshot of a generation of a world, which renderers can
+    use in place of the world while it keeps ticking.
+    """
+
+    @classmethod
+    def of(cls, world):
+        return cls(world.generation, world.min_location, world.max_location,
+                   frozenset(world.living_locations), world.last_tick_stats)
+
+    def is_alive_at(self, location):
+        return location in self.living_locations
+
+
+def render_frame(frame):
+    return WorldRenderer(frame).render()
+
+
+class _Failure(namedtuple('_Failure', ['error'])):
+    """ Error raised by a stage, passed down the queues to the consumer """
+
+
+_END = object()
+
+
+class FramePipeline():
+    """ Pipeline ticking a world for a number of turns, yielding every
+    generation's rendering (starting with the current one) from frames().
+
+    args:
+        world: world to tick; it must not be used elsewhere while the
+            pipeline runs
+        turns: number of generations to compute
+        render: callable returning the rendering of a Frame
+        queue_size: number of frames that may be computed ahead of rendering
+        overflow: BACKPRESSURE to pause ticking while the frame queue is
+            full, or DROP_FRAMES to keep ticking and drop the oldest frame
+            not yet rendered
+        fps: optional target frames per second frames are yielded at
+        executor: executor ticks and renders run in, defaults to a thread
+            pool of its own
+
+    attributes:
+        dropped_frame_count: number of frames dropped so far
+    """
+
+    def __init__(self, world, turns, render=render_frame,
+                 queue_size=DEFAULT_QUEUE_SIZE, overflow=BACKPRESSURE,
+                 fps=None, executor=None):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError('Unknown overflow policy: {}'.format(overflow))
+
+        self.world = world
+        self.turns = turns
+        self.render = render
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.fps = fps
+        self.executor = executor
+        self.dropped_frame_count = 0
+
+    async def frames(self):
+        """ Asynchronously yields a RenderedFrame for every generation that
+        was not dropped, in order, raising any error of the producer or
+        renderer.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=2)
+
+        frame_queue = asyncio.Queue(self.queue_size)
+        rendered_queue = asyncio.Queue(1)
+        stages = [
+            asyncio.ensure_future(self._produce(loop, executor, frame_queue)),
+            asyncio.ensure_future(self._render(loop, executor, frame_queue,
+                                               rendered_queue)),
+        ]
+
+        try:
+            next_frame_time = None
+            while True:
+                item = await rendered_queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+
+                if self.fps:
+                    now = loop.time()
+                    if next_frame_time is not None and now < next_frame_time:
+                        await asyncio.sleep(next_frame_time - now)
+                        now = next_frame_time
+
+                    next_frame_time = now + 1 / self.fps
+
+                yield item
+        finally:
+            for stage in stages:
+                stage.cancel()
+
+            await asyncio.gather(*stages, return_exceptions=True)
+
+            if self.executor is None:
+                executor.shutdown(wait=True)
+
+    def run(self, consume):
+        """ Runs the pipeline to completion in a new event loop, calling
+        consume with every RenderedFrame.
+        """
+        async def consume_frames():
+            async for rendered_frame in self.frames():
+                consume(rendered_frame)
+
+        asyncio.run(consume_frames())
+
+    async def _produce(self, loop, executor, frame_queue):
+        try:
+            await self._put(frame_queue, Frame.of(self.world))
+            for _ in range(self.turns):
+                frame = await loop.run_in_executor(executor, _tick,
+                                                   self.world)
+                await self._put(frame_queue, frame)
+        except Exception as error:
+            await self._put(frame_queue, _Failure(error))
+        else:
+            await self._put(frame_queue, _END)
+
+    async def _render(self, loop, executor, frame_queue, rendered_queue):
+        while True:
+            frame = await frame_queue.get()
+            if frame is _END or isinstance(frame, _Failure):
+                await rendered_queue.put(frame)
+                return
+
+            try:
+                rendering = await loop.run_in_executor(executor, self.render,
+                                                       frame)
+            except Exception as error:
+                await rendered_queue.put(_Failure(error))
+                return
+
+            await rendered_queue.put(RenderedFrame(frame, rendering))
+
+    async def _put(self, frame_queue, item):
+        if self.overflow == DROP_FRAMES and frame_queue.full():
+            frame_queue.get_nowait()
+            self.dropped_frame_count += 1
+
+        await frame_queue.put(item)
+
+
+def _tick(world):
+    world.tick()
+    return Frame.of(world)
@@ -0,0 +1,355 @@
+from collections import namedtuple
+from collections.abc import Set
+from copy import copy
+
+from .cell import Cell
+from .location import Location, is_packable, unpack
+from .rule import CONWAY
+from .sparse_engine import SparseEngine
+from .spatial_index import chunk_key
+from .world import World, DEFAULT_MIN_LOCATION, DEFAULT_MAX_LOCATION
+
+CHUNK_SIZE_BITS = 4
+# Bits of each chunk coordinate a level of the chunk trie branches on
+TRIE_BITS = 2
+TRIE_MASK = (1 << TRIE_BITS) - 1
+TRIE_WIDTH = 1 << (2 * TRIE_BITS)
+
+
+class FrozenWorld():
+    """ Immutable world, whose tick returns the next generation as a new
+    FrozenWorld and leaves this one unchanged.
+
+    Living cells are held in square chunks, 2^CHUNK_SIZE_BITS cells a side,
+    each being a frozenset of the keys (see Location.key) of its living
+    cells. Chunks are the leaves of a persistent trie (see _ChunkMap): a new
+    generation only rebuilds the chunks in which a cell was born or died,
+    along with the trie nodes on their paths, and shares everything else
+    with the generation before it. Keeping many generations thus costs
+    memory proportional to the changes between them rather than to their
+    populations.
+
+    Ticks after the first only evaluate the cells that changed in the
+    previous tick and their neighbors, as World does with active_region.
+
+    Bounds, engine, shrink_bounds, bounds_margin and rule work as they do for
+    World, with with_living_at and with_dead_at in place of set_living_at
+    and set_dead_at.
+    """
+
+    def __init__(self, min_location=DEFAULT_MIN_LOCATION,
+                 max_location=DEFAULT_MAX_LOCATION, living_locations=(),
+                 engine=None, shrink_bounds=False, bounds_margin=0,
+                 rule=None):
+        self.engine = engine if engine is not None else SparseEngine()
+        self.shrink_bounds = shrink_bounds
+        self.bounds_margin = bounds_margin
+        self.rule = rule if rule is not None else CONWAY
+        self.generation = 0
+
+        world = World(min_location, max_location)
+        world.set_living_many(living_locations)
+        self.min_location = world.min_location
+        self.max_location = world.max_location
+
+        chunks = {}
+        for key in world._living_keys:
+            chunks.setdefault(_chunk_key(key), set()).add(key)
+
+        self._chunks = _ChunkMap().updated(
+            {chunk_key: frozenset(keys)
+             for chunk_key, keys in chunks.items()})
+        self._population = len(world._living_keys)
+        # Keys of cells changed by the tick that made this generation, or
+        # None when unknown, and the rule that tick followed
+        self._changed_keys = None
+        self._tick_rule = None
+
+    @classmethod
+    def from_world(cls, world):
+        frozen_world = cls(world.min_location, world.max_location,
+                           world.living_locations, engine=world.engine,
+                           shrink_bounds=world.shrink_bounds,
+                           bounds_margin=world.bounds_margin, rule=world.rule)
+        frozen_world.generation = world.generation
+        return frozen_world
+
+    def to_world(self):
+        world = World(self.min_location, self.max_location,
+                      engine=self.engine, shrink_bounds=self.shrink_bounds,
+                      bounds_margin=self.bounds_margin, rule=self.rule)
+        world.set_living_many(self.living_locations)
+        world.generation = self.generation
+        return world
+
+    def with_living_at(self, location):
+        """ Returns copy of this world where given location is alive """
+        if self.is_alive_at(location):
+            return self
+
+        min_x, min_y = (min(location.x, self.min_location.x),
+                        min(location.y, self.min_location.y))
+        max_x, max_y = (max(location.x, self.max_location.x),
+                        max(location.y, self.max_location.y))
+        world = self._changed({location.key}, set(), Location(min_x, min_y),
+                              Location(max_x, max_y), self.generation)
+        if ((world.min_location, world.max_location) !=
+                (self.min_location, self.max_location)):
+            # Cells next to the old bounds may now be born
+            world._changed_keys = None
+
+        return world
+
+    def with_dead_at(self, location):
+        """ Returns copy of this world where given location is dead """
+        if not self.is_alive_at(location):
+            return self
+
+        return self._changed(set(), {location.key}, self.min_location,
+                             self.max_location, self.generation)
+
+    def get_cell_at(self, location):
+        return Cell(alive=self.is_alive_at(location), rule=self.rule)
+
+    def is_alive_at(self, location):
+        if not is_packable(*location):
+            return False
+
+        key = location.key
+        return key in self._chunks.get(_chunk_key(key))
+
+    @property
+    def living_locations(self):
+        return [Location.from_key(key)
+                for _, chunk in self._chunks.items()
+                for key in chunk]
+
+    @property
+    def chunk_count(self):
+        return len(self._chunks)
+
+    def tick(self):
+        """ Returns the next generation, sharing unchanged chunks with this
+        one """
+        bounds = ()
+        if not self.shrink_bounds:
+            bounds = (self.min_location, self.max_location)
+
+        living_keys = _LivingKeys(self._chunks, self._population)
+        if self._changed_keys is not None and self._tick_rule is self.rule:
+            births, deaths = self.engine.next_changes(
+                living_keys, self._changed_keys, *bounds, rule=self.rule)
+        else:
+            living_keys = set(living_keys)
+            next_living_keys = self.engine.next_living_keys(
+                living_keys, *bounds, rule=self.rule)
+            births = next_living_keys - living_keys
+            deaths = living_keys - next_living_keys
+
+        next_world = self._changed(births, deaths, self.min_location,
+                                   self.max_location, self.generation + 1)
+        next_world._changed_keys = births | deaths
+        next_world._tick_rule = self.rule
+
+        if self.shrink_bounds and next_world._population:
+            next_world._shrink_bounds()
+
+        return next_world
+
+    @property
+    def is_empty(self):
+        return self.living_cell_count == 0
+
+    @property
+    def dead_cell_count(self):
+        x_length, y_length = self.dimensions
+        return (x_length * y_length) - self.living_cell_count
+
+    @property
+    def living_cell_count(self):
+        return self._population
+
+    @property
+    def dimensions(self):
+        x_length = self.max_location.x - self.min_location.x + 1
+        y_length = self.max_location.y - self.min_location.y + 1
+        return (x_length, y_length)
+
+    def _changed(self, births, deaths, min_location, max_location,
+                 generation):
+        """ Returns copy of this world with given keys born and died,
+        rebuilding only the chunks holding them.
+        """
+        changes = {}
+        for key in births:
+            changes.setdefault(_chunk_key(key), (set(), set()))[0].add(key)
+        for key in deaths:
+            changes.setdefault(_chunk_key(key), (set(), set()))[1].add(key)
+
+        world = copy(self)
+        world._chunks = self._chunks.updated(
+            {chunk_key: (self._chunks.get(chunk_key) - chunk_deaths |
+                         chunk_births)
+             for chunk_key, (chunk_births, chunk_deaths) in changes.items()})
+        world._population = self._population + len(births) - len(deaths)
+        world.min_location = min_location
+        world.max_location = max_location
+        world.generation = generation
+        if self._changed_keys is not None:
+            world._changed_keys = self._changed_keys | births | deaths
+
+        return world
+
+    def _shrink_bounds(self):
+        x_coordinates, y_coordinates = zip(*(unpack(key)
+                                             for _, chunk
+                                             in self._chunks.items()
+                                             for key in chunk))
+        self.min_location = Location(min(x_coordinates) - self.bounds_margin,
+                                     min(y_coordinates) - self.bounds_margin)
+        self.max_location = Location(max(x_coordinates) + self.bounds_margin,
+                                     max(y_coordinates) + self.bounds_margin)
+
+
+_Leaf = namedtuple('_Leaf', ['chunk_key', 'path_x', 'path_y', 'keys'])
+
+
+class _ChunkMap():
+    """ Persistent map of chunk keys to frozensets of keys, as a trie whose
+    levels each branch 16 ways on the next 2 bits of both chunk coordinates
+    (zigzag encoded, so that negative ones work too).
+
+    Nodes are tuples of TRIE_WIDTH children, each None, a node or a _Leaf; a
+    leaf sits at the first level its path differs from every other leaf's.
+    updated copies the nodes on the paths of the chunks it changes and
+    shares every other node and leaf with the map it was called on.
+    """
+
+    def __init__(self, root=None, length=0):
+        self._root = root
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def get(self, chunk_key, default=frozenset()):
+        path_x, path_y = _trie_path(chunk_key)
+        node, shift = self._root, 0
+        while node is not None:
+            if isinstance(node, _Leaf):
+                return node.keys if node.chunk_key == chunk_key else default
+
+            node = node[_trie_index(path_x, path_y, shift)]
+            shift += TRIE_BITS
+
+        return default
+
+    def items(self):
+        """ Yields (chunk key, keys) of every chunk, in no particular order
+        """
+        nodes = [self._root] if self._root is not None else []
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, _Leaf):
+                yield node.chunk_key, node.keys
+            else:
+                nodes.extend(child for child in node if child is not None)
+
+    def updated(self, chunks):
+        """ Returns copy of this map with given chunk keys mapped to given
+        keys, removing chunks whose keys are empty """
+        root, length = self._root, self._length
+        for chunk_key, keys in chunks.items():
+            path_x, path_y = _trie_path(chunk_key)
+            leaf = _Leaf(chunk_key, path_x, path_y, keys) if keys else None
+            root, length_change = _assoc(root, 0, chunk_key, path_x, path_y,
+                                         leaf)
+            length += length_change
+
+        return _ChunkMap(root, length)
+
+
+class _LivingKeys(Set):
+    """ Read only set of the living keys of a _ChunkMap, for engines """
+
+    def __init__(self, chunks, population):
+        self._chunks = chunks
+        self._population = population
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+    def __contains__(self, key):
+        return key in self._chunks.get(_chunk_key(key))
+
+    def __iter__(self):
+        for _, chunk in self._chunks.items():
+            yield from chunk
+
+    def __len__(self):
+        return self._population
+
+
+def _chunk_key(key):
+    return chunk_key(key, CHUNK_SIZE_BITS)
+
+
+def _trie_path(chunk_key):
+    """ Returns zigzag encoded coordinates of given chunk, whose bits give
+    its path down the trie """
+    return tuple(coordinate * 2 if coordinate >= 0 else -coordinate * 2 - 1
+                 for coordinate in unpack(chunk_key))
+
+
+def _trie_index(path_x, path_y, shift):
+    return (path_x >> shift & TRIE_MASK) | (path_y >> shift & TRIE_MASK) << \
+        TRIE_BITS
+
+
+def _assoc(node, shift, chunk_key, path_x, path_y, leaf):
+    """ Returns copy of the trie node at given shift with given chunk set to
+    given leaf, or removed if it is None, and the change in chunk count.
+    """
+    if node is None:
+        return leaf, 0 if leaf is None else 1
+
+    if isinstance(node, _Leaf):
+        if node.chunk_key == chunk_key:
+            return leaf, -1 if leaf is None else 0
+        if leaf is None:
+            return node, 0
+
+        return _branch(node, leaf, shift), 1
+
+    index = _trie_index(path_x, path_y, shift)
+    child, length_change = _assoc(node[index], shift + TRIE_BITS, chunk_key,
+                                  path_x, path_y, leaf)
+    if child is node[index]:
+        return node, length_change
+
+    children = list(node)
+    children[index] = child
+    remaining = [child for child in children if child is not None]
+    if not remaining:
+        return None, length_change
+    if len(remaining) == 1 and isinstance(remaining[0], _Leaf):
+        # A lone leaf moves up to where its path stops being shared
+        return remaining[0], length_change
+
+    return tuple(children), length_change
+
+
+def _branch(leaf, other_leaf, shift):
+    """ Returns node at given shift holding two leaves of different chunks,
+    branching further down for as long as their paths are shared """
+    children = [None] * TRIE_WIDTH
+    index = _trie_index(leaf.path_x, leaf.path_y, shift)
+    other_index = _trie_index(other_leaf.path_x, other_leaf.path_y, shift)
+    if index == other_index:
+        children[index] = _branch(leaf, other_leaf, shift + TRIE_BITS)
+    else:
+        children[index] = leaf
+        children[other_index] = other_leaf
+
+    return tuple(children)
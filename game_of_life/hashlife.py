@@ -0,0 +1,311 @@
+from .location import Location
+from .rule import CONWAY, NEIGHBOR_COUNTS
+from .world import World
+
+DEFAULT_MAX_NODES = 2 ** 20
+
+
+class _Node():
+    """ Canonical quadtree node covering a 2^level by 2^level square. Level 0
+    nodes are single cells; other levels have four child quadrants, with y
+    increasing northwards.
+    """
+    __slots__ = ('nw', 'ne', 'sw', 'se', 'level', 'population')
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+_DEAD = _Node(None, None, None, None, 0, 0)
+_ALIVE = _Node(None, None, None, None, 0, 1)
+
+
+class HashLifeWorld():
+    """ Life universe stored as a canonicalised quadtree of memoised macro
+    cells, able to advance regular patterns by huge numbers of generations in
+    time roughly logarithmic in the number of generations.
+
+    Unlike World, a HashLifeWorld is unbounded: cells may be born anywhere,
+    not just within the bounds of the world it was built from.
+
+    args:
+        max_nodes: number of canonical nodes after which nodes unreachable
+            from the current pattern, and all memoised results, are dropped
+        rule: Rule cells follow, defaults to Conway's B3/S23; memoised
+            results only hold for the rule they were computed with
+    """
+
+    def __init__(self, max_nodes=DEFAULT_MAX_NODES, rule=CONWAY):
+        self.max_nodes = max_nodes
+        self.rule = rule
+        self.generation = 0
+        self._nodes = {}
+        self._results = {}
+        self._empty_nodes = [_DEAD]
+        self._root = self._empty(3)
+        self._root_min_location = Location(-4, -4)
+        self._bounds = (Location(0, 0), Location(0, 0))
+
+    @classmethod
+    def from_world(cls, world, *args, **kwargs):
+        """ Returns HashLifeWorld holding the living cells of given world,
+        following its rule unless one is given.
+        """
+        kwargs.setdefault('rule', world.rule)
+        hashlife_world = cls(*args, **kwargs)
+        hashlife_world._bounds = (world.min_location, world.max_location)
+
+        x_length, y_length = world.dimensions
+        level = max(x_length, y_length, 8).bit_length()
+        coordinates = {(location.x - world.min_location.x,
+                        location.y - world.min_location.y)
+                       for location in world.living_locations}
+
+        hashlife_world._root = hashlife_world._build(level, 0, 0, coordinates)
+        hashlife_world._root_min_location = world.min_location
+
+        return hashlife_world
+
+    def to_world(self):
+        """ Returns a World holding the current generation. Its bounds are
+        those of the world this was built from, expanded to fit every living
+        cell.
+        """
+        min_location, max_location = self._bounds
+        world = World(min_location, max_location, rule=self.rule)
+        world.set_living_many(self.living_locations)
+
+        return world
+
+    @property
+    def population(self):
+        return self._root.population
+
+    @property
+    def living_locations(self):
+        locations = []
+        self._collect_locations(self._root, self._root_min_location.x,
+                                self._root_min_location.y, locations)
+        return locations
+
+    @property
+    def node_count(self):
+        return len(self._nodes)
+
+    def advance(self, generations):
+        """ Advances the world by given number of generations, stepping by
+        each power of two making up that number. Worlds cannot go back, so
+        generations must not be negative.
+        """
+        if generations < 0:
+            raise ValueError('Cannot advance by {} generations'.format(
+                generations))
+
+        step_exponent = 0
+        while generations:
+            if generations & 1:
+                self._step(step_exponent)
+
+            generations >>= 1
+            step_exponent += 1
+
+        return self
+
+    def _step(self, step_exponent):
+        """ Advances the world by 2^step_exponent generations """
+        while (self._root.level < step_exponent + 2 or
+               self._inner(self._root).population != self._root.population):
+            self._pad()
+
+        self._pad()
+        self._root = self._successor(self._root, step_exponent)
+        half = 2 ** (self._root.level - 1)
+        self._root_min_location = Location(self._root_min_location.x + half,
+                                           self._root_min_location.y + half)
+        self.generation += 2 ** step_exponent
+
+        if len(self._nodes) > self.max_nodes:
+            self._collect_garbage()
+
+    def _pad(self):
+        """ Doubles the root's size, keeping its content centered """
+        half = 2 ** (self._root.level - 1)
+        self._root = self._centre(self._root)
+        self._root_min_location = Location(self._root_min_location.x - half,
+                                           self._root_min_location.y - half)
+
+    def _collect_garbage(self):
+        """ Drops memoised results and every node not part of the root """
+        self._results = {}
+        self._nodes = {}
+        self._empty_nodes = [_DEAD]
+        self._root = self._recanonicalise(self._root, {})
+
+    def _recanonicalise(self, node, visited):
+        if node.level == 0:
+            return node
+
+        if node not in visited:
+            visited[node] = self._join(
+                self._recanonicalise(node.nw, visited),
+                self._recanonicalise(node.ne, visited),
+                self._recanonicalise(node.sw, visited),
+                self._recanonicalise(node.se, visited))
+
+        return visited[node]
+
+    def _join(self, nw, ne, sw, se):
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+
+        if node is None:
+            population = (nw.population + ne.population + sw.population +
+                          se.population)
+            node = _Node(nw, ne, sw, se, nw.level + 1, population)
+            self._nodes[key] = node
+
+        return node
+
+    def _empty(self, level):
+        while len(self._empty_nodes) <= level:
+            empty = self._empty_nodes[-1]
+            self._empty_nodes.append(self._join(empty, empty, empty, empty))
+
+        return self._empty_nodes[level]
+
+    def _centre(self, node):
+        """ Returns node one level up with given node at its center """
+        empty = self._empty(node.level - 1)
+        return self._join(self._join(empty, empty, empty, node.nw),
+                          self._join(empty, empty, node.ne, empty),
+                          self._join(empty, node.sw, empty, empty),
+                          self._join(node.se, empty, empty, empty))
+
+    def _inner(self, node):
+        """ Returns the centered node one level down from given node """
+        return self._join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def _successor(self, node, step_exponent):
+        """ Returns the centered node one level down from given node, advanced
+        by 2^step_exponent generations, where step_exponent is at most
+        node.level - 2.
+        """
+        key = (node, step_exponent)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.population == 0:
+            result = self._empty(node.level - 1)
+        elif node.level == 2:
+            result = self._successor_of_4x4(node)
+        else:
+            result = self._successor_of_quadrants(node, step_exponent)
+
+        self._results[key] = result
+        return result
+
+    def _successor_of_quadrants(self, node, step_exponent):
+        step_exponent = min(step_exponent, node.level - 2)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+        overlapping = [
+            [nw,
+             self._join(nw.ne, ne.nw, nw.se, ne.sw),
+             ne],
+            [self._join(nw.sw, nw.se, sw.nw, sw.ne),
+             self._join(nw.se, ne.sw, sw.ne, se.nw),
+             self._join(ne.sw, ne.se, se.nw, se.ne)],
+            [sw,
+             self._join(sw.ne, se.nw, sw.se, se.sw),
+             se]]
+        c = [[self._successor(subnode, step_exponent) for subnode in row]
+             for row in overlapping]
+
+        if step_exponent < node.level - 2:
+            quadrants = [
+                self._join(c[0][0].se, c[0][1].sw, c[1][0].ne, c[1][1].nw),
+                self._join(c[0][1].se, c[0][2].sw, c[1][1].ne, c[1][2].nw),
+                self._join(c[1][0].se, c[1][1].sw, c[2][0].ne, c[2][1].nw),
+                self._join(c[1][1].se, c[1][2].sw, c[2][1].ne, c[2][2].nw)]
+        else:
+            quadrants = [
+                self._successor(self._join(c[0][0], c[0][1], c[1][0],
+                                           c[1][1]), step_exponent),
+                self._successor(self._join(c[0][1], c[0][2], c[1][1],
+                                           c[1][2]), step_exponent),
+                self._successor(self._join(c[1][0], c[1][1], c[2][0],
+                                           c[2][1]), step_exponent),
+                self._successor(self._join(c[1][1], c[1][2], c[2][1],
+                                           c[2][2]), step_exponent)]
+
+        return self._join(*quadrants)
+
+    def _successor_of_4x4(self, node):
+        """ Returns the center 2x2 node of a 4x4 node after one generation """
+        cells = [[0] * 4 for _ in range(4)]
+        for quadrant, x_offset, y_offset in ((node.sw, 0, 0),
+                                             (node.se, 2, 0),
+                                             (node.nw, 0, 2),
+                                             (node.ne, 2, 2)):
+            cells[y_offset][x_offset] = quadrant.sw.population
+            cells[y_offset][x_offset + 1] = quadrant.se.population
+            cells[y_offset + 1][x_offset] = quadrant.nw.population
+            cells[y_offset + 1][x_offset + 1] = quadrant.ne.population
+
+        table = self.rule.table
+
+        def next_cell(x, y):
+            neighbor_count = sum(cells[y + y_offset][x + x_offset]
+                                 for y_offset in (-1, 0, 1)
+                                 for x_offset in (-1, 0, 1)) - cells[y][x]
+            return _ALIVE if table[cells[y][x] * NEIGHBOR_COUNTS +
+                                   neighbor_count] else _DEAD
+
+        return self._join(next_cell(1, 2), next_cell(2, 2),
+                          next_cell(1, 1), next_cell(2, 1))
+
+    def _build(self, level, x, y, coordinates):
+        """ Returns node of given level whose south west corner is at (x, y),
+        holding the given coordinates that fall within it.
+        """
+        if not coordinates:
+            return self._empty(level)
+
+        if level == 0:
+            return _ALIVE
+
+        half = 2 ** (level - 1)
+        quadrants = {'nw': set(), 'ne': set(), 'sw': set(), 'se': set()}
+        for coordinate_x, coordinate_y in coordinates:
+            north = coordinate_y >= y + half
+            east = coordinate_x >= x + half
+            quadrant = ('n' if north else 's') + ('e' if east else 'w')
+            quadrants[quadrant].add((coordinate_x, coordinate_y))
+
+        return self._join(self._build(level - 1, x, y + half,
+                                      quadrants['nw']),
+                          self._build(level - 1, x + half, y + half,
+                                      quadrants['ne']),
+                          self._build(level - 1, x, y, quadrants['sw']),
+                          self._build(level - 1, x + half, y,
+                                      quadrants['se']))
+
+    def _collect_locations(self, node, x, y, locations):
+        if node.population == 0:
+            return
+
+        if node.level == 0:
+            locations.append(Location(x, y))
+            return
+
+        half = 2 ** (node.level - 1)
+        self._collect_locations(node.nw, x, y + half, locations)
+        self._collect_locations(node.ne, x + half, y + half, locations)
+        self._collect_locations(node.sw, x, y, locations)
+        self._collect_locations(node.se, x + half, y, locations)
@@ -0,0 +1,134 @@
+from array import array
+from bisect import bisect_right
+from collections import deque, namedtuple
+import sys
+
+DEFAULT_KEYFRAME_INTERVAL = 32
+DEFAULT_MAX_BYTES = 64 * 2 ** 20
+# Rough size of an entry besides its arrays of keys
+ENTRY_OVERHEAD_BYTES = 128
+
+_Keyframe = namedtuple('_Keyframe', ['generation', 'min_location',
+                                     'max_location', 'living_keys', 'size'])
+_Delta = namedtuple('_Delta', ['generation', 'min_location', 'max_location',
+                               'births', 'deaths', 'size'])
+
+
+class History():
+    """ Record of successive generations of a world, which can be sought back
+    to without simulating them again.
+
+    Every keyframe_interval generations, the full set of living cells is
+    stored as a keyframe; the generations in between only store the keys
+    (see Location.key) of the cells born and died since the generation
+    before them. Seeking replays deltas from the nearest keyframe at or
+    before the generation sought.
+
+    Generations are kept in spans, each being a keyframe and its deltas.
+    When the recorded generations take more than max_bytes, the oldest spans
+    are dropped; the latest span is always kept.
+
+    Recording a generation older than or equal to the latest one (after
+    seeking back, for example) drops the generations after it, since the
+    world is taking a different path from there.
+    """
+
+    def __init__(self, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL,
+                 max_bytes=DEFAULT_MAX_BYTES):
+        self.keyframe_interval = keyframe_interval
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._spans = deque()
+        self._needs_keyframe = True
+
+    @property
+    def first_generation(self):
+        return self._spans[0][0].generation if self._spans else None
+
+    @property
+    def last_generation(self):
+        return self._spans[-1][-1].generation if self._spans else None
+
+    def __contains__(self, generation):
+        return (bool(self._spans) and
+                self.first_generation <= generation <= self.last_generation)
+
+    def __len__(self):
+        return sum(len(span) for span in self._spans)
+
+    def mark_edited(self):
+        """ Makes the next generation recorded a keyframe, since cells were
+        changed outside of ticks and deltas would miss those changes.
+        """
+        self._needs_keyframe = True
+
+    def record(self, generation, living_keys, births, deaths, min_location,
+               max_location):
+        """ Records given generation, following the last one recorded, as a
+        delta of its births and deaths, or as a keyframe of its living keys
+        when one is due.
+        """
+        self._truncate(generation)
+
+        if (self._needs_keyframe or not self._spans or
+                generation != self.last_generation + 1 or
+                len(self._spans[-1]) >= self.keyframe_interval):
+            self.record_keyframe(generation, living_keys, min_location,
+                                 max_location)
+            return
+
+        births, deaths = array('q', births), array('q', deaths)
+        size = (sys.getsizeof(births) + sys.getsizeof(deaths) +
+                ENTRY_OVERHEAD_BYTES)
+        self._add(_Delta(generation, min_location, max_location, births,
+                         deaths, size), new_span=False)
+
+    def record_keyframe(self, generation, living_keys, min_location,
+                        max_location):
+        self._truncate(generation)
+
+        living_keys = array('q', living_keys)
+        size = sys.getsizeof(living_keys) + ENTRY_OVERHEAD_BYTES
+        self._add(_Keyframe(generation, min_location, max_location,
+                            living_keys, size), new_span=True)
+        self._needs_keyframe = False
+
+    def state_at(self, generation):
+        """ Returns (living keys, min_location, max_location) of given
+        recorded generation, replaying deltas from the keyframe before it.
+        """
+        if generation not in self:
+            raise KeyError('Generation {} is not recorded'.format(generation))
+
+        span_index = bisect_right([span[0].generation for span in self._spans],
+                                  generation) - 1
+        span = self._spans[span_index]
+        keyframe = span[0]
+
+        living_keys = set(keyframe.living_keys)
+        entry = keyframe
+        for entry in span[1:generation - keyframe.generation + 1]:
+            living_keys.difference_update(entry.deaths)
+            living_keys.update(entry.births)
+
+        return living_keys, entry.min_location, entry.max_location
+
+    def _add(self, entry, new_span):
+        if new_span:
+            self._spans.append([entry])
+        else:
+            self._spans[-1].append(entry)
+
+        self.size += entry.size
+        while self.size > self.max_bytes and len(self._spans) > 1:
+            self.size -= sum(entry.size for entry in self._spans.popleft())
+
+    def _truncate(self, generation):
+        """ Drops recorded generations from given one onwards """
+        while self._spans and self.last_generation >= generation:
+            span = self._spans[-1]
+            if span[0].generation >= generation:
+                self._spans.pop()
+                self.size -= sum(entry.size for entry in span)
+            else:
+                self.size -= span.pop().size
@@ -1,28 +1,74 @@
 from collections import OrderedDict, defaultdict, namedtuple
 
+# Locations can be packed into a single int "key", x + y * 2^32, for x in
+# [-2^31, 2^31). Adding the key of an (x, y) offset to a key gives the key of
+# the offset location, so neighbor keys only take integer additions.
+KEY_COORDINATE_BITS = 32
+KEY_X_BIAS = 1 << (KEY_COORDINATE_BITS - 1)
+KEY_X_MASK = (1 << KEY_COORDINATE_BITS) - 1
+KEY_MIN_X = -KEY_X_BIAS
+KEY_MAX_X = KEY_X_BIAS - 1
+
+
+def pack(x, y):
+    """ Returns key of given coordinates, raising OverflowError when x is
+    outside of [-2^31, 2^31) since its key would be that of another location
+    """
+    if not KEY_MIN_X <= x <= KEY_MAX_X:
+        raise OverflowError('x coordinate {} is outside of the range of '
+                            'location keys'.format(x))
+
+    return x + (y << KEY_COORDINATE_BITS)
+
+
+def is_packable(x, y):
+    """ Returns whether given coordinates have a key (see pack) """
+    return KEY_MIN_X <= x <= KEY_MAX_X
+
+
+def unpack(key):
+    """ Returns (x, y) coordinates of given key """
+    biased_key = key + KEY_X_BIAS
+    return ((biased_key & KEY_X_MASK) - KEY_X_BIAS,
+            biased_key >> KEY_COORDINATE_BITS)
+
+
+def is_key_within(key, min_location, max_location):
+    """ Returns whether the location of given key is within given bounds,
+    inclusive """
+    x, y = unpack(key)
+    return (min_location.x <= x <= max_location.x and
+            min_location.y <= y <= max_location.y)
+
+
+NEIGHBOR_COORDINATE_OFFSETS = tuple((x_offset, y_offset)
+                                    for x_offset in range(-1, 2)
+                                    for y_offset in range(-1, 2)
+                                    if (x_offset, y_offset) != (0, 0))
+NEIGHBOR_OFFSETS = tuple(pack(x_offset, y_offset)
+                         for x_offset, y_offset in NEIGHBOR_COORDINATE_OFFSETS)
+# Offsets of a location's neighbors and of the location itself
+NEIGHBORHOOD_OFFSETS = (0,) + NEIGHBOR_OFFSETS
+
 
 class Location(namedtuple('Location', ['x', 'y'])):
+    @classmethod
+    def from_key(cls, key):
+        return cls(*unpack(key))
+
+    @property
+    def key(self):
+        return pack(self.x, self.y)
+
     @property
     def coordinates(self):
         return (self.x, self.y)
 
     @property
     def neighbors(self):
-        return [Location(x, y) for x, y in self._neighbor_coordinates()]
-
-    def _neighbor_coordinates(self):
-        neighbors_coordinates = []
-
-        for x_offset in range(-1, 2):
-            for y_offset in range(-1, 2):
-                coordinates = (x_offset + self.x, y_offset + self.y)
-
-                if coordinates == self.coordinates:
-                    continue
-
-                neighbors_coordinates.append(coordinates)
-
-        return neighbors_coordinates
+        x, y = self
+        return [Location(x + x_offset, y + y_offset)
+                for x_offset, y_offset in NEIGHBOR_COORDINATE_OFFSETS]
 
 
 def get_min_coordinates_location(locations):
@@ -43,7 +89,10 @@ def get_max_coordinates_location(locations):
 
 class LocationGrid:
     def __init__(self, lower_bound_location, upper_bound_location):
-        """
+        """ Lazy view of every location within given bounds, iterated in
+        render order: by descending y coordinate, then ascending x
+        coordinate. Locations are only made as they are iterated over.
+
         args:
             lower_bound_location: a location with coordinates representing
                 minimum x and y coordinates to be represented in location grid
@@ -53,51 +102,63 @@ class LocationGrid:
         self.lower_bound_location = lower_bound_location
         self.upper_bound_location = upper_bound_location
 
+    def __len__(self):
+        return len(self._x_range) * len(self._y_range)
+
+    def __contains__(self, location):
+        return (self.lower_bound_location.x <= location.x <=
+                self.upper_bound_location.x and
+                self.lower_bound_location.y <= location.y <=
+                self.upper_bound_location.y)
+
+    def __iter__(self):
+        x_range = self._x_range
+        for y in reversed(self._y_range):
+            for x in x_range:
+                yield Location(x, y)
+
     @property
     def rows(self):
-        """ Returns dict with keys corresponding to x coordinates (ascending), and
-        values that are lists of locations that fall in that x coordinate, in
-        descending y coordinate value.
+        """ Returns dict with keys corresponding to y coordinates
+        (descending), and values that are lists of locations that fall in
+        that y coordinate, in ascending x coordinate value.
         """
-        rows = sort_locations(self.locations)
+        return OrderedDict(self.iter_rows())
 
-        return rows
+    def iter_rows(self):
+        """ Yields (y coordinate, list of locations of that row by ascending x
+        coordinate) tuples, by descending y coordinate """
+        x_range = self._x_range
+        for y in reversed(self._y_range):
+            yield y, [Location(x, y) for x in x_range]
 
     @property
     def locations(self):
-        """ Returns list with locations that all fall within in grids
-        given lower and upper bounds.
+        """ Returns generator of locations that all fall within in grids
+        given lower and upper bounds, in render order.
         """
-        x_range = range(self.lower_bound_location.x,
-                        self.upper_bound_location.x + 1)
-        y_range = range(self.lower_bound_location.y,
-                        self.upper_bound_location.y + 1)
+        return iter(self)
 
-        locations = []
-        for x in x_range:
-            for y in y_range:
-                locations.append(Location(x, y))
+    @property
+    def _x_range(self):
+        return range(self.lower_bound_location.x,
+                     self.upper_bound_location.x + 1)
 
-        return locations
+    @property
+    def _y_range(self):
+        return range(self.lower_bound_location.y,
+                     self.upper_bound_location.y + 1)
 
 
 def sort_locations(locations):
-    """ Returns dict with keys representing x-coordinate int, and value being
-    a list of Locations containing that x-coordinate, sorted by y-coordinate
-    in descending order """
+    """ Returns dict with keys representing y-coordinate int, by descending
+    value, and value being a list of Locations containing that y-coordinate,
+    sorted by x-coordinate in ascending order """
 
     rows = OrderedDict()
 
-    y_sorted_locations = sorted(locations, key=lambda location: location.y,
-                                reverse=True)
-
-    for location in y_sorted_locations:
-        try:
-            rows[location.y]
-        except KeyError:
-            rows[location.y] = []
-
-        rows[location.y].append(location)
-        rows[location.y].sort(key=lambda location: location.x)
+    for location in sorted(locations,
+                           key=lambda location: (-location.y, location.x)):
+        rows.setdefault(location.y, []).append(location)
 
     return rows
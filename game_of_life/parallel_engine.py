@@ -0,0 +1,258 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import weakref
+
+from .engine import Engine
+from .location import pack, unpack
+from .rule import CONWAY, NEIGHBOR_COUNTS
+
+DEFAULT_TILE_SIZE = 256
+
+# Shared memory blocks attached to by the current worker process, by name
+_attached_boards = {}
+
+
+class ParallelEngine(Engine):
+    """ Tick engine splitting the world into square tiles that are advanced
+    in parallel by a pool of worker processes.
+
+    Tiles are aligned on multiples of tile_size. Every generation, the tiles
+    holding living cells are written one after the other, as one byte per
+    cell, to a shared memory board, so that its size follows the number of
+    occupied tiles rather than the area between distant patterns. Each
+    occupied tile and each of its neighbors is then submitted to a worker,
+    which reads it, along with the one cell halo surrounding it, from that
+    board and only sends back the tile's next living cells, so boards are
+    never pickled.
+
+    The worker pool and board are released by close, or once the engine is
+    garbage collected.
+
+    args:
+        tile_size: width and height of tiles, in cells
+        workers: number of worker processes, defaults to the CPU count
+    """
+
+    def __init__(self, tile_size=DEFAULT_TILE_SIZE, workers=None):
+        self.tile_size = tile_size
+        self.workers = workers
+        self._resources = _Resources()
+        weakref.finalize(self, _release, self._resources)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        _release(self._resources)
+
+    def next_living_keys(self, living_keys, min_location=None,
+                         max_location=None, stats=None, rule=CONWAY):
+        """ Board writing and tile evaluation are timed in given TickStats,
+        if any. See Engine.next_living_keys.
+        """
+        if not living_keys:
+            return set()
+
+        living_coordinates = [unpack(key) for key in living_keys]
+
+        if stats is None:
+            tiles = self._prepare_board(living_coordinates, min_location,
+                                        max_location)
+            return self._evaluate_tiles(tiles, rule)
+
+        with stats.phase('board_write'):
+            tiles = self._prepare_board(living_coordinates, min_location,
+                                        max_location)
+
+        with stats.phase('tile_evaluation'):
+            next_living_keys = self._evaluate_tiles(tiles, rule)
+
+        stats.locations_evaluated = sum(
+            (x_stop - x_start) * (y_stop - y_start)
+            for _, _, x_start, y_start, x_stop, y_stop in tiles)
+        return next_living_keys
+
+    def _prepare_board(self, living_coordinates, min_location, max_location):
+        """ Writes living (x, y) coordinates to the shared board, returning
+        the tiles to evaluate (see _tiles).
+        """
+        tile_size = self.tile_size
+        cells_by_tile = {}
+        for x, y in living_coordinates:
+            cells_by_tile.setdefault(
+                (x // tile_size, y // tile_size), []).append(
+                    (x % tile_size, y % tile_size))
+
+        # Occupied tiles are written to the board in this order
+        slots = {tile: slot for slot, tile in enumerate(cells_by_tile)}
+        self._write_board(cells_by_tile, slots)
+        return self._tiles(slots, min_location, max_location)
+
+    def _evaluate_tiles(self, tiles, rule):
+        executor = self._get_executor()
+        board_name = self._resources.board.name
+        tile_futures = [
+            (tile, executor.submit(_tick_tile, board_name, rule.table,
+                                   self.tile_size, *tile[1:]))
+            for tile in tiles]
+
+        next_living_keys = set()
+        for ((tile_x, tile_y), *_), future in tile_futures:
+            origin_x = tile_x * self.tile_size
+            origin_y = tile_y * self.tile_size
+            for index in future.result():
+                y_index, x_index = divmod(index, self.tile_size)
+                next_living_keys.add(pack(origin_x + x_index,
+                                          origin_y + y_index))
+
+        return next_living_keys
+
+    def _get_executor(self):
+        if self._resources.executor is None:
+            self._resources.executor = ProcessPoolExecutor(
+                max_workers=self.workers)
+
+        return self._resources.executor
+
+    def _write_board(self, cells_by_tile, slots):
+        """ Writes given (x, y) coordinates within their tiles to the board,
+        every tile taking tile_size^2 bytes at its slot """
+        area = self.tile_size * self.tile_size
+        size = len(slots) * area
+        board = self._resources.board
+        if board is None or board.size < size:
+            if board is not None:
+                board.close()
+                board.unlink()
+
+            board = shared_memory.SharedMemory(create=True, size=size)
+            self._resources.board = board
+
+        buffer = board.buf
+        buffer[:size] = bytes(size)
+        for tile, cells in cells_by_tile.items():
+            tile_start = slots[tile] * area
+            for x, y in cells:
+                buffer[tile_start + y * self.tile_size + x] = 1
+
+    def _tiles(self, slots, min_location, max_location):
+        """ Returns list of (tile, neighbor_slots, x_start, y_start, x_stop,
+        y_stop) tuples for every tile holding a living cell or bordering one
+        that does, where neighbor_slots are the board slots of the tile and
+        its 8 neighbors (see _tick_tile) and the others are the ranges of
+        cell indexes within the tile that are inside of given bounds, if any.
+        """
+        tiles = {(tile_x + x_offset, tile_y + y_offset)
+                 for tile_x, tile_y in slots
+                 for x_offset in (-1, 0, 1)
+                 for y_offset in (-1, 0, 1)}
+
+        tile_size = self.tile_size
+        evaluated_tiles = []
+        for tile_x, tile_y in sorted(tiles):
+            x_start, y_start, x_stop, y_stop = 0, 0, tile_size, tile_size
+            if min_location is not None and max_location is not None:
+                origin_x, origin_y = tile_x * tile_size, tile_y * tile_size
+                x_start = max(x_start, min_location.x - origin_x)
+                y_start = max(y_start, min_location.y - origin_y)
+                x_stop = min(x_stop, max_location.x - origin_x + 1)
+                y_stop = min(y_stop, max_location.y - origin_y + 1)
+                if x_start >= x_stop or y_start >= y_stop:
+                    continue
+
+            neighbor_slots = tuple(
+                slots.get((tile_x + x_offset, tile_y + y_offset))
+                for y_offset in (-1, 0, 1)
+                for x_offset in (-1, 0, 1))
+            evaluated_tiles.append(((tile_x, tile_y), neighbor_slots,
+                                    x_start, y_start, x_stop, y_stop))
+
+        return evaluated_tiles
+
+
+class _Resources():
+    """ Worker pool and shared memory board of a ParallelEngine, kept apart
+    from it so that they can be released once it is garbage collected """
+
+    def __init__(self):
+        self.executor = None
+        self.board = None
+
+
+def _release(resources):
+    if resources.executor is not None:
+        resources.executor.shutdown()
+        resources.executor = None
+
+    if resources.board is not None:
+        resources.board.close()
+        resources.board.unlink()
+        resources.board = None
+
+
+def _attach_board(name):
+    """ Returns the shared memory board of given name, attaching to it (and
+    detaching from any previous board) the first time it is asked for.
+    """
+    board = _attached_boards.get(name)
+    if board is None:
+        for previous_board in _attached_boards.values():
+            previous_board.close()
+        _attached_boards.clear()
+
+        board = shared_memory.SharedMemory(name=name)
+        _attached_boards[name] = board
+
+    return board
+
+
+def _tick_tile(name, table, tile_size, neighbor_slots, x_start, y_start,
+               x_stop, y_stop):
+    """ Returns indexes, within their tile, of the cells of given tile range
+    that are alive next generation, looking next states up in given Rule
+    table.
+
+    neighbor_slots are the board slots of the tiles below, level with and
+    above the tile, each from the lowest x up, None for tiles without living
+    cells.
+    """
+    buffer = _attach_board(name).buf
+    area = tile_size * tile_size
+
+    def read_row(y):
+        """ Returns row y of the tile, with the cells on either side of it """
+        tile_y, local_y = divmod(y, tile_size)
+        row = bytearray(tile_size + 2)
+        row_slots = neighbor_slots[(tile_y + 1) * 3:(tile_y + 2) * 3]
+        left_slot, slot, right_slot = row_slots
+        row_offset = local_y * tile_size
+
+        if left_slot is not None:
+            row[0] = buffer[left_slot * area + row_offset + tile_size - 1]
+        if slot is not None:
+            row_start = slot * area + row_offset
+            row[1:tile_size + 1] = buffer[row_start:row_start + tile_size]
+        if right_slot is not None:
+            row[tile_size + 1] = buffer[right_slot * area + row_offset]
+
+        return row
+
+    next_living_indexes = []
+    below, row = read_row(y_start - 1), read_row(y_start)
+    for y in range(y_start, y_stop):
+        above = read_row(y + 1)
+        column_counts = [a + b + c for a, b, c in zip(below, row, above)]
+
+        for x in range(x_start, x_stop):
+            alive = row[x + 1]
+            neighbor_count = (column_counts[x] + column_counts[x + 1] +
+                              column_counts[x + 2] - alive)
+            if table[alive * NEIGHBOR_COUNTS + neighbor_count]:
+                next_living_indexes.append(y * tile_size + x)
+
+        below, row = row, above
+
+    return next_living_indexes
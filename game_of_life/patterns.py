@@ -0,0 +1,272 @@
+""" Streaming readers and writers for RLE, Life 1.06 and plaintext (.cells)
+pattern files.
+
+Pattern files number rows downwards while worlds have y increasing upwards,
+so row r of a pattern is read at y coordinate -r: the pattern's top left
+corner ends up at Location(0, 0). Writers do the reverse, relative to the
+world's top left corner, except for Life 1.06 which keeps absolute
+coordinates.
+
+Readers go through files line by line and writers through living cells row
+by row, so memory use is proportional to the number of living cells rather
+than to the file or board size.
+"""
+from itertools import chain
+import os
+import re
+
+from .location import Location
+from .rows import x_indexes_by_y
+from .rule import Rule
+from .world import World
+
+RLE_LINE_LENGTH = 70
+# Values run up to the comma before the next field, so that they can hold
+# commas themselves, as rules with a bounded grid suffix do
+RLE_HEADER_PATTERN = re.compile(r'\s*(\w+)\s*=\s*(.*?)\s*'
+                                r'(?:,(?=\s*\w+\s*=)|$)')
+# Golly's bounded grid suffix of rules, such as :P10,10 or :T20,20
+RLE_BOUNDED_GRID_PATTERN = re.compile(r':[A-Za-z]\S*$')
+LIFE_106_HEADER = '#Life 1.06'
+PLAINTEXT_LIVE_CHARS = 'O*'
+
+
+def iter_rle(file, header=None):
+    """ Yields living locations of an RLE file object. If a header dict is
+    given, it is filled with the file's header fields (such as x, y and rule).
+    """
+    header_read = False
+    x = y = 0
+    run_count = ''
+
+    for line in file:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        if not header_read:
+            header_read = True
+            if line.startswith('x'):
+                if header is not None:
+                    header.update(_parse_rle_header(line))
+                continue
+
+        for char in line:
+            if char.isdigit():
+                run_count += char
+                continue
+
+            run = int(run_count) if run_count else 1
+            run_count = ''
+
+            if char in 'b.':
+                x += run
+            elif char == '$':
+                x = 0
+                y += run
+            elif char == '!':
+                return
+            elif not char.isspace():
+                for x_offset in range(run):
+                    yield Location(x + x_offset, -y)
+                x += run
+
+
+def iter_life106(file):
+    """ Yields living locations of a Life 1.06 file object """
+    for line in file:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        x, y = line.split()
+        yield Location(int(x), -int(y))
+
+
+def iter_plaintext(file):
+    """ Yields living locations of a plaintext (.cells) file object """
+    y = 0
+    for line in file:
+        line = line.rstrip('\r\n')
+        if line.startswith('!'):
+            continue
+
+        for x, char in enumerate(line):
+            if char in PLAINTEXT_LIVE_CHARS:
+                yield Location(x, -y)
+
+        y += 1
+
+
+def read_rle(file):
+    """ Returns World of an RLE file object, whose bounds cover the pattern's
+    declared width and height and whose rule is the pattern's declared rule.
+    Bounded grids of rules are ignored, the world being unbounded.
+    """
+    header = {}
+    locations = iter_rle(file, header)
+    # The header is read along with the first location
+    first_location = next(locations, None)
+    if first_location is not None:
+        locations = chain([first_location], locations)
+
+    rule = None
+    if 'rule' in header:
+        rule = Rule.from_string(
+            RLE_BOUNDED_GRID_PATTERN.sub('', header['rule']))
+
+    bounds = {}
+    if 'x' in header and 'y' in header:
+        width, height = int(header['x']), int(header['y'])
+        bounds = dict(min_location=Location(0, -max(height - 1, 0)),
+                      max_location=Location(max(width - 1, 0), 0))
+
+    return World.from_locations(locations, rule=rule, **bounds)
+
+
+def read_life106(file):
+    return World.from_locations(iter_life106(file))
+
+
+def read_plaintext(file):
+    return World.from_locations(iter_plaintext(file))
+
+
+def write_rle(world, file, rule=None):
+    """ Writes RLE of given world, declaring given rulestring, or the
+    world's own rule if none is given """
+    if rule is None:
+        rule = str(world.rule)
+
+    x_length, y_length = world.dimensions
+    file.write('x = {}, y = {}, rule = {}\n'.format(x_length, y_length, rule))
+
+    writer = _LineWrapper(file, RLE_LINE_LENGTH)
+    previous_row_number = 0
+
+    for row_number, x_indexes in _rows_of_x_indexes(world):
+        if row_number > previous_row_number:
+            writer.write(_rle_run(row_number - previous_row_number, '$'))
+
+        column = 0
+        for start, stop in _runs(x_indexes):
+            if start > column:
+                writer.write(_rle_run(start - column, 'b'))
+            writer.write(_rle_run(stop - start, 'o'))
+            column = stop
+
+        previous_row_number = row_number
+
+    writer.write('!')
+    writer.finish()
+
+
+def write_life106(world, file):
+    file.write(LIFE_106_HEADER + '\n')
+    for location in sorted(world.living_locations,
+                           key=lambda location: (-location.y, location.x)):
+        file.write('{} {}\n'.format(location.x, -location.y))
+
+
+def write_plaintext(world, file):
+    """ Writes plaintext rows over the world's bounds, omitting trailing dead
+    cells of every row """
+    previous_row_number = -1
+    for row_number, x_indexes in _rows_of_x_indexes(world):
+        file.write('\n' * (row_number - previous_row_number - 1))
+
+        row = ['.'] * (x_indexes[-1] + 1)
+        for x_index in x_indexes:
+            row[x_index] = 'O'
+        file.write(''.join(row) + '\n')
+
+        previous_row_number = row_number
+
+    x_length, y_length = world.dimensions
+    file.write('\n' * (y_length - previous_row_number - 1))
+
+
+READERS = {'.rle': read_rle, '.lif': read_life106, '.life': read_life106,
+           '.cells': read_plaintext}
+WRITERS = {'.rle': write_rle, '.lif': write_life106, '.life': write_life106,
+           '.cells': write_plaintext}
+
+
+def read_pattern(path):
+    """ Returns World read from pattern file at given path, whose format is
+    picked from its extension """
+    read = _by_extension(READERS, path)
+    with open(path) as file:
+        return read(file)
+
+
+def write_pattern(world, path):
+    write = _by_extension(WRITERS, path)
+    with open(path, 'w') as file:
+        write(world, file)
+
+
+def _by_extension(functions, path):
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        return functions[extension]
+    except KeyError:
+        raise ValueError('Unknown pattern file extension: {}'
+                         .format(extension))
+
+
+def _parse_rle_header(line):
+    return {key: value.strip()
+            for key, value in RLE_HEADER_PATTERN.findall(line)}
+
+
+def _rows_of_x_indexes(world):
+    """ Yields (row number, sorted x indexes) of every row of the world
+    holding a living cell, top row first, numbered from the world's top left
+    corner.
+    """
+    living_x_indexes = x_indexes_by_y(world.living_locations,
+                                      world.min_location.x)
+
+    for y in sorted(living_x_indexes, reverse=True):
+        yield world.max_location.y - y, sorted(living_x_indexes[y])
+
+
+def _runs(sorted_indexes):
+    """ Yields (start, stop) ranges of consecutive indexes """
+    start = previous = None
+    for index in sorted_indexes:
+        if start is None:
+            start = index
+        elif index != previous + 1:
+            yield start, previous + 1
+            start = index
+        previous = index
+
+    if start is not None:
+        yield start, previous + 1
+
+
+def _rle_run(count, tag):
+    return (str(count) if count > 1 else '') + tag
+
+
+class _LineWrapper():
+    """ Writes tokens to a file, starting a new line before a token that
+    would make the current line longer than line_length """
+
+    def __init__(self, file, line_length):
+        self.file = file
+        self.line_length = line_length
+        self._current_length = 0
+
+    def write(self, token):
+        if self._current_length + len(token) > self.line_length:
+            self.file.write('\n')
+            self._current_length = 0
+
+        self.file.write(token)
+        self._current_length += len(token)
+
+    def finish(self):
+        self.file.write('\n')
@@ -0,0 +1,31 @@
+""" Rows of living cells, as used by bitboards, snapshots, pattern writers,
+renderers and animations.
+
+Living cells are first grouped by row, as x indexes counted from a row's
+lowest x coordinate (see x_indexes_by_y). A row can then be packed into an
+int where bit i is set if the cell at x index i is living (see pack_row).
+"""
+from collections import defaultdict
+
+
+def x_indexes_by_y(coordinates, min_x):
+    """ Returns dict of lists of the x indexes, relative to min_x, of given
+    (x, y) coordinates (or Locations), by y coordinate, in the order given.
+    """
+    x_indexes = defaultdict(list)
+    for x, y in coordinates:
+        x_indexes[y].append(x - min_x)
+
+    return x_indexes
+
+
+def pack_row(x_indexes, width):
+    """ Returns int of given row of x indexes, each below width, where bit i
+    is set for every x index i """
+    # Rows are spelled out as binary digits, most significant bit (the
+    # highest x) first, to avoid shifting large ints once per cell
+    digits = bytearray(b'0' * width)
+    for x_index in x_indexes:
+        digits[width - 1 - x_index] = ord('1')
+
+    return int(digits, 2)
@@ -0,0 +1,82 @@
+import re
+
+NEIGHBOR_COUNTS = 9
+
+RULESTRING_PATTERN = re.compile(
+    r'^B(\d*)/S(\d*)$|^S(\d*)/B(\d*)$|^(\d*)/(\d*)$', re.IGNORECASE)
+
+
+class Rule():
+    """ Life-like rule, compiled into a table of next cell states.
+
+    table holds the next state of a cell at index alive * 9 + neighbor_count,
+    so that engines evaluate a cell with a single lookup rather than
+    branching on its state.
+
+    args:
+        birth_counts: neighbor counts for which a dead cell is born
+        survival_counts: neighbor counts for which a living cell survives
+
+    Rules where cells are born with no living neighbors (B0) are not
+    supported, since they would give birth to the whole infinite plane.
+    """
+
+    def __init__(self, birth_counts, survival_counts):
+        self.birth_counts = frozenset(birth_counts)
+        self.survival_counts = frozenset(survival_counts)
+
+        for count in self.birth_counts | self.survival_counts:
+            if not 0 <= count < NEIGHBOR_COUNTS:
+                raise ValueError('Invalid neighbor count {}'.format(count))
+
+        if 0 in self.birth_counts:
+            raise ValueError('B0 rules are not supported')
+
+        self.table = tuple(
+            count in (self.survival_counts if alive else self.birth_counts)
+            for alive in (False, True)
+            for count in range(NEIGHBOR_COUNTS))
+
+    @classmethod
+    def from_string(cls, rulestring):
+        """ Returns Rule of a rulestring in B/S notation (such as B3/S23,
+        B36/S23 or B2/S), also accepting S/B notation (S23/B3) and Golly's
+        survival/birth digits (23/3).
+        """
+        match = RULESTRING_PATTERN.match(rulestring.strip())
+        if match is None:
+            raise ValueError('Invalid rulestring: {}'.format(rulestring))
+
+        (births, survivals, s_b_survivals, s_b_births, digit_survivals,
+         digit_births) = match.groups()
+        if births is None:
+            births, survivals = s_b_births, s_b_survivals
+        if births is None:
+            births, survivals = digit_births, digit_survivals
+
+        return cls(map(int, births), map(int, survivals))
+
+    def next_state(self, alive, neighbor_count):
+        return self.table[alive * NEIGHBOR_COUNTS + neighbor_count]
+
+    def __eq__(self, other):
+        return (isinstance(other, Rule) and
+                self.birth_counts == other.birth_counts and
+                self.survival_counts == other.survival_counts)
+
+    def __hash__(self):
+        return hash((self.birth_counts, self.survival_counts))
+
+    def __repr__(self):
+        return 'Rule.from_string({!r})'.format(str(self))
+
+    def __str__(self):
+        return 'B{}/S{}'.format(_digits(self.birth_counts),
+                                _digits(self.survival_counts))
+
+
+def _digits(counts):
+    return ''.join(str(count) for count in sorted(counts))
+
+
+CONWAY = Rule.from_string('B3/S23')
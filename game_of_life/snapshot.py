@@ -0,0 +1,241 @@
+""" Versioned binary snapshots of worlds.
+
+A snapshot is a fixed size header followed by a payload in one of two
+encodings, whichever is smaller for the world saved:
+
+    ROWS_ENCODING: one bit-packed row per y coordinate of the world's bounds,
+        from min_location.y up, each row being ceil(width / 8) bytes where bit
+        i (least significant bit first) is the cell at min_location.x + i.
+    COORDINATES_ENCODING: living cells sorted by (y, x) as pairs of unsigned
+        LEB128 varints. The first varint is the y delta from the previous cell
+        (from min_location.y for the first one). The second is the cell's
+        x - min_location.x when the y delta is non zero, otherwise the number
+        of dead cells since the previous cell of the row.
+
+The header holds the world's bounds, generation, population and rule, the
+rule as masks of its birth and survival neighbor counts (bit i set for count
+i). Version 1 snapshots, which have no rule, still load, as B3/S23.
+
+Loading memory-maps the file and only decodes what it needs, so a viewport
+of a large snapshot can be loaded without reading all of it.
+"""
+import mmap
+import struct
+
+from .location import Location
+from .rows import pack_row, x_indexes_by_y
+from .rule import CONWAY, NEIGHBOR_COUNTS, Rule
+from .world import World
+
+MAGIC = b'GOLS'
+VERSION = 2
+ROWS_ENCODING = 0
+COORDINATES_ENCODING = 1
+HEADER = struct.Struct('<4sBBHqqqqQQHH')
+# Header of snapshots from before rules were saved
+VERSION_1_HEADER = struct.Struct('<4sBBHqqqqQQ')
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def save_snapshot(world, file):
+    """ Writes a snapshot of given world to a binary file object """
+    x_length, y_length = world.dimensions
+    row_length = (x_length + 7) // 8
+    coordinates_payload = _encode_coordinates(world)
+
+    if len(coordinates_payload) <= row_length * y_length:
+        encoding = COORDINATES_ENCODING
+    else:
+        encoding = ROWS_ENCODING
+
+    file.write(HEADER.pack(MAGIC, VERSION, encoding, 0,
+                           world.min_location.x, world.min_location.y,
+                           world.max_location.x, world.max_location.y,
+                           world.generation, world.living_cell_count,
+                           _counts_mask(world.rule.birth_counts),
+                           _counts_mask(world.rule.survival_counts)))
+
+    if encoding == COORDINATES_ENCODING:
+        file.write(coordinates_payload)
+    else:
+        _write_rows(world, file, row_length)
+
+
+def load_snapshot(path, viewport=None):
+    """ Returns World loaded from snapshot file at given path.
+
+    args:
+        viewport: optional (min_location, max_location) tuple; only living
+            cells within it are loaded, and it becomes the world's bounds
+    """
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _load(data, viewport)
+
+
+def _load(data, viewport):
+    if len(data) < VERSION_1_HEADER.size:
+        raise SnapshotError('Snapshot is too short to hold a header')
+
+    magic, version = struct.unpack_from('<4sB', data)
+    if magic != MAGIC:
+        raise SnapshotError('Not a snapshot file')
+
+    if version == VERSION and len(data) >= HEADER.size:
+        header = HEADER
+        (_, _, encoding, _, min_x, min_y, max_x, max_y, generation, _,
+         birth_mask, survival_mask) = HEADER.unpack_from(data)
+        try:
+            rule = Rule(_mask_counts(birth_mask), _mask_counts(survival_mask))
+        except ValueError as error:
+            raise SnapshotError('Invalid snapshot rule: {}'.format(error))
+    elif version == 1:
+        header = VERSION_1_HEADER
+        (_, _, encoding, _, min_x, min_y, max_x, max_y, generation,
+         _) = VERSION_1_HEADER.unpack_from(data)
+        rule = CONWAY
+    else:
+        raise SnapshotError('Unsupported snapshot version {}'.format(version))
+
+    min_location, max_location = Location(min_x, min_y), Location(max_x,
+                                                                  max_y)
+    if viewport is not None:
+        min_location, max_location = viewport
+
+    if encoding == ROWS_ENCODING:
+        locations = _decode_rows(data, header.size, Location(min_x, min_y),
+                                 Location(max_x, max_y), min_location,
+                                 max_location)
+    elif encoding == COORDINATES_ENCODING:
+        locations = _decode_coordinates(data, header.size,
+                                        Location(min_x, min_y), min_location,
+                                        max_location)
+    else:
+        raise SnapshotError('Unknown snapshot encoding {}'.format(encoding))
+
+    world = World(min_location, max_location, rule=rule)
+    world.set_living_many(locations)
+    world.generation = generation
+    return world
+
+
+def _living_x_indexes_by_y(world):
+    return x_indexes_by_y(world.living_locations, world.min_location.x)
+
+
+def _write_rows(world, file, row_length):
+    living_x_indexes = _living_x_indexes_by_y(world)
+    x_length, _ = world.dimensions
+    empty_row = bytes(row_length)
+
+    for y in range(world.min_location.y, world.max_location.y + 1):
+        x_indexes = living_x_indexes.get(y)
+        if not x_indexes:
+            file.write(empty_row)
+            continue
+
+        file.write(pack_row(x_indexes, x_length).to_bytes(row_length,
+                                                          'little'))
+
+
+def _decode_rows(data, header_size, snapshot_min, snapshot_max, min_location,
+                 max_location):
+    """ Yields living locations within given bounds, only reading the bytes
+    of the rows and columns that overlap them.
+    """
+    row_length = (snapshot_max.x - snapshot_min.x + 8) // 8
+    first_x_index = max(min_location.x - snapshot_min.x, 0)
+    last_x_index = min(max_location.x, snapshot_max.x) - snapshot_min.x
+    if last_x_index < first_x_index:
+        return
+
+    first_byte, last_byte = first_x_index // 8, last_x_index // 8
+
+    for y in range(max(min_location.y, snapshot_min.y),
+                   min(max_location.y, snapshot_max.y) + 1):
+        row_start = header_size + (y - snapshot_min.y) * row_length
+        row = int.from_bytes(data[row_start + first_byte:
+                                  row_start + last_byte + 1], 'little')
+        row >>= first_x_index - first_byte * 8
+        row &= (1 << (last_x_index - first_x_index + 1)) - 1
+
+        while row:
+            lowest_bit = row & -row
+            yield Location(snapshot_min.x + first_x_index +
+                           lowest_bit.bit_length() - 1, y)
+            row ^= lowest_bit
+
+
+def _encode_coordinates(world):
+    payload = bytearray()
+    previous_y, previous_x = world.min_location.y, None
+    living_x_indexes = _living_x_indexes_by_y(world)
+
+    for y in sorted(living_x_indexes):
+        for x_index in sorted(living_x_indexes[y]):
+            if y != previous_y or previous_x is None:
+                _write_varint(payload, y - previous_y)
+                _write_varint(payload, x_index)
+            else:
+                _write_varint(payload, 0)
+                _write_varint(payload, x_index - previous_x - 1)
+
+            previous_y, previous_x = y, x_index
+
+    return bytes(payload)
+
+
+def _decode_coordinates(data, header_size, snapshot_min, min_location,
+                        max_location):
+    """ Yields living locations within given bounds, stopping as soon as the
+    coordinates pass beyond them.
+    """
+    position = header_size
+    y, x_index = snapshot_min.y, None
+    end = len(data)
+
+    while position < end:
+        y_delta, position = _read_varint(data, position)
+        x_value, position = _read_varint(data, position)
+
+        if y_delta or x_index is None:
+            y += y_delta
+            x_index = x_value
+        else:
+            x_index += x_value + 1
+
+        if y > max_location.y:
+            return
+
+        x = snapshot_min.x + x_index
+        if y >= min_location.y and min_location.x <= x <= max_location.x:
+            yield Location(x, y)
+
+
+def _write_varint(payload, value):
+    while value >= 0x80:
+        payload.append(value & 0x7f | 0x80)
+        value >>= 7
+    payload.append(value)
+
+
+def _read_varint(data, position):
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _counts_mask(counts):
+    return sum(1 << count for count in counts)
+
+
+def _mask_counts(mask):
+    return [count for count in range(NEIGHBOR_COUNTS) if mask >> count & 1]
@@ -0,0 +1,106 @@
+from collections import Counter
+
+from .engine import Engine
+from .location import (NEIGHBOR_OFFSETS, NEIGHBORHOOD_OFFSETS,
+                       is_key_within)
+from .rule import CONWAY, NEIGHBOR_COUNTS
+
+
+class SparseEngine(Engine):
+    """ Tick engine that only visits living locations and their neighbors, so
+    that the cost of a generation scales with the living population rather
+    than with the area of the world's bounding box.
+    """
+
+    def next_living_keys(self, living_keys, min_location=None,
+                         max_location=None, stats=None, rule=CONWAY):
+        if stats is None:
+            neighbor_counts = self._count_neighbors(living_keys, min_location,
+                                                    max_location)
+            return self._apply_rule(rule, living_keys, neighbor_counts)
+
+        with stats.phase('neighbor_count'):
+            neighbor_counts = self._count_neighbors(living_keys, min_location,
+                                                    max_location)
+
+        with stats.phase('rule_evaluation'):
+            next_living_keys = self._apply_rule(rule, living_keys,
+                                                neighbor_counts)
+
+        stats.locations_evaluated = len(neighbor_counts)
+        return next_living_keys
+
+    def next_changes(self, living_keys, changed_keys, min_location=None,
+                     max_location=None, stats=None, rule=CONWAY):
+        """ Only evaluates changed cells and their neighbors. See
+        Engine.next_changes.
+        """
+        if stats is None:
+            births, deaths, _ = self._evaluate_changes(
+                living_keys, changed_keys, min_location, max_location, rule)
+            return births, deaths
+
+        with stats.phase('rule_evaluation'):
+            births, deaths, evaluated_count = self._evaluate_changes(
+                living_keys, changed_keys, min_location, max_location, rule)
+
+        stats.locations_evaluated = evaluated_count
+        return births, deaths
+
+    def _evaluate_changes(self, living_keys, changed_keys, min_location,
+                          max_location, rule):
+        """ Returns births, deaths and number of cells evaluated """
+        candidate_keys = {key + offset
+                          for key in changed_keys
+                          for offset in NEIGHBORHOOD_OFFSETS}
+        if min_location is not None and max_location is not None:
+            candidate_keys = {key for key in candidate_keys
+                              if is_key_within(key, min_location,
+                                               max_location)}
+
+        table = rule.table
+        births, deaths = set(), set()
+        for key in candidate_keys:
+            alive = key in living_keys
+            neighbor_count = 0
+            for offset in NEIGHBOR_OFFSETS:
+                if key + offset in living_keys:
+                    neighbor_count += 1
+
+            if table[alive * NEIGHBOR_COUNTS + neighbor_count] != alive:
+                (deaths if alive else births).add(key)
+
+        return births, deaths, len(candidate_keys)
+
+    def _apply_rule(self, rule, living_keys, neighbor_counts):
+        table = rule.table
+        next_living_keys = {key for key, neighbor_count
+                            in neighbor_counts.items()
+                            if table[(key in living_keys) * NEIGHBOR_COUNTS +
+                                     neighbor_count]}
+
+        # Living cells without living neighbors are missing from the counts,
+        # but survive under rules with S0
+        if table[NEIGHBOR_COUNTS]:
+            next_living_keys.update(key for key in living_keys
+                                    if key not in neighbor_counts)
+
+        return next_living_keys
+
+    def _count_neighbors(self, living_keys, min_location=None,
+                         max_location=None):
+        """ Returns Counter keyed by the key of every location, within bounds
+        if given, neighboring at least one living location, with the number
+        of living neighbors as its value.
+        """
+        neighbor_counts = Counter([key + offset
+                                   for key in living_keys
+                                   for offset in NEIGHBOR_OFFSETS])
+
+        if min_location is not None and max_location is not None:
+            for key in list(neighbor_counts):
+                if not is_key_within(key, min_location, max_location):
+                    del neighbor_counts[key]
+
+        return neighbor_counts
+
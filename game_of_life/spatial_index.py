@@ -0,0 +1,110 @@
+from .location import KEY_MAX_X, KEY_MIN_X, is_key_within, pack, unpack
+
+CHUNK_SIZE_BITS = 5
+
+
+def chunk_key(key, chunk_size_bits=CHUNK_SIZE_BITS):
+    """ Returns key of the chunk, of 2^chunk_size_bits cells a side, holding
+    the location of given key. Chunk keys are packed chunk coordinates. """
+    x, y = unpack(key)
+    return pack(x >> chunk_size_bits, y >> chunk_size_bits)
+
+
+class ChunkIndex():
+    """ Spatial index of location keys (see Location.key), kept in sets by
+    square chunk of 2^chunk_size_bits cells a side.
+
+    Counting the keys within a rectangle takes one len per chunk fully
+    covered by it, only looking at individual keys of the chunks its edges
+    cross.
+    """
+
+    def __init__(self, keys=(), chunk_size_bits=CHUNK_SIZE_BITS):
+        self.chunk_size_bits = chunk_size_bits
+        self._chunks = {}
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return sum(len(chunk) for chunk in self._chunks.values())
+
+    def add(self, key):
+        chunk = chunk_key(key, self.chunk_size_bits)
+        self._chunks.setdefault(chunk, set()).add(key)
+
+    def discard(self, key):
+        chunk = chunk_key(key, self.chunk_size_bits)
+        keys = self._chunks.get(chunk)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._chunks[chunk]
+
+    def update(self, added_keys, discarded_keys):
+        for key in discarded_keys:
+            self.discard(key)
+
+        for key in added_keys:
+            self.add(key)
+
+    def count_in(self, min_location, max_location):
+        """ Returns number of keys within given bounds (inclusive) """
+        count = 0
+        for keys, is_covered in self._chunks_in(min_location, max_location):
+            if is_covered:
+                count += len(keys)
+            else:
+                count += sum(1 for key in keys
+                             if is_key_within(key, min_location,
+                                              max_location))
+
+        return count
+
+    def keys_in(self, min_location, max_location):
+        """ Yields keys within given bounds (inclusive) """
+        for keys, is_covered in self._chunks_in(min_location, max_location):
+            if is_covered:
+                yield from keys
+            else:
+                yield from (key for key in keys
+                            if is_key_within(key, min_location,
+                                             max_location))
+
+    def _chunks_in(self, min_location, max_location):
+        """ Yields (keys, is_covered) of every non empty chunk overlapping
+        given bounds, is_covered telling whether the bounds cover it whole.
+        Visits either every chunk of the bounds or every non empty chunk,
+        whichever is fewer.
+        """
+        bits = self.chunk_size_bits
+        min_chunk_x, min_chunk_y = (min_location.x >> bits,
+                                    min_location.y >> bits)
+        max_chunk_x, max_chunk_y = (max_location.x >> bits,
+                                    max_location.y >> bits)
+        # Only chunks of packable locations can hold keys
+        min_chunk_x = max(min_chunk_x, KEY_MIN_X >> bits)
+        max_chunk_x = min(max_chunk_x, KEY_MAX_X >> bits)
+        if min_chunk_x > max_chunk_x or min_chunk_y > max_chunk_y:
+            return
+
+        # Chunks fully inside the bounds
+        covered_x = range((min_location.x + (1 << bits) - 1) >> bits,
+                          ((max_location.x + 1) >> bits))
+        covered_y = range((min_location.y + (1 << bits) - 1) >> bits,
+                          ((max_location.y + 1) >> bits))
+
+        chunk_area = ((max_chunk_x - min_chunk_x + 1) *
+                      (max_chunk_y - min_chunk_y + 1))
+        if chunk_area <= len(self._chunks):
+            chunks = ((chunk_x, chunk_y,
+                       self._chunks.get(pack(chunk_x, chunk_y)))
+                      for chunk_y in range(min_chunk_y, max_chunk_y + 1)
+                      for chunk_x in range(min_chunk_x, max_chunk_x + 1))
+        else:
+            chunks = (unpack(chunk) + (keys,)
+                      for chunk, keys in self._chunks.items())
+
+        for chunk_x, chunk_y, keys in chunks:
+            if (keys and min_chunk_x <= chunk_x <= max_chunk_x and
+                    min_chunk_y <= chunk_y <= max_chunk_y):
+                yield keys, chunk_x in covered_x and chunk_y in covered_y
@@ -0,0 +1,121 @@
+import sys
+import time
+
+from . import world_renderer
+from .world_renderer import WorldRenderer
+
+CLEAR_SCREEN = '\x1b[2J'
+CLEAR_LINE = '\x1b[K'
+TITLE_LINE_COUNT = 1
+
+
+def move_cursor(row, column):
+    """ Returns ANSI escape sequence moving the cursor to given 1-based row
+    and column """
+    return '\x1b[{};{}H'.format(row, column)
+
+
+class TerminalDisplay():
+    """ Draws successive generations of a world to an ANSI terminal.
+
+    The first frame, and any frame after the world's bounds changed, is drawn
+    in full. Other frames only rewrite the cells that changed since the
+    previous frame.
+
+    args:
+        file: file object written to
+        fps: optional target frames per second; frames are paced to it
+        headless: if set, nothing is written, frames are only counted and
+            timed, to measure raw generations per second
+    """
+
+    def __init__(self, file=None, fps=None, headless=False,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.file = file if file is not None else sys.stdout
+        self.fps = fps
+        self.headless = headless
+        self.frame_count = 0
+        self._clock = clock
+        self._sleep = sleep
+        self._start_time = None
+        self._next_frame_time = None
+        self._bounds = None
+        self._living_locations = set()
+
+    @property
+    def frames_per_second(self):
+        if self._start_time is None:
+            return 0.0
+
+        elapsed = self._clock() - self._start_time
+        return self.frame_count / elapsed if elapsed else float('inf')
+
+    def show(self, world, title=''):
+        """ Draws given world as the next frame, waiting for the frame's turn
+        when pacing to a target fps.
+        """
+        self.write('' if self.headless else self.draw(world, title))
+
+    def draw(self, world, title=''):
+        """ Returns the escape sequences drawing given world, or any object
+        with the same bounds and living_locations attributes, over the frame
+        drawn before it. Frames must be written in the order they are drawn.
+        """
+        bounds = (world.min_location, world.max_location)
+        living_locations = set(world.living_locations)
+
+        title_line = move_cursor(1, 1) + title + CLEAR_LINE
+        if bounds != self._bounds:
+            frame = (CLEAR_SCREEN + title_line + '\n' +
+                     WorldRenderer(world).render())
+        else:
+            changed_locations = living_locations ^ self._living_locations
+            frame = title_line + ''.join(
+                self._draw_cell(location, location in living_locations)
+                for location in changed_locations)
+
+        self._bounds = bounds
+        self._living_locations = living_locations
+        return frame
+
+    def write(self, frame):
+        """ Writes a frame returned by draw, waiting for its turn when pacing
+        to a target fps.
+        """
+        if self._start_time is None:
+            self._start_time = self._clock()
+
+        self._wait_for_frame()
+
+        if not self.headless:
+            self.file.write(frame)
+            self.file.flush()
+
+        self.frame_count += 1
+
+    def finish(self):
+        """ Moves the cursor below the last frame drawn """
+        if not self.headless and self._bounds is not None:
+            min_location, max_location = self._bounds
+            height = max_location.y - min_location.y + 1
+            self.file.write(move_cursor(TITLE_LINE_COUNT + height + 1, 1))
+            self.file.flush()
+
+    def _wait_for_frame(self):
+        if not self.fps:
+            return
+
+        now = self._clock()
+        if self._next_frame_time is not None and now < self._next_frame_time:
+            self._sleep(self._next_frame_time - now)
+            now = self._next_frame_time
+
+        self._next_frame_time = now + 1 / self.fps
+
+    def _draw_cell(self, location, alive):
+        min_location, max_location = self._bounds
+        cell_char = (world_renderer.LIVE_CELL_CHAR if alive
+                     else world_renderer.DEAD_CELL_CHAR)
+        row = TITLE_LINE_COUNT + max_location.y - location.y + 1
+        column = (location.x - min_location.x) * len(cell_char) + 1
+        return move_cursor(row, column) + cell_char
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class TickStats():
+    """ Counters describing a single tick of a world.
+
+    attributes:
+        generation: generation the tick produced
+        phase_seconds: wall time of every phase of the tick (such as
+            neighbor_count, rule_evaluation and commit), in the order phases
+            ran
+        locations_evaluated: number of locations whose next state was computed
+        births, deaths: number of cells born and died
+        population: number of living cells after the tick
+        bounding_box_area: area of the world's bounds after the tick
+    """
+
+    def __init__(self):
+        self.generation = None
+        self.phase_seconds = OrderedDict()
+        self.locations_evaluated = 0
+        self.births = 0
+        self.deaths = 0
+        self.population = 0
+        self.bounding_box_area = 0
+
+    @property
+    def total_seconds(self):
+        return sum(self.phase_seconds.values())
+
+    @contextmanager
+    def phase(self, name):
+        """ Context manager adding the wall time of its block to given phase
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[name] = (self.phase_seconds.get(name, 0) +
+                                        perf_counter() - start)
+
+    def as_dict(self):
+        return {
+            'generation': self.generation,
+            'phase_seconds': dict(self.phase_seconds),
+            'locations_evaluated': self.locations_evaluated,
+            'births': self.births,
+            'deaths': self.deaths,
+            'population': self.population,
+            'bounding_box_area': self.bounding_box_area,
+        }
+
+    def __str__(self):
+        phases = ' '.join('{}={:.2f}ms'.format(name, seconds * 1000)
+                          for name, seconds in self.phase_seconds.items())
+        return ('generation={} population={} births={} deaths={} '
+                'evaluated={} area={} {}'.format(
+                    self.generation, self.population, self.births,
+                    self.deaths, self.locations_evaluated,
+                    self.bounding_box_area, phases)).rstrip()
@@ -1,9 +1,33 @@
 from .world_renderer import WorldRenderer
 
 
-def turn_renderings(world, turns=1, animate=False):
-    for turn in range(0, turns + 1):
-        if turn > 0:
-            world = world.tick()
+def turn_renderings(world, turns=1, animate=False, stats=False,
+                    history=None):
+    """ Yields renderings of the world for every turn. With stats, renderings
+    of turns after the first end with a line of the turn's TickStats. Given a
+    History, every turn is recorded in it (see World.record_history).
+    Stats are only collected while renderings are being yielded.
+    """
+    first_world = world
+    if stats:
+        collected_stats = world.collect_stats
+        world.collect_stats = True
 
-        yield 'Turn {}:\n'.format(turn) + WorldRenderer(world).render()
+    if history is not None:
+        world.record_history(history)
+
+    try:
+        for turn in range(0, turns + 1):
+            if turn > 0:
+                world = world.tick()
+
+            rendering = ('Turn {}:\n'.format(turn) +
+                         WorldRenderer(world).render())
+
+            if stats and turn > 0:
+                rendering += '\n' + str(world.last_tick_stats)
+
+            yield rendering
+    finally:
+        if stats:
+            first_world.collect_stats = collected_stats
@@ -1,7 +1,16 @@
-from random import randint
+from functools import partial
+from itertools import chain
+from random import randint, sample
 
 from .cell import Cell
-from .location import LocationGrid, Location
+from .cycle_detection import CycleDetector, DEFAULT_MAX_HISTORY
+from .history import History
+from .location import (KEY_COORDINATE_BITS, Location, is_packable, pack,
+                       unpack)
+from .rule import CONWAY
+from .sparse_engine import SparseEngine
+from .spatial_index import ChunkIndex
+from .tick_stats import TickStats
 
 DEFAULT_MIN_LOCATION = Location(0, 0)
 DEFAULT_MAX_LOCATION = Location(0, 0)
@@ -9,98 +18,317 @@ DEFAULT_MAX_LOCATION = Location(0, 0)
 
 class World():
     def __init__(self, min_location=DEFAULT_MIN_LOCATION,
-                 max_location=DEFAULT_MAX_LOCATION):
-        self._cells = {}
+                 max_location=DEFAULT_MAX_LOCATION, engine=None,
+                 shrink_bounds=False, bounds_margin=0, rule=None,
+                 active_region=False):
+        """
+        args:
+            min_location, max_location: bounds of the world; they expand when
+                a living cell is set outside of them
+            engine: tick engine, defaults to a SparseEngine
+            shrink_bounds: if set, cells may be born outside of the world's
+                bounds, which are recomputed after every tick to tightly fit
+                the living cells
+            bounds_margin: number of dead cells kept around the living cells
+                when shrinking bounds
+            rule: Rule cells follow, defaults to Conway's B3/S23
+            active_region: if set, ticks only re-evaluate the cells that
+                changed in the previous tick, or were set since, along with
+                their neighbors; no other cell can change state. The first
+                tick, and the first after seek, evaluate every cell.
+
+        Setting collect_stats, or adding tick hooks, makes every tick record
+        a TickStats in last_tick_stats and pass it to each tick hook.
+
+        After record_history, every tick is recorded in history, and seek
+        restores the world to any generation still held in it.
+
+        The first count_living_in or living_in builds a spatial index of the
+        living cells, which ticks and single cell edits then keep up to date.
+        """
+        # Only keys (see Location.key) of living cells are stored, dead ones
+        # are implied
+        self._living_keys = set()
+        self.engine = engine if engine is not None else SparseEngine()
+        self.shrink_bounds = shrink_bounds
+        self.bounds_margin = bounds_margin
+        self.rule = rule if rule is not None else CONWAY
+        # Keys of cells changed since the previous tick, or None when unknown
+        # or not tracked (see active_region), and the rule that tick followed
+        self._changed_keys = None
+        self.active_region = active_region
+        self._tick_rule = None
+        # ChunkIndex of living keys for region queries, or None until needed
+        self._index = None
+        self.generation = 0
+        self.collect_stats = False
+        self.tick_hooks = []
+        self.last_tick_stats = None
+        self.history = None
         # consider allowing getting of min/max location, but restricting setting
         # due to its tendency to potentially change when setting a living cell
         # TODO: Consider moving location_grid to world
         self.min_location = min_location
         self.max_location = max_location
 
+    @property
+    def active_region(self):
+        return self._active_region
+
+    @active_region.setter
+    def active_region(self, active_region):
+        self._active_region = active_region
+        if not active_region:
+            self._changed_keys = None
+
     @classmethod
     def empty(cls, *args, **kwargs):
         return cls(*args, **kwargs)
 
     @classmethod
-    def random(cls, *args, cell_count=1, **kwargs):
+    def from_locations(cls, locations, *args, **kwargs):
+        """ Returns world where every location of given iterable is living.
+        Unless bounds are given, they tightly fit the locations.
+        """
+        locations = iter(locations)
+        if (not args and 'min_location' not in kwargs and
+                'max_location' not in kwargs):
+            first_location = next(locations, None)
+            if first_location is not None:
+                kwargs.update(min_location=first_location,
+                              max_location=first_location)
+                locations = chain([first_location], locations)
+
+        world = cls(*args, **kwargs)
+        world.set_living_many(locations)
+        return world
+
+    @classmethod
+    def random(cls, *args, cell_count=None, density=None, rng=None,
+               **kwargs):
+        """ Returns world where cell_count distinct cells, or given density
+        (fraction) of its cells, drawn at random within its bounds are
+        living. A single cell is living by default. Cells are drawn with
+        given random.Random, so that seeding it reproduces the world, or with
+        the random module's generator.
+        """
         world = cls(*args, **kwargs)
-        for _ in range(cell_count):
-            world.randomly_set_living()
+        x_length, y_length = world.dimensions
+        area = x_length * y_length
 
+        if density is None:
+            cell_count = 1 if cell_count is None else cell_count
+        elif cell_count is None:
+            cell_count = round(density * area)
+        else:
+            raise ValueError('Give either cell_count or density, not both')
+
+        if cell_count > area:
+            raise ValueError('Cannot set {} cells living in a world of {} '
+                             'cells'.format(cell_count, area))
+
+        draw = sample if rng is None else rng.sample
+        world._set_living_indexes(draw(range(area), cell_count))
         return world
 
     def randomly_set_living(self):
-        x = randint(self.min_location.x, self.max_location.x)
-        y = randint(self.min_location.y, self.max_location.y)
+        """ Sets a random dead cell within bounds living """
+        x_length, y_length = self.dimensions
+        if self.living_cell_count >= x_length * y_length:
+            raise ValueError('Every cell of the world is already living')
 
-        if self.is_alive_at(Location(x, y)):
-            self.randomly_set_living()
-        else:
-            self.set_living_at(Location(x, y))
+        while True:
+            location = Location(randint(self.min_location.x,
+                                        self.max_location.x),
+                                randint(self.min_location.y,
+                                        self.max_location.y))
+            if not self.is_alive_at(location):
+                self.set_living_at(location)
+                return
 
     def set_dead_at(self, location):
-        cell = self._find_cell_at(location)
-        if cell:
-            cell.die()
-        else:
-            self._add_cell(Cell(alive=False), location)
+        # Cells without a key cannot be living
+        if not is_packable(*location):
+            return
+
+        key = location.key
+        self._living_keys.discard(key)
+        self._mark_edited(key, alive=False)
 
     def set_living_at(self, location):
-        if location.x > self.max_location.x:
-            self.max_location = Location(location.x, self.max_location.y)
+        key = location.key
+        self._expand_bounds_to(location)
+        self._living_keys.add(key)
+        self._mark_edited(key, alive=True)
 
-        if location.y > self.max_location.y:
-            self.max_location = Location(self.max_location.x, location.y)
+    def set_living_many(self, locations):
+        """ Sets every location of given iterable living, expanding bounds
+        once for the whole batch rather than once per location.
+        """
+        min_x, min_y = self.min_location
+        max_x, max_y = self.max_location
+        living_keys = self._living_keys
 
-        if location.x < self.min_location.x:
-            self.min_location = Location(location.x, self.min_location.y)
+        try:
+            for x, y in locations:
+                living_keys.add(pack(x, y))
 
-        if location.y < self.min_location.y:
-            self.min_location = Location(self.min_location.x, location.y)
+                if x < min_x:
+                    min_x = x
+                elif x > max_x:
+                    max_x = x
+
+                if y < min_y:
+                    min_y = y
+                elif y > max_y:
+                    max_y = y
+        finally:
+            # Locations set before one fails to pack stay set
+            self.min_location = Location(min_x, min_y)
+            self.max_location = Location(max_x, max_y)
+            self._mark_bulk_edited()
+
+    def set_dead_many(self, locations):
+        """ Sets every location, or (x, y) pair, of given iterable dead """
+        self._living_keys.difference_update(pack(x, y)
+                                            for x, y in locations
+                                            if is_packable(x, y))
+        self._mark_bulk_edited()
+
+    def _set_living_indexes(self, indexes):
+        """ Sets living the cells of given row-major indexes within bounds,
+        index 0 being the min_location cell. Bounds are left unchanged.
+        """
+        # Every index packs if both corners of the bounds do
+        pack(*self.min_location)
+        pack(*self.max_location)
 
-        self._add_cell(Cell(), location)
+        x_length, _ = self.dimensions
+        min_x, min_y = self.min_location
+        self._living_keys.update(
+            min_x + index % x_length + ((min_y + index // x_length) <<
+                                        KEY_COORDINATE_BITS)
+            for index in indexes)
+        self._mark_bulk_edited()
 
     def get_cell_at(self, location):
-        cell = self._find_cell_at(location)
-        if cell:
-            return cell
-        else:
-            self.set_dead_at(location)
-            return self.get_cell_at(location)
+        return Cell(alive=self.is_alive_at(location), rule=self.rule)
 
     def is_alive_at(self, location):
-        return location in self.living_locations
+        return is_packable(*location) and location.key in self._living_keys
 
     @property
     def living_locations(self):
-        return [l for l, c in self._cells.items() if c.is_alive]
+        return [Location.from_key(key) for key in self._living_keys]
+
+    def count_living_in(self, min_location, max_location):
+        """ Returns number of living cells within given bounds (inclusive)
+        """
+        return self._spatial_index().count_in(min_location, max_location)
+
+    def living_in(self, min_location, max_location):
+        """ Returns list of living locations within given bounds (inclusive)
+        """
+        return [Location.from_key(key)
+                for key in self._spatial_index().keys_in(min_location,
+                                                         max_location)]
 
-    def _get_living_neighbor_count(self, location):
-        neighbor_locations = location.neighbors
-        living_neighbor_cells = [self.get_cell_at(nl)
-                                 for nl in neighbor_locations
-                                 if self.is_alive_at(nl)]
-        return len(living_neighbor_cells)
+    def add_tick_hook(self, hook):
+        """ Registers callable to be called with the TickStats of every tick
+        """
+        self.tick_hooks.append(hook)
 
     def tick(self):
-        new_locations = []
-        world_locations = LocationGrid(self.min_location,
-                                       self.max_location).locations
-
-        for location in world_locations:
-            cell = self.get_cell_at(location)
-            neighbor_count = self._get_living_neighbor_count(location)
-            is_alive_next_gen = cell.is_alive_next_generation(neighbor_count)
-            new_locations.append((location, is_alive_next_gen))
-
-        for location, is_alive in new_locations:
-            if is_alive:
-                self.set_living_at(location)
-            else:
-                self.set_dead_at(location)
+        stats = self._new_tick_stats()
+
+        bounds = ()
+        if not self.shrink_bounds:
+            bounds = (self.min_location, self.max_location)
+
+        if (self.active_region and self._changed_keys is not None and
+                self._tick_rule is self.rule):
+            births, deaths = self.engine.next_changes(
+                self._living_keys, self._changed_keys, *bounds, stats=stats,
+                rule=self.rule)
+            commit = partial(self._commit_changes, births, deaths)
+        else:
+            next_living_keys = self.engine.next_living_keys(
+                self._living_keys, *bounds, stats=stats, rule=self.rule)
+            commit = partial(self._commit, next_living_keys)
+
+        self.generation += 1
+
+        if stats is None:
+            births, deaths = commit()
+        else:
+            with stats.phase('commit'):
+                births, deaths = commit()
+
+            self._record_tick_stats(stats, len(births), len(deaths))
+
+        if self.active_region:
+            self._changed_keys = births | deaths
+        self._tick_rule = self.rule
+
+        if self.history is not None:
+            self.history.record(self.generation, self._living_keys, births,
+                                deaths, self.min_location, self.max_location)
+
+        return self
+
+    def record_history(self, history=None):
+        """ Starts recording every generation, from the current one, in
+        given History, or in a new one with default settings. Returns it.
+        """
+        if history is None:
+            history = History()
 
+        history.record_keyframe(self.generation, self._living_key_iterable(),
+                                self.min_location, self.max_location)
+        self.history = history
+        return history
+
+    def seek(self, generation):
+        """ Restores the world to given generation of its history, raising
+        KeyError when it is not recorded, or LookupError when no history is
+        (see record_history). Ticking on from there replaces the generations
+        recorded after it.
+        """
+        if self.history is None:
+            raise LookupError('Cannot seek generation {} without history; '
+                              'call record_history first'.format(generation))
+
+        self._restore(*self.history.state_at(generation))
+        self.generation = generation
         return self
 
+    def run(self, max_generations, detect_cycles=True,
+            max_history=DEFAULT_MAX_HISTORY):
+        """ Ticks the world up to max_generations times.
+
+        With detect_cycles, stops as soon as a generation repeats one of the
+        last max_history generations and returns the Cycle found, otherwise
+        returns None. Generations that are translations of each other only
+        count as repeats when the world is unbounded (see shrink_bounds),
+        since bounds would eventually stop a spaceship.
+        """
+        detector = None
+        if detect_cycles:
+            detector = CycleDetector(
+                max_history, normalize_translation=self.shrink_bounds)
+            detector.observe(self.generation, self.living_locations)
+
+        for _ in range(max_generations):
+            self.tick()
+
+            if detector is not None:
+                cycle = detector.observe(self.generation,
+                                         self.living_locations)
+                if cycle is not None:
+                    return cycle
+
+        return None
+
     @property
     def is_empty(self):
         return self.living_cell_count == 0
@@ -113,7 +341,7 @@ class World():
 
     @property
     def living_cell_count(self):
-        return len(self._living_cells)
+        return len(self._living_keys)
 
     @property
     def dimensions(self):
@@ -121,20 +349,134 @@ class World():
         y_length = self.max_location.y - self.min_location.y + 1
         return (x_length, y_length)
 
-    @property
-    def _living_cells(self):
-        return [cell
-                for location, cell in self._cells.items()
-                if cell.is_alive]
-
-    def _add_cell(self, cell, location):
-        self._cells[location] = cell
-
-    def _find_cell_at(self, location):
-        cells_at_location = [c
-                             for l, c in self._cells.items()
-                             if l == location]
-        if cells_at_location:
-            return cells_at_location[0]
-        else:
+    def _expand_bounds_to(self, location):
+        if not (self.min_location.x <= location.x <= self.max_location.x and
+                self.min_location.y <= location.y <= self.max_location.y):
+            # Cells next to the old bounds may now be born
+            self._changed_keys = None
+
+        if location.x > self.max_location.x:
+            self.max_location = Location(location.x, self.max_location.y)
+
+        if location.y > self.max_location.y:
+            self.max_location = Location(self.max_location.x, location.y)
+
+        if location.x < self.min_location.x:
+            self.min_location = Location(location.x, self.min_location.y)
+
+        if location.y < self.min_location.y:
+            self.min_location = Location(self.min_location.x, location.y)
+
+    def _living_key_iterable(self):
+        """ Returns iterable of the keys of living cells, for History """
+        return self._living_keys
+
+    def _restore(self, living_keys, min_location, max_location):
+        """ Replaces living cells and bounds by given ones from History """
+        self._living_keys = living_keys
+        self.min_location = min_location
+        self.max_location = max_location
+        self._changed_keys = None
+        self._index = None
+
+    def _commit(self, next_living_keys):
+        """ Makes given keys the living ones, returning the sets of keys
+        born and died. Engines only give births within bounds, unless bounds
+        shrink, in which case they are recomputed anyway.
+        """
+        deaths = self._living_keys - next_living_keys
+        births = next_living_keys - self._living_keys
+        self._living_keys = next_living_keys
+        if self._index is not None:
+            self._index.update(births, deaths)
+
+        if self.shrink_bounds:
+            self._shrink_bounds()
+
+        return births, deaths
+
+    def _commit_changes(self, births, deaths):
+        """ Applies given sets of keys born and died, returning them """
+        self._living_keys.difference_update(deaths)
+        self._living_keys.update(births)
+        if self._index is not None:
+            self._index.update(births, deaths)
+
+        if self.shrink_bounds:
+            self._shrink_bounds()
+
+        return births, deaths
+
+    def _mark_edited(self, key, alive):
+        """ Notes that the cell of given key was set living or dead outside
+        of a tick """
+        if self._changed_keys is not None:
+            self._changed_keys.add(key)
+
+        if self._index is not None:
+            if alive:
+                self._index.add(key)
+            else:
+                self._index.discard(key)
+
+        if self.history is not None:
+            self.history.mark_edited()
+
+    def _mark_bulk_edited(self):
+        """ Notes that any number of cells were set outside of a tick """
+        self._changed_keys = None
+        self._index = None
+        if self.history is not None:
+            self.history.mark_edited()
+
+    def _spatial_index(self):
+        if self._index is None:
+            self._index = ChunkIndex(self._living_keys)
+
+        return self._index
+
+    def _bounds_within(self, min_location, max_location):
+        """ Returns given bounds clipped to the world's, as a
+        (min_location, max_location) pair, or None when they do not overlap
+        """
+        min_location = Location(max(min_location.x, self.min_location.x),
+                                max(min_location.y, self.min_location.y))
+        max_location = Location(min(max_location.x, self.max_location.x),
+                                min(max_location.y, self.max_location.y))
+        if min_location.x > max_location.x or min_location.y > max_location.y:
             return None
+
+        return min_location, max_location
+
+    def _new_tick_stats(self):
+        """ Returns TickStats for the next tick to fill in, or None when no
+        stats are wanted """
+        if self.collect_stats or self.tick_hooks:
+            return TickStats()
+
+        return None
+
+    def _record_tick_stats(self, stats, birth_count, death_count):
+        x_length, y_length = self.dimensions
+        stats.generation = self.generation
+        stats.births = birth_count
+        stats.deaths = death_count
+        stats.population = self.living_cell_count
+        stats.bounding_box_area = x_length * y_length
+
+        self.last_tick_stats = stats
+        for hook in self.tick_hooks:
+            hook(stats)
+
+    def _shrink_bounds(self):
+        """ Fits bounds tightly around living cells, plus the bounds margin.
+        Bounds of an empty world are left as they are.
+        """
+        if not self._living_keys:
+            return
+
+        x_coordinates, y_coordinates = zip(*map(unpack, self._living_keys))
+        self.min_location = Location(min(x_coordinates) - self.bounds_margin,
+                                     min(y_coordinates) - self.bounds_margin)
+        self.max_location = Location(max(x_coordinates) + self.bounds_margin,
+                                     max(y_coordinates) + self.bounds_margin)
@@ -1,4 +1,5 @@
-from .location import LocationGrid
+from .location import Location
+from .rows import x_indexes_by_y
 
 LIVE_CELL_CHAR = ' +'
 DEAD_CELL_CHAR = ' -'
@@ -8,27 +9,59 @@ class WorldRenderer():
     def __init__(self, world):
         self.world = world
 
-    def render(self):
-        living_locations = self.world.living_locations
+    def render(self, viewport=None):
+        """ Returns rendering of the world, or of given viewport only.
 
-        rendering = ''
+        args:
+            viewport: optional (min_location, max_location) tuple bounding
+                the rendered rectangle, which may extend beyond the world
+        """
+        return '\n'.join(self.render_rows(viewport))
 
-        location_grid = LocationGrid(self.world.min_location,
-                                     self.world.max_location)
+    def render_rows(self, viewport=None):
+        """ Returns generator of rendered rows, from the highest y coordinate
+        down
+        """
+        if viewport is None:
+            return self._render_world_rows()
+        else:
+            return self._render_viewport_rows(*viewport)
 
-        for y_coordinate, y_row_locations in location_grid.rows.items():
-            if y_coordinate != self.world.max_location.y:
-                rendering += '\n'
+    def write(self, file, viewport=None):
+        """ Writes rendering to given file object one row at a time """
+        for row_number, row in enumerate(self.render_rows(viewport)):
+            if row_number:
+                file.write('\n')
 
-            rendering += self._render_row(y_row_locations, living_locations)
+            file.write(row)
 
-        return rendering
+    def _render_world_rows(self):
+        """ Renders the world's bounds from living x coordinates indexed by
+        row, in time proportional to the population plus the rendered area.
+        """
+        min_location, max_location = (self.world.min_location,
+                                      self.world.max_location)
+        living_x_indexes = x_indexes_by_y(self.world.living_locations,
+                                          min_location.x)
 
-    def _render_row(self, row_locations, living_locations):
-        rendering = ''
+        width = max_location.x - min_location.x + 1
+        for y_coordinate in range(max_location.y, min_location.y - 1, -1):
+            row = [DEAD_CELL_CHAR] * width
+            for x_index in living_x_indexes.get(y_coordinate, ()):
+                row[x_index] = LIVE_CELL_CHAR
 
-        for location in row_locations:
-            is_alive = location in living_locations
-            rendering += LIVE_CELL_CHAR if is_alive else DEAD_CELL_CHAR
+            yield ''.join(row)
 
-        return rendering
+    def _render_viewport_rows(self, min_location, max_location):
+        """ Renders given rectangle by looking up every location in it, so
+        nothing outside of it is visited.
+        """
+        is_alive_at = self.world.is_alive_at
+        live_cell_char, dead_cell_char = LIVE_CELL_CHAR, DEAD_CELL_CHAR
+        x_range = range(min_location.x, max_location.x + 1)
+
+        for y_coordinate in range(max_location.y, min_location.y - 1, -1):
+            yield ''.join([live_cell_char
+                           if is_alive_at(Location(x_coordinate, y_coordinate))
+                           else dead_cell_char
+                           for x_coordinate in x_range])
@@ -1,24 +1,111 @@
-import os
+import argparse
 
+from game_of_life.animation import DEFAULT_FRAME_DELAY, generations, save_gif
 from game_of_life.location import Location
-from game_of_life.turn_renderings import turn_renderings
+from game_of_life.terminal_display import TerminalDisplay
 from game_of_life.world import World
 
 
-def clear_stdout():
-    os.system('clear')
-
-
-def play_demo():
+def play_demo(turns=20, fps=None, headless=False, stats=False,
+              pipeline=False, drop_frames=False, gif=None):
     """
-    Plays demo of Game of Life over 20 turns to stdout.
+    Plays demo of Game of Life over given number of turns to stdout.
     """
     world = World.random(min_location=Location(0, 0),
                          max_location=Location(20, 20),
                          cell_count=50)
+    world.collect_stats = stats
+
+    if gif is not None:
+        delay = round(100 / fps) if fps else DEFAULT_FRAME_DELAY
+        with open(gif, 'wb') as file:
+            save_gif(generations(world, turns), file, delay=delay)
+
+        return
+
+    if pipeline:
+        display = _play_pipeline(world, turns, fps, headless, stats,
+                                 drop_frames)
+    else:
+        display = _play(world, turns, fps, headless, stats)
+
+    display.finish()
+
+    if headless:
+        print('{:.1f} generations/sec'.format(display.frames_per_second))
+
+
+def _play(world, turns, fps, headless, stats):
+    display = TerminalDisplay(fps=fps, headless=headless)
+
+    for turn in range(0, turns + 1):
+        title = 'Turn {}:'.format(turn)
+        if turn > 0:
+            world = world.tick()
+
+            if stats:
+                title += ' ' + str(world.last_tick_stats)
+                if headless:
+                    print(world.last_tick_stats)
+
+        display.show(world, title=title)
+
+    return display
+
+
+def _play_pipeline(world, turns, fps, headless, stats, drop_frames):
+    """ Plays through a FramePipeline, so that generations are computed
+    ahead of drawing them while frames are paced to fps. """
+    # Only imported when used, as the pipeline needs asyncio from Python 3.7
+    from game_of_life.frame_pipeline import (BACKPRESSURE, DROP_FRAMES,
+                                             FramePipeline)
+
+    display = TerminalDisplay(headless=headless)
+
+    def draw(frame):
+        if headless:
+            return ''
+
+        title = 'Turn {}:'.format(frame.generation)
+        if stats and frame.tick_stats is not None:
+            title += ' ' + str(frame.tick_stats)
+
+        return display.draw(frame, title=title)
+
+    def show(rendered_frame):
+        if stats and headless and rendered_frame.frame.tick_stats is not None:
+            print(rendered_frame.frame.tick_stats)
+
+        display.write(rendered_frame.rendering)
+
+    overflow = DROP_FRAMES if drop_frames else BACKPRESSURE
+    FramePipeline(world, turns, render=draw, overflow=overflow,
+                  fps=fps).run(show)
+    return display
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=play_demo.__doc__)
+    parser.add_argument('--turns', type=int, default=20)
+    parser.add_argument('--fps', type=float, default=None,
+                        help='target frames per second')
+    parser.add_argument('--headless', action='store_true',
+                        help='skip output and report generations per second')
+    parser.add_argument('--stats', action='store_true',
+                        help='print per-tick stats')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='compute generations ahead of drawing them')
+    parser.add_argument('--drop-frames', action='store_true',
+                        help='with --pipeline, drop frames drawing cannot '
+                             'keep up with instead of slowing down ticks')
+    parser.add_argument('--gif', default=None,
+                        help='write turns to given file as an animated GIF '
+                             'instead of drawing them')
+    return parser.parse_args()
 
-    for rendering in turn_renderings(world, turns=20):
-        clear_stdout()
-        print(rendering)
 
-play_demo()
+if __name__ == '__main__':
+    args = parse_args()
+    play_demo(turns=args.turns, fps=args.fps, headless=args.headless,
+              stats=args.stats, pipeline=args.pipeline,
+              drop_frames=args.drop_frames, gif=args.gif)
@@ -0,0 +1,244 @@
+import io
+import os
+from random import Random
+import struct
+import tempfile
+import unittest
+import zlib
+
+from game_of_life.animation import (generations, lzw_encode, pack_rows,
+                                    save_gif, save_png_frames, write_png)
+from game_of_life.location import Location
+from game_of_life.world import World
+
+
+def _lzw_decode(data, min_code_size):
+    """ Plain GIF LZW decoder, written after the specification """
+    clear_code = 1 << min_code_size
+    end_code = clear_code + 1
+    bits = int.from_bytes(data, 'little')
+    position = 0
+    code_size = min_code_size + 1
+    table = []
+    previous = None
+    output = bytearray()
+
+    while True:
+        code = bits >> position & ((1 << code_size) - 1)
+        position += code_size
+        if code == clear_code:
+            table = [bytes([index]) for index in range(clear_code)]
+            table += [b'', b'']
+            code_size = min_code_size + 1
+            previous = None
+            continue
+
+        if code == end_code:
+            return bytes(output)
+
+        if code < len(table):
+            entry = table[code]
+            if previous is not None and len(table) < 4096:
+                table.append(previous + entry[:1])
+        else:
+            entry = previous + previous[:1]
+            table.append(entry)
+
+        output += entry
+        previous = entry
+        if len(table) == 1 << code_size and code_size < 12:
+            code_size += 1
+
+
+def _read_gif(data):
+    """ Returns (width, height, frames) of a GIF, frames being a list of
+    (delay, rectangle, canvas) tuples, canvas being the whole image as a
+    bytearray of colour indexes once the frame is drawn """
+    assert data[:6] == b'GIF89a'
+    width, height, flags = struct.unpack('<HHB', data[6:11])
+    position = 13 + 3 * (2 << (flags & 7))
+    canvas = bytearray(width * height)
+    frames = []
+    delay = None
+
+    while data[position] != 0x3b:
+        if data[position] == 0x21:
+            label = data[position + 1]
+            position += 2
+            if label == 0xf9:
+                delay, = struct.unpack('<H', data[position + 2:position + 4])
+            while data[position]:
+                position += data[position] + 1
+            position += 1
+            continue
+
+        left, top, frame_width, frame_height = struct.unpack(
+            '<HHHH', data[position + 1:position + 9])
+        min_code_size = data[position + 10]
+        position += 11
+        lzw_data = bytearray()
+        while data[position]:
+            lzw_data += data[position + 1:position + 1 + data[position]]
+            position += data[position] + 1
+        position += 1
+
+        pixels = _lzw_decode(lzw_data, min_code_size)
+        assert len(pixels) == frame_width * frame_height
+        for y in range(frame_height):
+            start = (top + y) * width + left
+            canvas[start:start + frame_width] = pixels[
+                y * frame_width:(y + 1) * frame_width]
+
+        frames.append((delay, (left, top, frame_width, frame_height),
+                       bytes(canvas)))
+
+    return width, height, frames
+
+
+def _expected_canvas(world, min_location, max_location, cell_size):
+    width = (max_location.x - min_location.x + 1) * cell_size
+    height = (max_location.y - min_location.y + 1) * cell_size
+    canvas = bytearray(width * height)
+    for y in range(height):
+        for x in range(width):
+            location = Location(min_location.x + x // cell_size,
+                                max_location.y - y // cell_size)
+            canvas[y * width + x] = world.is_alive_at(location)
+
+    return bytes(canvas)
+
+
+def _glider_world():
+    return World.from_locations(
+        [Location(1, 4), Location(2, 3), Location(0, 2), Location(1, 2),
+         Location(2, 2)], min_location=Location(0, 0),
+        max_location=Location(9, 7))
+
+
+class LzwTestCase(unittest.TestCase):
+    def test_round_trips(self):
+        # Random indexes fill the code table up, so that it gets cleared
+        rng = Random(1)
+        samples = [b'', b'\x00', b'\x01\x01\x01\x01\x01\x01\x01',
+                   bytes(i * 7 % 3 for i in range(5000)),
+                   bytes(rng.getrandbits(1) for _ in range(50000)),
+                   bytes(20000)]
+        for sample in samples:
+            with self.subTest(length=len(sample)):
+                self.assertEqual(_lzw_decode(lzw_encode(sample, 2), 2),
+                                 sample)
+
+
+class PackRowsTestCase(unittest.TestCase):
+    def test_rows_run_down_from_highest_y(self):
+        world = World.from_locations([Location(0, 0), Location(2, 1),
+                                      Location(5, 5)])
+        rows = pack_rows(world, Location(0, 0), Location(2, 1))
+        self.assertEqual(rows, [0b100, 0b001])
+
+
+class GifTestCase(unittest.TestCase):
+    def test_frames_match_generations(self):
+        world = _glider_world()
+        expected = []
+        for generation in generations(_glider_world(), 8):
+            expected.append(_expected_canvas(generation, Location(0, 0),
+                                             Location(9, 7), 2))
+
+        file = io.BytesIO()
+        frame_count = save_gif(generations(world, 8), file, cell_size=2,
+                               delay=5)
+        width, height, frames = _read_gif(file.getvalue())
+
+        self.assertEqual((width, height), (20, 16))
+        self.assertEqual(frame_count, 9)
+        self.assertEqual([canvas for _, _, canvas in frames], expected)
+        self.assertEqual({delay for delay, _, _ in frames}, {5})
+
+    def test_frames_only_cover_changes(self):
+        world = World.from_locations(
+            [Location(1, 1), Location(2, 1), Location(3, 1),
+             Location(10, 10), Location(11, 10), Location(10, 11),
+             Location(11, 11)], min_location=Location(0, 0),
+            max_location=Location(29, 29))
+
+        file = io.BytesIO()
+        save_gif(generations(world, 2), file, cell_size=1)
+        _, _, frames = _read_gif(file.getvalue())
+
+        rectangles = [rectangle for _, rectangle, _ in frames]
+        self.assertEqual(rectangles, [(0, 0, 30, 30), (1, 27, 3, 3),
+                                      (1, 27, 3, 3)])
+
+    def test_repeated_generations_extend_delay(self):
+        world = World.from_locations([Location(0, 0), Location(1, 0),
+                                      Location(0, 1), Location(1, 1)])
+
+        file = io.BytesIO()
+        frame_count = save_gif(generations(world, 3), file, delay=4)
+        _, _, frames = _read_gif(file.getvalue())
+
+        self.assertEqual(frame_count, 1)
+        self.assertEqual([delay for delay, _, _ in frames], [16])
+
+    def test_needs_a_generation(self):
+        with self.assertRaises(ValueError):
+            save_gif([], io.BytesIO())
+
+
+class PngTestCase(unittest.TestCase):
+    def _read_png(self, data):
+        self.assertEqual(data[:8], b'\x89PNG\r\n\x1a\n')
+        chunks = {}
+        position = 8
+        while position < len(data):
+            length, = struct.unpack('>I', data[position:position + 4])
+            chunk_type = data[position + 4:position + 8]
+            chunk_data = data[position + 8:position + 8 + length]
+            crc, = struct.unpack('>I', data[position + 8 + length:
+                                            position + 12 + length])
+            self.assertEqual(crc, zlib.crc32(chunk_type + chunk_data))
+            chunks[chunk_type] = chunk_data
+            position += length + 12
+
+        width, height, bit_depth, color_type = struct.unpack(
+            '>IIBB', chunks[b'IHDR'][:10])
+        self.assertEqual((bit_depth, color_type), (1, 3))
+
+        raw = zlib.decompress(chunks[b'IDAT'])
+        row_length = (width + 7) // 8 + 1
+        pixels = bytearray()
+        for y in range(height):
+            row = raw[y * row_length:(y + 1) * row_length]
+            self.assertEqual(row[0], 0)
+            bits = int.from_bytes(row[1:], 'big')
+            pixels += bytes(bits >> (8 * (row_length - 1) - 1 - x) & 1
+                            for x in range(width))
+
+        return width, height, bytes(pixels)
+
+    def test_pixels_match_world(self):
+        world = _glider_world()
+        file = io.BytesIO()
+        write_png(pack_rows(world, world.min_location, world.max_location),
+                  10, file, cell_size=3)
+
+        width, height, pixels = self._read_png(file.getvalue())
+        self.assertEqual((width, height), (30, 24))
+        self.assertEqual(pixels, _expected_canvas(
+            world, world.min_location, world.max_location, 3))
+
+    def test_saves_numbered_frames(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path_format = os.path.join(directory, 'frame_{:02}.png')
+            frame_count = save_png_frames(
+                generations(_glider_world(), 2), path_format,
+                viewport=(Location(0, 0), Location(4, 4)), cell_size=1)
+
+            self.assertEqual(frame_count, 3)
+            self.assertEqual(sorted(os.listdir(directory)),
+                             ['frame_00.png', 'frame_01.png',
+                              'frame_02.png'])
+            with open(path_format.format(2), 'rb') as file:
+                width, height, _ = self._read_png(file.read())
+            self.assertEqual((width, height), (5, 5))
@@ -0,0 +1,39 @@
+import unittest
+
+from benchmarks import runner
+from benchmarks.workloads import empty_box, soup
+
+
+def _results(rates):
+    return {'results': [{'workload': workload, 'operation': 'tick',
+                         'generations_per_sec': rate}
+                        for workload, rate in rates.items()]}
+
+
+class RunTestCase(unittest.TestCase):
+    def test_reports_every_operation_for_every_workload(self):
+        results = runner.run(generations=1, repeats=1,
+                             workloads=[soup(8, 0.3), empty_box(8)])
+        reported = {(result['workload'], result['operation'])
+                    for result in results['results']}
+        self.assertEqual(reported, {(workload, operation)
+                                    for workload in ['soup-8x8-0.3',
+                                                     'empty-8x8']
+                                    for operation in runner.OPERATIONS})
+
+        for result in results['results']:
+            self.assertGreater(result['generations_per_sec'], 0)
+            self.assertGreater(result['cells_per_sec'], 0)
+            self.assertGreaterEqual(result['peak_memory_bytes'], 0)
+
+
+class CompareTestCase(unittest.TestCase):
+    def test_flags_slowdowns_above_threshold(self):
+        baseline = _results({'a': 100.0, 'b': 100.0, 'c': 100.0})
+        current = _results({'a': 95.0, 'b': 50.0, 'c': 200.0})
+        self.assertEqual(runner.compare(baseline, current, threshold=0.1),
+                         [('b', 'tick', 0.5)])
+
+    def test_ignores_results_missing_from_baseline(self):
+        self.assertEqual(runner.compare(_results({}), _results({'a': 1.0})),
+                         [])
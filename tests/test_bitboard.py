@@ -0,0 +1,196 @@
+import unittest
+
+from game_of_life.bitboard import Bitboard, BitboardWorld
+from game_of_life.history import History
+from game_of_life.location import Location
+from game_of_life.render_to_world import render_to_world
+from game_of_life.turn_renderings import turn_renderings
+from game_of_life.world import World
+from game_of_life.world_renderer import WorldRenderer
+
+from .test_world_renderer import RenderingTestsMixin
+
+
+class BitboardTestCase(unittest.TestCase):
+    def test_locations_round_trip(self):
+        locations = {Location(-2, 3), Location(0, 0), Location(4, 3)}
+        bitboard = Bitboard.from_locations(locations, Location(-2, 0),
+                                           Location(4, 3))
+        self.assertEqual(set(bitboard.locations()), locations)
+        self.assertEqual(bitboard.population, 3)
+
+    def test_cannot_set_alive_outside_of_bounds(self):
+        bitboard = Bitboard(Location(0, 0), Location(1, 1))
+        with self.assertRaises(ValueError):
+            bitboard.set_alive_at(Location(2, 0), True)
+
+    def test_resized_keeps_locations_within_new_bounds(self):
+        bitboard = Bitboard.from_locations([Location(0, 0), Location(3, 3)],
+                                           Location(0, 0), Location(3, 3))
+        resized = bitboard.resized(Location(-2, -1), Location(2, 2))
+        self.assertEqual(set(resized.locations()), {Location(0, 0)})
+
+    def test_blinker_oscillates(self):
+        bitboard = Bitboard.from_locations(
+            [Location(0, 1), Location(1, 1), Location(2, 1)],
+            Location(0, 0), Location(2, 2))
+        bitboard.tick()
+        self.assertEqual(set(bitboard.locations()),
+                         {Location(1, 0), Location(1, 1), Location(1, 2)})
+
+    def test_uses_about_one_bit_per_cell(self):
+        size = 1024
+        locations = [Location(x, y)
+                     for y in range(size) for x in range(0, size, 2)]
+        bitboard = Bitboard.from_locations(locations, Location(0, 0),
+                                           Location(size - 1, size - 1))
+
+        # a bool array takes 1 byte per cell, a bit per cell is 0.125
+        self.assertLess(bitboard.bytes_per_cell, 0.2)
+
+
+class BitboardWorldTestCase(unittest.TestCase, RenderingTestsMixin):
+    def test_a_cell_can_be_added_and_set_dead(self):
+        world = BitboardWorld()
+        world.set_living_at(Location(0, 0))
+        self.assertTrue(world.is_alive_at(Location(0, 0)))
+
+        world.set_dead_at(Location(0, 0))
+        self.assertTrue(world.is_empty)
+
+    def test_set_living_at_beyond_bounds_grows_world(self):
+        world = BitboardWorld(min_location=Location(0, 0),
+                              max_location=Location(3, 3))
+        world.set_living_at(Location(1, 1))
+        world.set_living_at(Location(-2, 6))
+
+        self.assertEqual(world.dimensions, (6, 7))
+        self.assertEqual(set(world.living_locations),
+                         {Location(1, 1), Location(-2, 6)})
+
+    def test_renders_after_tick(self):
+        self.set_living_and_dead_cells_to_plus_and_minus()
+        world = BitboardWorld.from_world(render_to_world('++-+\n' +
+                                                         '+-++\n' +
+                                                         '++-+\n' +
+                                                         '-+--'))
+        world.tick()
+        expected_render_after_tick = ('++-+\n' +
+                                      '---+\n' +
+                                      '+--+\n' +
+                                      '+++-')
+        self.assertEqual(WorldRenderer(world).render(),
+                         expected_render_after_tick)
+
+    def test_bulk_setters_match_world(self):
+        locations = [Location(x, x * 2 - 7) for x in range(-4, 9)]
+        world = World.from_locations(locations)
+        bitboard_world = BitboardWorld.from_locations(locations)
+        world.set_dead_many(locations[::3])
+        bitboard_world.set_dead_many(locations[::3])
+
+        self.assertEqual(set(bitboard_world.living_locations),
+                         set(world.living_locations))
+        self.assertEqual(bitboard_world.dimensions, world.dimensions)
+
+    def test_random_world(self):
+        world = BitboardWorld.random(min_location=Location(-3, -2),
+                                     max_location=Location(40, 9),
+                                     density=0.5)
+        self.assertEqual(world.living_cell_count, 44 * 12 // 2)
+        self.assertEqual(world.dimensions, (44, 12))
+
+    def test_ticks_match_world_ticks(self):
+        world = World.random(min_location=Location(-10, -5),
+                             max_location=Location(20, 15),
+                             cell_count=200)
+        bitboard_world = BitboardWorld.from_world(world)
+
+        for turn in range(20):
+            with self.subTest(turn=turn):
+                world.tick()
+                bitboard_world.tick()
+                self.assertEqual(set(bitboard_world.living_locations),
+                                 set(world.living_locations))
+
+        self.assertEqual(set(bitboard_world.to_world().living_locations),
+                         set(world.living_locations))
+
+    def test_region_queries_match_world(self):
+        world = World.random(min_location=Location(-10, -5),
+                             max_location=Location(20, 15),
+                             cell_count=200)
+        bitboard_world = BitboardWorld.from_world(world)
+
+        for min_location, max_location in [
+                (Location(-3, -2), Location(7, 30)),
+                (Location(-50, -50), Location(50, 50)),
+                (Location(30, 30), Location(40, 40))]:
+            with self.subTest(min_location=min_location,
+                              max_location=max_location):
+                self.assertEqual(
+                    bitboard_world.count_living_in(min_location,
+                                                   max_location),
+                    world.count_living_in(min_location, max_location))
+                self.assertEqual(
+                    set(bitboard_world.living_in(min_location,
+                                                 max_location)),
+                    set(world.living_in(min_location, max_location)))
+
+    def test_seek_restores_recorded_generations(self):
+        world = BitboardWorld.from_world(World.random(
+            min_location=Location(-10, -5), max_location=Location(20, 15),
+            cell_count=200))
+        world.record_history(History(keyframe_interval=4))
+        generations = [set(world.living_locations)]
+        for turn in range(10):
+            if turn == 5:
+                world.set_living_at(Location(25, 20))
+            world.tick()
+            generations.append(set(world.living_locations))
+
+        for generation in [7, 0, 10, 3]:
+            with self.subTest(generation=generation):
+                world.seek(generation)
+                self.assertEqual(set(world.living_locations),
+                                 generations[generation])
+
+        world.tick()
+        self.assertEqual(set(world.living_locations), generations[4])
+
+    def test_turns_are_recorded(self):
+        world = BitboardWorld.from_world(render_to_world('---\n'
+                                                         '+++\n'
+                                                         '---'))
+        history = History()
+        list(turn_renderings(world, turns=3, history=history))
+
+        world.seek(1)
+        self.assertEqual(set(world.living_locations),
+                         {Location(1, 0), Location(1, 1), Location(1, 2)})
+
+    def test_collects_same_stats_as_world(self):
+        world = World.random(min_location=Location(-10, -5),
+                             max_location=Location(20, 15),
+                             cell_count=200)
+        bitboard_world = BitboardWorld.from_world(world)
+        recorded = []
+        bitboard_world.add_tick_hook(recorded.append)
+        world.collect_stats = True
+
+        for _ in range(3):
+            world.tick()
+            bitboard_world.tick()
+            expected, actual = world.last_tick_stats, recorded[-1]
+            self.assertIs(bitboard_world.last_tick_stats, actual)
+            self.assertEqual(
+                (actual.generation, actual.births, actual.deaths,
+                 actual.population, actual.bounding_box_area),
+                (expected.generation, expected.births, expected.deaths,
+                 expected.population, expected.bounding_box_area))
+
+    def test_bulk_setters_take_coordinate_pairs(self):
+        world = BitboardWorld.empty()
+        world.set_living_many([(1, 1), (2, 1)])
+        world.set_dead_many([(1, 1)])
+        self.assertEqual(world.living_locations, [Location(2, 1)])
@@ -53,3 +53,8 @@ class CellTestCase(unittest.TestCase):
         gt_fertile_count = Cell.FERTILE_NEIGHBOR_COUNT + 1
         is_alive_next_gen = cell.is_alive_next_generation(gt_fertile_count)
         self.assertFalse(is_alive_next_gen)
+
+    def test_overriding_neighbor_constants_is_deprecated(self):
+        with self.assertWarns(DeprecationWarning):
+            class HighLifeCell(Cell):
+                FERTILE_NEIGHBOR_COUNT = 6
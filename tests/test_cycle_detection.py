@@ -0,0 +1,101 @@
+import unittest
+
+from game_of_life.cycle_detection import Cycle, CycleDetector
+from game_of_life.location import Location
+from game_of_life.world import World
+
+BLOCK = [Location(0, 0), Location(1, 0), Location(0, 1), Location(1, 1)]
+BLINKER = [Location(-1, 0), Location(0, 0), Location(1, 0)]
+GLIDER = [Location(1, 0), Location(2, 1), Location(0, 2), Location(1, 2),
+          Location(2, 2)]
+
+
+def _world_with(locations, **kwargs):
+    world = World(min_location=Location(-10, -10),
+                  max_location=Location(10, 10), **kwargs)
+    for location in locations:
+        world.set_living_at(location)
+
+    return world
+
+
+class CycleDetectorTestCase(unittest.TestCase):
+    def test_new_generations_are_not_cycles(self):
+        detector = CycleDetector()
+        self.assertIsNone(detector.observe(0, BLOCK))
+        self.assertIsNone(detector.observe(1, BLINKER))
+
+    def test_repeated_generation_closes_cycle(self):
+        detector = CycleDetector()
+        detector.observe(3, BLOCK)
+        detector.observe(4, BLINKER)
+        self.assertEqual(detector.observe(5, BLOCK), Cycle(3, 2, (0, 0)))
+
+    def test_translated_generation_closes_cycle_with_offset(self):
+        detector = CycleDetector()
+        detector.observe(0, BLOCK)
+        translated = [Location(l.x + 2, l.y - 1) for l in BLOCK]
+        self.assertEqual(detector.observe(1, translated), Cycle(0, 1, (2, -1)))
+
+    def test_translated_generation_ignored_without_normalization(self):
+        detector = CycleDetector(normalize_translation=False)
+        detector.observe(0, BLOCK)
+        translated = [Location(l.x + 2, l.y - 1) for l in BLOCK]
+        self.assertIsNone(detector.observe(1, translated))
+
+    def test_remembers_digests_rather_than_cells(self):
+        detector = CycleDetector()
+        detector.observe(0, [Location(x, 0) for x in range(1000)])
+        (key, value), = detector._history.items()
+        self.assertEqual(len(key), 16)
+        self.assertEqual(value, (0, (0, 0), 1000))
+
+    def test_same_cells_in_another_shape_do_not_close_cycle(self):
+        detector = CycleDetector()
+        detector.observe(0, [Location(0, 0), Location(2, 0), Location(1, 1)])
+        self.assertIsNone(detector.observe(
+            1, [Location(0, 0), Location(1, 1), Location(0, 2)]))
+
+    def test_forgets_generations_beyond_max_history(self):
+        detector = CycleDetector(max_history=1)
+        detector.observe(0, BLOCK)
+        detector.observe(1, BLINKER)
+        self.assertIsNone(detector.observe(2, BLOCK))
+
+
+class CycleTestCase(unittest.TestCase):
+    def test_equivalent_generation(self):
+        cycle = Cycle(start_generation=10, period=4, offset=(1, 1))
+        self.assertEqual(cycle.equivalent_generation(10), (10, (0, 0)))
+        self.assertEqual(cycle.equivalent_generation(23), (11, (3, 3)))
+
+
+class WorldRunTestCase(unittest.TestCase):
+    def test_runs_max_generations_without_cycle(self):
+        world = _world_with(GLIDER)
+        self.assertIsNone(world.run(5, detect_cycles=False))
+        self.assertEqual(world.generation, 5)
+
+    def test_still_life_stops_after_one_generation(self):
+        world = _world_with(BLOCK)
+        self.assertEqual(world.run(100), Cycle(0, 1, (0, 0)))
+        self.assertEqual(world.generation, 1)
+
+    def test_blinker_has_period_two(self):
+        world = _world_with(BLINKER)
+        self.assertEqual(world.run(100), Cycle(0, 2, (0, 0)))
+
+    def test_dying_world_cycles_once_empty(self):
+        world = _world_with([Location(0, 0)])
+        self.assertEqual(world.run(100), Cycle(1, 1, (0, 0)))
+
+    def test_glider_is_caught_in_unbounded_world(self):
+        world = _world_with(GLIDER, shrink_bounds=True)
+        self.assertEqual(world.run(100), Cycle(0, 4, (1, 1)))
+
+    def test_glider_is_not_caught_in_bounded_world(self):
+        world = _world_with(GLIDER)
+        cycle = world.run(100)
+        # the glider ends up as a block in a corner of the world
+        self.assertEqual(cycle.period, 1)
+        self.assertGreater(cycle.start_generation, 4)
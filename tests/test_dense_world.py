@@ -0,0 +1,185 @@
+import unittest
+
+from game_of_life.dense_world import DenseWorld, numpy
+from game_of_life.history import History
+from game_of_life.location import Location
+from game_of_life.render_to_world import render_to_world
+from game_of_life.rule import Rule
+from game_of_life.turn_renderings import turn_renderings
+from game_of_life.world import World
+from game_of_life.world_renderer import WorldRenderer
+
+from .test_world_renderer import RenderingTestsMixin
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class DenseWorldTestCase(unittest.TestCase, RenderingTestsMixin):
+    def setUp(self):
+        self.location = Location(0, 0)
+
+    def test_a_new_world_is_empty(self):
+        self.assertTrue(DenseWorld().is_empty)
+
+    def test_a_cell_can_be_added_and_set_dead(self):
+        world = DenseWorld()
+        world.set_living_at(self.location)
+        self.assertTrue(world.is_alive_at(self.location))
+
+        world.set_dead_at(self.location)
+        self.assertFalse(world.is_alive_at(self.location))
+
+    def test_locations_outside_of_board_are_not_alive(self):
+        world = DenseWorld()
+        self.assertFalse(world.is_alive_at(Location(100, -100)))
+
+    def test_set_living_at_beyond_bounds_grows_world(self):
+        world = DenseWorld(min_location=Location(0, 0),
+                           max_location=Location(3, 3))
+        world.set_living_at(Location(1, 1))
+        world.set_living_at(Location(-2, 6))
+
+        self.assertEqual(world.dimensions, (6, 7))
+        self.assertEqual(set(world.living_locations),
+                         {Location(1, 1), Location(-2, 6)})
+
+    def test_living_cell_count_only_counts_living_cells(self):
+        world = DenseWorld(min_location=Location(0, 0),
+                           max_location=Location(3, 3))
+        world.set_living_at(Location(1, 1))
+        world.set_living_at(Location(2, 1))
+        self.assertEqual(world.living_cell_count, 2)
+        self.assertEqual(world.dead_cell_count, 14)
+
+    def test_ticks_account_for_world_prior_to_any_tick_changes(self):
+        self.set_living_and_dead_cells_to_plus_and_minus()
+        world = DenseWorld.from_world(render_to_world('++-+\n' +
+                                                      '+-++\n' +
+                                                      '++-+\n' +
+                                                      '-+--'))
+        world.tick()
+        expected_render_after_tick = ('++-+\n' +
+                                      '---+\n' +
+                                      '+--+\n' +
+                                      '+++-')
+        self.assertEqual(WorldRenderer(world).render(),
+                         expected_render_after_tick)
+
+    def test_ticks_follow_world_rule(self):
+        world = World.random(min_location=Location(-10, -5),
+                             max_location=Location(20, 15),
+                             cell_count=200, rule=Rule.from_string('B36/S23'))
+        dense_world = DenseWorld.from_world(world)
+
+        for _ in range(10):
+            world.tick()
+            dense_world.tick()
+
+        self.assertEqual(set(dense_world.living_locations),
+                         set(world.living_locations))
+
+    def test_bulk_setters_match_world(self):
+        locations = [Location(x, x * 2 - 7) for x in range(-4, 9)]
+        world = World.from_locations(locations)
+        dense_world = DenseWorld.from_locations(locations)
+        world.set_dead_many(locations[::3])
+        dense_world.set_dead_many(locations[::3])
+
+        self.assertEqual(set(dense_world.living_locations),
+                         set(world.living_locations))
+        self.assertEqual(dense_world.dimensions, world.dimensions)
+
+    def test_random_world(self):
+        world = DenseWorld.random(min_location=Location(-3, -2),
+                                  max_location=Location(40, 9), density=0.5)
+        self.assertEqual(world.living_cell_count, 44 * 12 // 2)
+        self.assertEqual(world.dimensions, (44, 12))
+
+    def test_ticks_match_world_ticks(self):
+        world = World.random(min_location=Location(-10, -5),
+                             max_location=Location(20, 15),
+                             cell_count=200)
+        dense_world = DenseWorld.from_world(world)
+
+        for turn in range(20):
+            with self.subTest(turn=turn):
+                world.tick()
+                dense_world.tick()
+                self.assertEqual(set(dense_world.living_locations),
+                                 set(world.living_locations))
+
+    def test_region_queries_match_world(self):
+        world = World.random(min_location=Location(-10, -5),
+                             max_location=Location(20, 15),
+                             cell_count=200)
+        dense_world = DenseWorld.from_world(world)
+
+        for min_location, max_location in [
+                (Location(-3, -2), Location(7, 30)),
+                (Location(-50, -50), Location(50, 50)),
+                (Location(30, 30), Location(40, 40))]:
+            with self.subTest(min_location=min_location,
+                              max_location=max_location):
+                self.assertEqual(
+                    dense_world.count_living_in(min_location, max_location),
+                    world.count_living_in(min_location, max_location))
+                self.assertEqual(
+                    set(dense_world.living_in(min_location, max_location)),
+                    set(world.living_in(min_location, max_location)))
+
+    def test_seek_restores_recorded_generations(self):
+        world = DenseWorld.from_world(World.random(
+            min_location=Location(-10, -5), max_location=Location(20, 15),
+            cell_count=200))
+        world.record_history(History(keyframe_interval=4))
+        generations = [set(world.living_locations)]
+        for turn in range(10):
+            if turn == 5:
+                world.set_living_at(Location(25, 20))
+            world.tick()
+            generations.append(set(world.living_locations))
+
+        for generation in [7, 0, 10, 3]:
+            with self.subTest(generation=generation):
+                world.seek(generation)
+                self.assertEqual(set(world.living_locations),
+                                 generations[generation])
+
+        world.tick()
+        self.assertEqual(set(world.living_locations), generations[4])
+
+    def test_turns_are_recorded(self):
+        world = DenseWorld.from_world(render_to_world('---\n'
+                                                      '+++\n'
+                                                      '---'))
+        history = History()
+        list(turn_renderings(world, turns=3, history=history))
+
+        world.seek(1)
+        self.assertEqual(set(world.living_locations),
+                         {Location(1, 0), Location(1, 1), Location(1, 2)})
+
+    def test_collects_same_stats_as_world(self):
+        world = World.random(min_location=Location(-10, -5),
+                             max_location=Location(20, 15),
+                             cell_count=200)
+        dense_world = DenseWorld.from_world(world)
+        recorded = []
+        dense_world.add_tick_hook(recorded.append)
+        world.collect_stats = True
+
+        for _ in range(3):
+            world.tick()
+            dense_world.tick()
+            expected, actual = world.last_tick_stats, recorded[-1]
+            self.assertIs(dense_world.last_tick_stats, actual)
+            self.assertEqual(
+                (actual.generation, actual.births, actual.deaths,
+                 actual.population, actual.bounding_box_area),
+                (expected.generation, expected.births, expected.deaths,
+                 expected.population, expected.bounding_box_area))
+
+    def test_bulk_setters_take_coordinate_pairs(self):
+        world = DenseWorld.empty()
+        world.set_living_many([(1, 1), (2, 1)])
+        world.set_dead_many([(1, 1)])
+        self.assertEqual(world.living_locations, [Location(2, 1)])
@@ -0,0 +1,70 @@
+import csv
+import io
+import unittest
+
+from game_of_life.ensemble import (Ensemble, EnsembleStatistics, Soup,
+                                   SoupResult, collect, run_soup)
+
+
+def _ensemble(**kwargs):
+    return Ensemble([0.2, 0.5], runs_per_density=5, size=12,
+                    max_generations=100, seed=42, chunk_size=2, **kwargs)
+
+
+class EnsembleTestCase(unittest.TestCase):
+    def test_soups_are_reproducible_from_master_seed(self):
+        soups = list(_ensemble().soups())
+        self.assertEqual(len(soups), 10)
+        self.assertEqual(soups, list(_ensemble().soups()))
+        self.assertEqual([soup.index for soup in soups], list(range(10)))
+        self.assertEqual(len({soup.seed for soup in soups}), 10)
+        self.assertNotEqual(soups, list(Ensemble([0.2, 0.5], 5, 12, 100,
+                                                 seed=43).soups()))
+
+    def test_results_match_serial_runs(self):
+        ensemble = _ensemble(workers=2)
+        results = sorted(ensemble.results())
+        expected = [run_soup(soup, ensemble.size, ensemble.max_generations)
+                    for soup in ensemble.soups()]
+        self.assertEqual(results, expected)
+        self.assertEqual(sorted(_ensemble(workers=3).results()), expected)
+
+    def test_run_soup_settles(self):
+        result = run_soup(Soup(0, 7, 0.5), size=8, max_generations=500)
+        self.assertIsNotNone(result.lifespan)
+        self.assertGreaterEqual(result.period, 1)
+
+    def test_run_soup_may_not_settle(self):
+        result = run_soup(Soup(0, 7, 0.5), size=40, max_generations=1)
+        self.assertEqual(result.lifespan, None)
+        self.assertEqual(result.period, None)
+
+
+class CollectTestCase(unittest.TestCase):
+    def setUp(self):
+        self.results = [SoupResult(0, 1, 0.5, 12, 30, 2),
+                        SoupResult(1, 2, 0.5, 17, 4, 1),
+                        SoupResult(2, 3, 0.5, None, 50, None),
+                        SoupResult(3, 4, 0.25, 3, 0, 1)]
+
+    def test_histograms(self):
+        statistics = collect(self.results,
+                             statistics=EnsembleStatistics(bin_width=10))
+        self.assertEqual(statistics.run_count, 4)
+        self.assertEqual(statistics.densities, [0.25, 0.5])
+        self.assertEqual(statistics.histogram('lifespan', 0.5), [(10, 2)])
+        self.assertEqual(statistics.histogram('final_population', 0.5),
+                         [(0, 1), (30, 1), (50, 1)])
+        self.assertEqual(statistics.histogram('period', 0.5),
+                         [(1, 1), (2, 1)])
+        self.assertEqual(statistics.histogram('period', 0.75), [])
+        self.assertEqual(statistics.unsettled_counts[0.5], 1)
+
+    def test_writes_csv_rows(self):
+        csv_file = io.StringIO()
+        collect(self.results, csv_file)
+
+        rows = list(csv.reader(io.StringIO(csv_file.getvalue())))
+        self.assertEqual(rows[0], list(SoupResult._fields))
+        self.assertEqual(rows[1], ['0', '1', '0.5', '12', '30', '2'])
+        self.assertEqual(rows[3], ['2', '3', '0.5', '', '50', ''])
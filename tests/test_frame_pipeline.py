@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+
+from game_of_life.engine import Engine
+from game_of_life.frame_pipeline import (DROP_FRAMES, Frame, FramePipeline,
+                                         render_frame)
+from game_of_life.location import Location
+from game_of_life.render_to_world import render_to_world
+from game_of_life.turn_renderings import turn_renderings
+
+from .test_world_renderer import RenderingTestsMixin
+
+WORLD_RENDERING = ('++-+\n' +
+                   '+-++\n' +
+                   '++-+\n' +
+                   '-+--')
+
+
+class FailingEngine(Engine):
+    def next_living_keys(self, *args, **kwargs):
+        raise RuntimeError('tick failed')
+
+
+def _consume(pipeline, delay=0):
+    """ Returns list of the rendered frames of given pipeline, along with the
+    generation its world was at when each of them was consumed """
+    async def consume():
+        rendered_frames = []
+        async for rendered_frame in pipeline.frames():
+            rendered_frames.append((rendered_frame,
+                                    pipeline.world.generation))
+            await asyncio.sleep(delay)
+
+        return rendered_frames
+
+    return asyncio.run(consume())
+
+
+class FramePipelineTestCase(unittest.TestCase, RenderingTestsMixin):
+    def setUp(self):
+        self.set_living_and_dead_cells_to_plus_and_minus()
+
+    def test_frames_match_turn_renderings(self):
+        pipeline = FramePipeline(render_to_world(WORLD_RENDERING), turns=5)
+        actual = ['Turn {}:\n'.format(rendered_frame.frame.generation) +
+                  rendered_frame.rendering
+                  for rendered_frame, _ in _consume(pipeline)]
+        expected = list(turn_renderings(render_to_world(WORLD_RENDERING),
+                                        turns=5))
+        self.assertEqual(actual, expected)
+
+    def test_backpressure_bounds_how_far_ticks_run_ahead(self):
+        world = render_to_world(WORLD_RENDERING)
+        pipeline = FramePipeline(world, turns=30, queue_size=1)
+        rendered_frames = _consume(pipeline, delay=0.001)
+
+        self.assertEqual([rendered_frame.frame.generation
+                          for rendered_frame, _ in rendered_frames],
+                         list(range(31)))
+        for rendered_frame, world_generation in rendered_frames:
+            # One frame queued, one rendering, one in the rendered queue and
+            # one being ticked
+            self.assertLessEqual(
+                world_generation - rendered_frame.frame.generation, 4)
+
+    def test_slow_consumer_drops_frames(self):
+        pipeline = FramePipeline(render_to_world(WORLD_RENDERING), turns=50,
+                                 queue_size=2, overflow=DROP_FRAMES)
+        generations = [rendered_frame.frame.generation
+                       for rendered_frame, _ in _consume(pipeline,
+                                                         delay=0.01)]
+
+        self.assertGreater(pipeline.dropped_frame_count, 0)
+        self.assertEqual(len(generations) + pipeline.dropped_frame_count, 51)
+        self.assertEqual(generations, sorted(generations))
+        self.assertEqual(generations[-1], 50)
+
+    def test_tick_errors_reach_consumer(self):
+        world = render_to_world(WORLD_RENDERING)
+        world.engine = FailingEngine()
+        with self.assertRaises(RuntimeError):
+            _consume(FramePipeline(world, turns=3))
+
+    def test_unknown_overflow_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FramePipeline(render_to_world(WORLD_RENDERING), turns=1,
+                          overflow='ignore')
+
+    def test_run_calls_consumer_with_every_frame(self):
+        rendered_frames = []
+        FramePipeline(render_to_world(WORLD_RENDERING),
+                      turns=3).run(rendered_frames.append)
+        self.assertEqual([rendered_frame.frame.generation
+                          for rendered_frame in rendered_frames],
+                         [0, 1, 2, 3])
+
+
+class FrameTestCase(unittest.TestCase, RenderingTestsMixin):
+    def setUp(self):
+        self.set_living_and_dead_cells_to_plus_and_minus()
+
+    def test_frame_is_unaffected_by_later_ticks(self):
+        world = render_to_world(WORLD_RENDERING)
+        frame = Frame.of(world)
+        world.tick()
+
+        self.assertEqual(render_frame(frame), WORLD_RENDERING)
+        self.assertTrue(frame.is_alive_at(Location(0, 3)))
+        self.assertFalse(frame.is_alive_at(Location(0, 0)))
@@ -0,0 +1,126 @@
+import tracemalloc
+import unittest
+
+from game_of_life.frozen_world import FrozenWorld
+from game_of_life.location import Location
+from game_of_life.render_to_world import render_to_world
+from game_of_life.world import World
+from game_of_life.world_renderer import WorldRenderer
+
+from .test_world_renderer import RenderingTestsMixin
+
+# Glider moving towards increasing x and y
+GLIDER = [Location(1, 0), Location(2, 1), Location(0, 2), Location(1, 2),
+          Location(2, 2)]
+
+
+def _blocks_and_glider(size=128):
+    """ Returns world of size by size cells with still life blocks spread
+    over many chunks, and a glider in one corner """
+    world = World(Location(0, 0), Location(size - 1, size - 1))
+    for x in range(20, size - 8, 8):
+        for y in range(20, size - 8, 8):
+            for location in [Location(x, y), Location(x + 1, y),
+                             Location(x, y + 1), Location(x + 1, y + 1)]:
+                world.set_living_at(location)
+
+    for location in GLIDER:
+        world.set_living_at(location)
+
+    return world
+
+
+class FrozenWorldTestCase(unittest.TestCase, RenderingTestsMixin):
+    def setUp(self):
+        self.set_living_and_dead_cells_to_plus_and_minus()
+
+    def test_tick_leaves_previous_generation_unchanged(self):
+        world = FrozenWorld.from_world(render_to_world('---\n'
+                                                       '+++\n'
+                                                       '---'))
+        next_world = world.tick()
+
+        self.assertEqual(WorldRenderer(world).render(), '---\n'
+                                                        '+++\n'
+                                                        '---')
+        self.assertEqual(WorldRenderer(next_world).render(), '-+-\n'
+                                                             '-+-\n'
+                                                             '-+-')
+        self.assertEqual((world.generation, next_world.generation), (0, 1))
+
+    def test_ticks_match_world_ticks(self):
+        world = World.random(min_location=Location(-10, -5),
+                             max_location=Location(40, 35),
+                             cell_count=600)
+        frozen_world = FrozenWorld.from_world(world)
+
+        for turn in range(20):
+            with self.subTest(turn=turn):
+                world.tick()
+                frozen_world = frozen_world.tick()
+                self.assertEqual(set(frozen_world.living_locations),
+                                 set(world.living_locations))
+                self.assertEqual(frozen_world.living_cell_count,
+                                 world.living_cell_count)
+
+    def test_ticks_match_world_ticks_when_unbounded(self):
+        world = World(shrink_bounds=True, bounds_margin=1)
+        for location in GLIDER:
+            world.set_living_at(location)
+        frozen_world = FrozenWorld.from_world(world)
+
+        for _ in range(12):
+            world.tick()
+            frozen_world = frozen_world.tick()
+
+        self.assertEqual(set(frozen_world.living_locations),
+                         set(world.living_locations))
+        self.assertEqual((frozen_world.min_location,
+                          frozen_world.max_location),
+                         (world.min_location, world.max_location))
+
+    def test_generations_only_retain_their_changes(self):
+        world = FrozenWorld.from_world(_blocks_and_glider(size=512))
+        generations = [world.tick()]
+
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            for _ in range(40):
+                generations.append(generations[-1].tick())
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Each generation only keeps the glider's chunks and the trie nodes
+        # on their paths, not a copy of the map of the chunks of blocks
+        retained_per_generation = (after - before) / 40
+        self.assertGreater(world.chunk_count, 900)
+        self.assertLess(retained_per_generation, 8 * 1024)
+
+    def test_with_living_and_dead_at_return_new_worlds(self):
+        world = FrozenWorld()
+        living_world = world.with_living_at(Location(3, -2))
+        dead_world = living_world.with_dead_at(Location(3, -2))
+
+        self.assertTrue(world.is_empty)
+        self.assertTrue(living_world.is_alive_at(Location(3, -2)))
+        self.assertEqual(living_world.dimensions, (4, 3))
+        self.assertTrue(dead_world.is_empty)
+
+    def test_locations_beyond_key_range_are_dead(self):
+        world = FrozenWorld()
+        location = Location(-2 ** 31 - 1, 0)
+
+        self.assertFalse(world.is_alive_at(location))
+        self.assertIs(world.with_dead_at(location), world)
+
+    def test_round_trips_to_world(self):
+        world = _blocks_and_glider()
+        world.generation = 7
+        round_tripped = FrozenWorld.from_world(world).to_world()
+
+        self.assertEqual(set(round_tripped.living_locations),
+                         set(world.living_locations))
+        self.assertEqual(round_tripped.generation, 7)
+        self.assertEqual(round_tripped.dimensions, world.dimensions)
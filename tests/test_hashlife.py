@@ -0,0 +1,83 @@
+import unittest
+
+from game_of_life.hashlife import HashLifeWorld
+from game_of_life.location import Location
+from game_of_life.world import World
+
+GLIDER = [Location(1, 0), Location(2, 1), Location(0, 2), Location(1, 2),
+          Location(2, 2)]
+
+
+def _world_with(locations, min_location=Location(0, 0),
+                max_location=Location(0, 0)):
+    world = World(min_location, max_location)
+    for location in locations:
+        world.set_living_at(location)
+
+    return world
+
+
+def _soup_world():
+    soup = World.random(min_location=Location(-8, -8),
+                        max_location=Location(8, 8),
+                        cell_count=120)
+    # leave enough room around the soup for its bounds not to matter
+    return _world_with(soup.living_locations, Location(-100, -100),
+                       Location(100, 100))
+
+
+def _translated(locations, x_offset, y_offset):
+    return {Location(l.x + x_offset, l.y + y_offset) for l in locations}
+
+
+class HashLifeWorldTestCase(unittest.TestCase):
+    def test_round_trips_world(self):
+        world = _world_with(GLIDER)
+        hashlife_world = HashLifeWorld.from_world(world)
+        self.assertEqual(set(hashlife_world.to_world().living_locations),
+                         set(GLIDER))
+        self.assertEqual(hashlife_world.population, 5)
+
+    def test_advance_matches_world_ticks(self):
+        world = _soup_world()
+        hashlife_world = HashLifeWorld.from_world(world)
+
+        for generations in [1, 2, 3, 6, 11]:
+            with self.subTest(generations=generations):
+                hashlife_world.advance(generations)
+                for _ in range(generations):
+                    world.tick()
+
+                self.assertEqual(set(hashlife_world.living_locations),
+                                 set(world.living_locations))
+
+        self.assertEqual(hashlife_world.generation, 23)
+
+    def test_advance_glider_by_billions_of_generations(self):
+        hashlife_world = HashLifeWorld.from_world(_world_with(GLIDER))
+        hashlife_world.advance(2 ** 30)
+
+        # a glider moves one cell diagonally every 4 generations
+        offset = 2 ** 28
+        self.assertEqual(set(hashlife_world.living_locations),
+                         _translated(GLIDER, offset, offset))
+        self.assertEqual(hashlife_world.generation, 2 ** 30)
+
+    def test_advance_rejects_negative_generations(self):
+        hashlife_world = HashLifeWorld.from_world(_world_with(GLIDER))
+
+        with self.assertRaises(ValueError):
+            hashlife_world.advance(-1)
+
+        self.assertEqual(hashlife_world.generation, 0)
+
+    def test_garbage_collection_keeps_pattern_intact(self):
+        world = _soup_world()
+        hashlife_world = HashLifeWorld.from_world(world, max_nodes=64)
+
+        hashlife_world.advance(20)
+        for _ in range(20):
+            world.tick()
+
+        self.assertEqual(set(hashlife_world.living_locations),
+                         set(world.living_locations))
@@ -0,0 +1,129 @@
+import unittest
+
+from game_of_life.history import History
+from game_of_life.location import Location
+from game_of_life.render_to_world import render_to_world
+from game_of_life.turn_renderings import turn_renderings
+from game_of_life.world import World
+
+from .test_world_renderer import RenderingTestsMixin
+
+
+def _random_world(**kwargs):
+    return World.random(min_location=Location(-10, -10),
+                        max_location=Location(30, 30), cell_count=400,
+                        **kwargs)
+
+
+class HistoryTestCase(unittest.TestCase):
+    def test_seek_restores_every_recorded_generation(self):
+        world = _random_world()
+        world.record_history(History(keyframe_interval=4))
+        generations = [set(world.living_locations)]
+        for _ in range(20):
+            world.tick()
+            generations.append(set(world.living_locations))
+
+        for generation in [7, 0, 20, 13, 4, 5]:
+            with self.subTest(generation=generation):
+                world.seek(generation)
+                self.assertEqual(world.generation, generation)
+                self.assertEqual(set(world.living_locations),
+                                 generations[generation])
+
+    def test_seek_restores_bounds_of_unbounded_worlds(self):
+        world = render_to_world('-+-\n'
+                                '--+\n'
+                                '+++')
+        world.shrink_bounds = True
+        world.record_history()
+        bounds = [(world.min_location, world.max_location)]
+        for _ in range(8):
+            world.tick()
+            bounds.append((world.min_location, world.max_location))
+
+        world.seek(3)
+        self.assertEqual((world.min_location, world.max_location), bounds[3])
+
+    def test_ticking_after_seek_replaces_later_generations(self):
+        world = _random_world()
+        history = world.record_history(History(keyframe_interval=3))
+        for _ in range(10):
+            world.tick()
+
+        world.seek(4)
+        world.set_living_at(Location(0, 0))
+        world.tick()
+        world.tick()
+        expected = set(world.living_locations)
+
+        self.assertEqual(history.last_generation, 6)
+        world.seek(5)
+        world.seek(6)
+        self.assertEqual(set(world.living_locations), expected)
+
+    def test_cells_set_between_ticks_are_recorded(self):
+        world = render_to_world('---\n'
+                                '+++\n'
+                                '---')
+        world.record_history()
+        world.tick()
+        world.set_living_at(Location(5, 5))
+        world.tick()
+        expected = set(world.living_locations)
+
+        world.seek(0)
+        world.seek(2)
+        self.assertEqual(set(world.living_locations), expected)
+
+    def test_memory_budget_drops_oldest_generations(self):
+        world = _random_world()
+        history = world.record_history(History(keyframe_interval=5,
+                                               max_bytes=20000))
+        for _ in range(60):
+            world.tick()
+
+        self.assertLessEqual(history.size, 20000)
+        self.assertGreater(history.first_generation, 0)
+        self.assertEqual(history.last_generation, 60)
+        self.assertNotIn(0, history)
+        with self.assertRaises(KeyError):
+            world.seek(0)
+
+    def test_seek_without_history_is_rejected(self):
+        world = _random_world()
+        world.tick()
+
+        with self.assertRaises(LookupError):
+            world.seek(0)
+
+        self.assertEqual(world.generation, 1)
+
+    def test_deltas_are_stored_between_keyframes(self):
+        world = _random_world()
+        history = world.record_history(History(keyframe_interval=10))
+        for _ in range(9):
+            world.tick()
+
+        self.assertEqual(len(history), 10)
+        self.assertEqual(len(history._spans), 1)
+        world.tick()
+        self.assertEqual(len(history._spans), 2)
+
+
+class TurnRenderingsHistoryTestCase(unittest.TestCase, RenderingTestsMixin):
+    def setUp(self):
+        self.set_living_and_dead_cells_to_plus_and_minus()
+
+    def test_turns_are_recorded(self):
+        world = render_to_world('---\n'
+                                '+++\n'
+                                '---')
+        history = History()
+        list(turn_renderings(world, turns=3, history=history))
+
+        self.assertEqual((history.first_generation, history.last_generation),
+                         (0, 3))
+        world.seek(1)
+        self.assertEqual(set(world.living_locations),
+                         {Location(1, 0), Location(1, 1), Location(1, 2)})
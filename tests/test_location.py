@@ -1,10 +1,10 @@
 from collections import OrderedDict
 import unittest
 
-from game_of_life.location import (LocationGrid, Location,
+from game_of_life.location import (NEIGHBOR_OFFSETS, LocationGrid, Location,
                                    get_max_coordinates_location,
-                                   get_min_coordinates_location,
-                                   sort_locations)
+                                   get_min_coordinates_location, pack,
+                                   sort_locations, unpack)
 
 
 class LocationTestCase(unittest.TestCase):
@@ -24,6 +24,35 @@ class LocationTestCase(unittest.TestCase):
         self.assertTrue(location_a == location_b)
 
 
+class LocationKeyTestCase(unittest.TestCase):
+    def test_key_round_trips(self):
+        for coordinates in [(0, 0), (1, -1), (-1, 1), (-5, -7),
+                            (2 ** 31 - 1, -2 ** 31), (-2 ** 31, 2 ** 40)]:
+            with self.subTest(coordinates=coordinates):
+                location = Location(*coordinates)
+                self.assertEqual(location.key, pack(*coordinates))
+                self.assertEqual(unpack(location.key), coordinates)
+                self.assertEqual(Location.from_key(location.key), location)
+
+    def test_out_of_range_x_cannot_be_packed(self):
+        for x in [2 ** 31, -2 ** 31 - 1, 2 ** 40]:
+            with self.subTest(x=x):
+                with self.assertRaises(OverflowError):
+                    pack(x, 0)
+                with self.assertRaises(OverflowError):
+                    Location(x, 1).key
+
+    def test_keys_of_different_locations_differ(self):
+        keys = {Location(x, y).key for x in range(-3, 4) for y in range(-3, 4)}
+        self.assertEqual(len(keys), 49)
+
+    def test_neighbor_offsets_give_neighbor_keys(self):
+        location = Location(-1, 2)
+        actual = {location.key + offset for offset in NEIGHBOR_OFFSETS}
+        expected = {neighbor.key for neighbor in location.neighbors}
+        self.assertEqual(actual, expected)
+
+
 class GetMinCoordinatesLocationTestCase(unittest.TestCase):
     def test_with_one_location(self):
         actual = get_min_coordinates_location([Location(0, 0)])
@@ -123,3 +152,33 @@ class LocationGridLocationsTestCase(unittest.TestCase):
         expected = [Location(0, 0), Location(1, 0), Location(0, 1),
                     Location(1, 1)]
         self.assertEqual(set(actual), set(expected))
+
+    def test_locations_are_in_render_order(self):
+        actual = list(LocationGrid(Location(0, 0), Location(1, 1)).locations)
+        expected = [Location(0, 1), Location(1, 1), Location(0, 0),
+                    Location(1, 0)]
+        self.assertEqual(actual, expected)
+
+
+class LocationGridViewTestCase(unittest.TestCase):
+    def setUp(self):
+        self.location_grid = LocationGrid(Location(-1, 2), Location(3, 4))
+
+    def test_len_is_area(self):
+        self.assertEqual(len(self.location_grid), 15)
+        self.assertEqual(len(list(self.location_grid)), 15)
+
+    def test_contains_locations_within_bounds(self):
+        self.assertIn(Location(-1, 2), self.location_grid)
+        self.assertIn(Location(3, 4), self.location_grid)
+        self.assertNotIn(Location(4, 4), self.location_grid)
+        self.assertNotIn(Location(0, 1), self.location_grid)
+
+    def test_iter_rows_matches_rows(self):
+        self.assertEqual(list(self.location_grid.iter_rows()),
+                         list(self.location_grid.rows.items()))
+
+    def test_large_grid_is_not_materialised(self):
+        location_grid = LocationGrid(Location(0, 0), Location(999999, 999999))
+        self.assertEqual(len(location_grid), 10 ** 12)
+        self.assertEqual(next(iter(location_grid)), Location(0, 999999))
@@ -0,0 +1,88 @@
+import gc
+from multiprocessing import shared_memory
+import unittest
+
+from game_of_life.location import Location
+from game_of_life.parallel_engine import ParallelEngine
+from game_of_life.rule import Rule
+from game_of_life.world import World
+
+
+def _random_world(engine, **kwargs):
+    world = World.random(min_location=Location(-20, -15),
+                         max_location=Location(25, 30),
+                         cell_count=700)
+    copy = World(world.min_location, world.max_location, engine=engine,
+                 **kwargs)
+    for location in world.living_locations:
+        copy.set_living_at(location)
+
+    return world, copy
+
+
+class ParallelEngineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.engine = ParallelEngine(tile_size=8, workers=2)
+        self.addCleanup(self.engine.close)
+
+    def test_no_living_locations_stay_empty(self):
+        self.assertEqual(self.engine.next_living_locations(set()), set())
+
+    def test_matches_single_process_tick(self):
+        world, parallel_world = _random_world(self.engine)
+
+        for turn in range(15):
+            with self.subTest(turn=turn):
+                world.tick()
+                parallel_world.tick()
+                self.assertEqual(set(parallel_world.living_locations),
+                                 set(world.living_locations))
+
+    def test_matches_single_process_tick_with_other_rule(self):
+        world, parallel_world = _random_world(self.engine)
+        world.rule = parallel_world.rule = Rule.from_string('B36/S23')
+
+        for _ in range(5):
+            world.tick()
+            parallel_world.tick()
+
+        self.assertEqual(set(parallel_world.living_locations),
+                         set(world.living_locations))
+
+    def test_matches_single_process_tick_when_unbounded(self):
+        world, parallel_world = _random_world(self.engine,
+                                              shrink_bounds=True)
+        world.shrink_bounds = True
+
+        for turn in range(15):
+            with self.subTest(turn=turn):
+                world.tick()
+                parallel_world.tick()
+                self.assertEqual(set(parallel_world.living_locations),
+                                 set(world.living_locations))
+
+    def test_board_only_holds_occupied_tiles(self):
+        world = World(shrink_bounds=True, engine=self.engine)
+        world.set_living_many([(0, 0), (1, 0), (2, 0),
+                               (100000, 0), (100001, 0), (100002, 0)])
+
+        world.tick()
+
+        self.assertEqual(set(world.living_locations),
+                         {Location(1, -1), Location(1, 0), Location(1, 1),
+                          Location(100001, -1), Location(100001, 0),
+                          Location(100001, 1)})
+        # Each blinker lies in a single tile of 8 by 8 cells
+        self.assertLessEqual(self.engine._resources.board.size, 2 * 8 * 8)
+
+    def test_releases_board_when_garbage_collected(self):
+        engine = ParallelEngine(tile_size=8, workers=1)
+        engine.next_living_locations({Location(0, 0), Location(1, 0),
+                                      Location(2, 0)})
+        name = engine._resources.board.name
+
+        del engine
+        gc.collect()
+
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
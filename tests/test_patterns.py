@@ -0,0 +1,161 @@
+import io
+import os
+import tempfile
+import unittest
+
+from game_of_life import patterns
+from game_of_life.location import Location
+from game_of_life.render_to_world import render_to_world
+from game_of_life.rule import Rule
+from game_of_life.world import World
+
+GLIDER_RLE = ('#N Glider\n'
+              '#C A comment\n'
+              'x = 3, y = 3, rule = B3/S23\n'
+              'bob$2bo$3o!\n')
+
+GLIDER_LOCATIONS = {Location(1, 0), Location(2, -1), Location(0, -2),
+                    Location(1, -2), Location(2, -2)}
+
+
+class ReadTestCase(unittest.TestCase):
+    def test_reads_rle(self):
+        world = patterns.read_rle(io.StringIO(GLIDER_RLE))
+        self.assertEqual(set(world.living_locations), GLIDER_LOCATIONS)
+        self.assertEqual(world.dimensions, (3, 3))
+
+    def test_rle_header_is_reported(self):
+        header = {}
+        list(patterns.iter_rle(io.StringIO(GLIDER_RLE), header))
+        self.assertEqual(header, {'x': '3', 'y': '3', 'rule': 'B3/S23'})
+
+    def test_rle_rule_is_read(self):
+        world = patterns.read_rle(io.StringIO('x = 1, y = 1, rule = B36/S23\n'
+                                              'o!'))
+        self.assertEqual(str(world.rule), 'B36/S23')
+
+    def test_rle_rule_with_bounded_grid_is_read(self):
+        header = {}
+        world = patterns.read_rle(io.StringIO(
+            'x = 2, y = 1, rule = B36/S23:P10,10\n'
+            '2o!'))
+        list(patterns.iter_rle(io.StringIO('x = 2, y = 1, rule = B3/S23:T5,5'),
+                               header))
+
+        self.assertEqual(str(world.rule), 'B36/S23')
+        self.assertEqual(set(world.living_locations),
+                         {Location(0, 0), Location(1, 0)})
+        self.assertEqual(header, {'x': '2', 'y': '1',
+                                  'rule': 'B3/S23:T5,5'})
+
+    def test_rle_runs_span_lines_and_blank_rows(self):
+        world = patterns.read_rle(io.StringIO('x = 12, y = 4\n'
+                                              '10b\n'
+                                              '2o2$\n'
+                                              '3bo!'))
+        self.assertEqual(set(world.living_locations),
+                         {Location(10, 0), Location(11, 0), Location(3, -2)})
+        self.assertEqual(world.dimensions, (12, 4))
+
+    def test_reads_life106(self):
+        world = patterns.read_life106(io.StringIO('#Life 1.06\n'
+                                                  '0 -1\n'
+                                                  '-5 2\n'))
+        self.assertEqual(set(world.living_locations),
+                         {Location(0, 1), Location(-5, -2)})
+
+    def test_reads_plaintext(self):
+        world = patterns.read_plaintext(io.StringIO('!Name: Glider\n'
+                                                    '.O\n'
+                                                    '..O\n'
+                                                    'OOO\n'))
+        self.assertEqual(set(world.living_locations), GLIDER_LOCATIONS)
+
+    def test_empty_pattern_reads_as_empty_world(self):
+        self.assertTrue(patterns.read_plaintext(io.StringIO('')).is_empty)
+
+
+class WriteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.world = render_to_world('-+---\n'
+                                     '-----\n'
+                                     '++-++\n'
+                                     '-----')
+
+    def test_writes_rle(self):
+        file = io.StringIO()
+        patterns.write_rle(self.world, file)
+        self.assertEqual(file.getvalue(),
+                         'x = 5, y = 4, rule = B3/S23\n'
+                         'bo2$2ob2o!\n')
+
+    def test_writes_world_rule_in_rle(self):
+        self.world.rule = Rule.from_string('B2/S')
+        file = io.StringIO()
+        patterns.write_rle(self.world, file)
+        self.assertTrue(file.getvalue().startswith(
+            'x = 5, y = 4, rule = B2/S\n'))
+
+    def test_long_rle_lines_are_wrapped(self):
+        world = World.empty()
+        for x in range(0, 200, 2):
+            world.set_living_at(Location(x, 0))
+
+        file = io.StringIO()
+        patterns.write_rle(world, file)
+        lines = file.getvalue().splitlines()
+        self.assertTrue(all(len(line) <= patterns.RLE_LINE_LENGTH
+                            for line in lines))
+
+    def test_writes_life106(self):
+        file = io.StringIO()
+        patterns.write_life106(self.world, file)
+        self.assertEqual(file.getvalue(),
+                         '#Life 1.06\n'
+                         '1 -3\n'
+                         '0 -1\n'
+                         '1 -1\n'
+                         '3 -1\n'
+                         '4 -1\n')
+
+    def test_writes_plaintext(self):
+        file = io.StringIO()
+        patterns.write_plaintext(self.world, file)
+        self.assertEqual(file.getvalue(), '.O\n'
+                                          '\n'
+                                          'OO.OO\n'
+                                          '\n')
+
+    def test_formats_round_trip(self):
+        for write, read in [(patterns.write_rle, patterns.read_rle),
+                            (patterns.write_life106, patterns.read_life106),
+                            (patterns.write_plaintext,
+                             patterns.read_plaintext)]:
+            with self.subTest(format=write.__name__):
+                world = World.random(min_location=Location(-7, -3),
+                                     max_location=Location(30, 20),
+                                     cell_count=300)
+                file = io.StringIO()
+                write(world, file)
+                file.seek(0)
+                read_locations = set(read(file).living_locations)
+
+                if write is patterns.write_life106:
+                    expected = set(world.living_locations)
+                else:
+                    expected = {Location(l.x - world.min_location.x,
+                                         l.y - world.max_location.y)
+                                for l in world.living_locations}
+                self.assertEqual(read_locations, expected)
+
+    def test_pattern_files_picked_by_extension(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'pattern.rle')
+        self.addCleanup(os.rmdir, directory)
+        self.addCleanup(os.remove, path)
+
+        patterns.write_pattern(self.world, path)
+        self.assertEqual(patterns.read_pattern(path).living_cell_count, 5)
+
+        with self.assertRaises(ValueError):
+            patterns.read_pattern(os.path.join(directory, 'pattern.txt'))
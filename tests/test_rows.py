@@ -0,0 +1,16 @@
+import unittest
+
+from game_of_life.location import Location
+from game_of_life.rows import pack_row, x_indexes_by_y
+
+
+class RowsTestCase(unittest.TestCase):
+    def test_x_indexes_are_grouped_by_y(self):
+        x_indexes = x_indexes_by_y([Location(3, 1), (-2, 0), Location(0, 1)],
+                                   -2)
+        self.assertEqual(dict(x_indexes), {1: [5, 2], 0: [0]})
+
+    def test_packed_rows_set_bits_of_x_indexes(self):
+        self.assertEqual(pack_row([0, 2, 3], 4), 0b1101)
+        self.assertEqual(pack_row([], 3), 0)
+        self.assertEqual(pack_row([99], 100), 1 << 99)
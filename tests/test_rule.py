@@ -0,0 +1,114 @@
+import random
+import unittest
+
+from game_of_life.bitboard import BitboardWorld
+from game_of_life.hashlife import HashLifeWorld
+from game_of_life.location import Location
+from game_of_life.rule import CONWAY, Rule
+from game_of_life.world import World
+
+
+class RuleTestCase(unittest.TestCase):
+    def test_parses_rulestrings(self):
+        for rulestring, births, survivals in [('B3/S23', {3}, {2, 3}),
+                                              ('b36/s23', {3, 6}, {2, 3}),
+                                              ('B2/S', {2}, set()),
+                                              ('S23/B3', {3}, {2, 3}),
+                                              ('23/3', {3}, {2, 3})]:
+            with self.subTest(rulestring=rulestring):
+                rule = Rule.from_string(rulestring)
+                self.assertEqual(rule.birth_counts, births)
+                self.assertEqual(rule.survival_counts, survivals)
+
+    def test_invalid_rulestrings_are_rejected(self):
+        for rulestring in ['', 'B3', 'B9/S23', 'Life', 'B03/S23']:
+            with self.subTest(rulestring=rulestring):
+                with self.assertRaises(ValueError):
+                    Rule.from_string(rulestring)
+
+    def test_table_is_indexed_by_alive_and_neighbor_count(self):
+        self.assertEqual(len(CONWAY.table), 18)
+        for alive in (False, True):
+            for neighbor_count in range(9):
+                expected = (neighbor_count == 3 or
+                            alive and neighbor_count == 2)
+                self.assertEqual(CONWAY.next_state(alive, neighbor_count),
+                                 expected)
+
+    def test_str_is_canonical_rulestring(self):
+        self.assertEqual(str(Rule.from_string('S32/B63')), 'B36/S23')
+        self.assertEqual(Rule.from_string('23/3'), CONWAY)
+
+
+class WorldRuleTestCase(unittest.TestCase):
+    def test_seeds(self):
+        world = World(Location(-2, -2), Location(2, 2),
+                      rule=Rule.from_string('B2/S'))
+        world.set_living_at(Location(0, 0))
+        world.set_living_at(Location(1, 0))
+        world.tick()
+        self.assertEqual(set(world.living_locations),
+                         {Location(0, 1), Location(1, 1), Location(0, -1),
+                          Location(1, -1)})
+
+    def test_lone_cells_survive_rules_with_s0(self):
+        for rulestring in ['B3/S012345678', 'B2/S0']:
+            rule = Rule.from_string(rulestring)
+            for active_region in (False, True):
+                with self.subTest(rulestring=rulestring,
+                                  active_region=active_region):
+                    world = World.from_locations(
+                        [Location(0, 0)], min_location=Location(-3, -3),
+                        max_location=Location(3, 3), rule=rule,
+                        active_region=active_region)
+                    world.tick()
+                    world.tick()
+                    self.assertEqual(world.living_locations,
+                                     [Location(0, 0)])
+
+    def test_backends_agree_on_life_without_death(self):
+        rule = Rule.from_string('B3/S012345678')
+        rng = random.Random(5)
+        world = World(Location(0, 0), Location(15, 15), rule=rule)
+        for _ in range(30):
+            world.set_living_at(Location(rng.randint(0, 15),
+                                         rng.randint(0, 15)))
+
+        bitboard_world = BitboardWorld.from_world(world)
+        for _ in range(4):
+            world.tick()
+            bitboard_world.tick()
+
+        self.assertEqual(set(bitboard_world.living_locations),
+                         set(world.living_locations))
+
+    def test_backends_agree_on_highlife(self):
+        rule = Rule.from_string('B36/S23')
+        rng = random.Random(3)
+        world = World(Location(0, 0), Location(15, 15), rule=rule)
+        for _ in range(100):
+            world.set_living_at(Location(rng.randint(0, 15),
+                                         rng.randint(0, 15)))
+
+        bitboard_world = BitboardWorld.from_world(world)
+        for _ in range(4):
+            world.tick()
+            bitboard_world.tick()
+
+        self.assertEqual(set(bitboard_world.living_locations),
+                         set(world.living_locations))
+
+    def test_hashlife_follows_world_rule(self):
+        rule = Rule.from_string('B36/S23')
+        world = World(Location(0, 0), Location(7, 7), rule=rule,
+                      shrink_bounds=True)
+        for location in [Location(2, 2), Location(3, 2), Location(4, 2),
+                         Location(2, 3), Location(4, 4), Location(3, 4)]:
+            world.set_living_at(location)
+
+        hashlife_world = HashLifeWorld.from_world(world)
+        world.run(8, detect_cycles=False)
+        hashlife_world.advance(8)
+
+        self.assertEqual(set(hashlife_world.living_locations),
+                         set(world.living_locations))
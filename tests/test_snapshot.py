@@ -0,0 +1,102 @@
+import io
+import os
+import tempfile
+import unittest
+
+from game_of_life import snapshot
+from game_of_life.location import Location
+from game_of_life.rule import CONWAY, Rule
+from game_of_life.world import World
+
+
+def _random_world(cell_count):
+    world = World.random(min_location=Location(-20, -10),
+                         max_location=Location(43, 30),
+                         cell_count=cell_count)
+    world.generation = 7
+    return world
+
+
+class SnapshotTestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'world.snapshot')
+
+    def _save(self, world):
+        with open(self.path, 'wb') as file:
+            snapshot.save_snapshot(world, file)
+
+        with open(self.path, 'rb') as file:
+            return snapshot.HEADER.unpack(file.read(snapshot.HEADER.size))
+
+    def test_round_trips_sparse_and_dense_worlds(self):
+        for cell_count, encoding in [(10, snapshot.COORDINATES_ENCODING),
+                                     (1500, snapshot.ROWS_ENCODING)]:
+            with self.subTest(cell_count=cell_count):
+                world = _random_world(cell_count)
+                header = self._save(world)
+                loaded = snapshot.load_snapshot(self.path)
+
+                self.assertEqual(header[2], encoding)
+                self.assertEqual(set(loaded.living_locations),
+                                 set(world.living_locations))
+                self.assertEqual((loaded.min_location, loaded.max_location),
+                                 (world.min_location, world.max_location))
+                self.assertEqual(loaded.generation, 7)
+
+    def test_loads_viewport_only(self):
+        viewport = (Location(-3, 2), Location(12, 9))
+        for cell_count in [10, 1500]:
+            with self.subTest(cell_count=cell_count):
+                world = _random_world(cell_count)
+                self._save(world)
+                loaded = snapshot.load_snapshot(self.path, viewport=viewport)
+
+                expected = {l for l in world.living_locations
+                            if -3 <= l.x <= 12 and 2 <= l.y <= 9}
+                self.assertEqual(set(loaded.living_locations), expected)
+                self.assertEqual((loaded.min_location, loaded.max_location),
+                                 viewport)
+
+    def test_rule_round_trips(self):
+        highlife = Rule.from_string('B36/S23')
+        world = World.from_locations([Location(0, 0), Location(1, 0)],
+                                     rule=highlife)
+        self._save(world)
+
+        loaded = snapshot.load_snapshot(self.path)
+        self.assertEqual(loaded.rule, highlife)
+
+    def test_loads_version_1_snapshots_as_conway(self):
+        header = snapshot.VERSION_1_HEADER.pack(
+            snapshot.MAGIC, 1, snapshot.COORDINATES_ENCODING, 0, 0, 0, 3, 3,
+            5, 1)
+        with open(self.path, 'wb') as file:
+            # One cell at (2, 1): y delta 1, then x index 2
+            file.write(header + bytes([1, 2]))
+
+        loaded = snapshot.load_snapshot(self.path)
+        self.assertEqual(loaded.living_locations, [Location(2, 1)])
+        self.assertEqual(loaded.rule, CONWAY)
+        self.assertEqual(loaded.generation, 5)
+
+    def test_empty_world_round_trips(self):
+        self._save(World.empty())
+        self.assertTrue(snapshot.load_snapshot(self.path).is_empty)
+
+    def test_rejects_files_that_are_not_snapshots(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a snapshot' * 10)
+
+        with self.assertRaises(snapshot.SnapshotError):
+            snapshot.load_snapshot(self.path)
+
+    def test_snapshot_is_smaller_than_a_byte_per_cell(self):
+        world = _random_world(1500)
+        x_length, y_length = world.dimensions
+        file = io.BytesIO()
+        snapshot.save_snapshot(world, file)
+        self.assertLessEqual(len(file.getvalue()),
+                             snapshot.HEADER.size + x_length * y_length / 8 +
+                             y_length)
@@ -0,0 +1,51 @@
+import unittest
+
+from game_of_life.location import Location
+from game_of_life.sparse_engine import SparseEngine
+
+
+def _blinker(x=0, y=0):
+    return {Location(x - 1, y), Location(x, y), Location(x + 1, y)}
+
+
+class SparseEngineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.engine = SparseEngine()
+
+    def test_no_living_locations_stay_empty(self):
+        self.assertEqual(self.engine.next_living_locations(set()), set())
+
+    def test_lone_location_dies(self):
+        actual = self.engine.next_living_locations({Location(0, 0)})
+        self.assertEqual(actual, set())
+
+    def test_blinker_oscillates(self):
+        actual = self.engine.next_living_locations(_blinker())
+        expected = {Location(0, -1), Location(0, 0), Location(0, 1)}
+        self.assertEqual(actual, expected)
+
+    def test_distant_blinkers_evolve_independently(self):
+        actual = self.engine.next_living_locations(
+            _blinker() | _blinker(1000, -1000))
+        expected = {Location(0, -1), Location(0, 0), Location(0, 1),
+                    Location(1000, -1001), Location(1000, -1000),
+                    Location(1000, -999)}
+        self.assertEqual(actual, expected)
+
+    def test_no_births_outside_of_bounds(self):
+        actual = self.engine.next_living_locations(
+            _blinker(), min_location=Location(-1, 0),
+            max_location=Location(1, 1))
+        self.assertEqual(actual, {Location(0, 0), Location(0, 1)})
+
+    def test_next_changes_only_evaluate_neighborhoods_of_changes(self):
+        living_keys = {location.key
+                       for location in _blinker() | {Location(10, 10),
+                                                     Location(11, 10),
+                                                     Location(10, 11),
+                                                     Location(11, 11)}}
+        changed_keys = {Location(-1, 0).key, Location(1, 0).key}
+        births, deaths = self.engine.next_changes(living_keys, changed_keys)
+
+        self.assertEqual(births, {Location(0, -1).key, Location(0, 1).key})
+        self.assertEqual(deaths, {Location(-1, 0).key, Location(1, 0).key})
@@ -0,0 +1,56 @@
+import unittest
+
+from game_of_life.location import Location
+from game_of_life.spatial_index import ChunkIndex, chunk_key
+
+RECTANGLES = [
+    (Location(-100, -100), Location(100, 100)),
+    (Location(-5, -5), Location(5, 5)),
+    (Location(0, 0), Location(31, 31)),
+    (Location(-33, 7), Location(-1, 70)),
+    (Location(3, 3), Location(3, 3)),
+    (Location(1, 1), Location(0, 0)),
+]
+
+
+class ChunkIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.locations = {Location(x, (x * 7) % 61 - 30)
+                          for x in range(-40, 40)}
+        self.index = ChunkIndex(location.key for location in self.locations)
+
+    def assertMatchesLocations(self, index, locations):
+        for min_location, max_location in RECTANGLES:
+            with self.subTest(min_location=min_location,
+                              max_location=max_location):
+                expected = {location for location in locations
+                            if min_location.x <= location.x <= max_location.x
+                            and min_location.y <= location.y <= max_location.y}
+                actual = {Location.from_key(key) for key in
+                          index.keys_in(min_location, max_location)}
+                self.assertEqual(actual, expected)
+                self.assertEqual(index.count_in(min_location, max_location),
+                                 len(expected))
+
+    def test_chunk_key_of_negative_coordinates(self):
+        self.assertEqual(chunk_key(Location(-1, -33).key, 5),
+                         Location(-1, -2).key)
+
+    def test_queries_match_filtered_locations(self):
+        self.assertEqual(len(self.index), len(self.locations))
+        self.assertMatchesLocations(self.index, self.locations)
+
+    def test_queries_follow_updates(self):
+        added = {Location(x, 2) for x in range(-3, 4)}
+        discarded = set(list(self.locations)[::2])
+        self.index.update({location.key for location in added},
+                          {location.key for location in discarded})
+
+        self.assertMatchesLocations(self.index,
+                                    self.locations - discarded | added)
+
+    def test_empty_chunks_are_dropped(self):
+        index = ChunkIndex([Location(0, 0).key])
+        index.discard(Location(0, 0).key)
+        index.discard(Location(1, 1).key)
+        self.assertEqual(len(index._chunks), 0)
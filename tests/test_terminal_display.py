@@ -0,0 +1,86 @@
+import io
+import unittest
+
+from game_of_life.location import Location
+from game_of_life.terminal_display import (CLEAR_SCREEN, TerminalDisplay,
+                                           move_cursor)
+from game_of_life.world import World
+
+from .test_world_renderer import RenderingTestsMixin
+
+
+class FakeClock():
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _blinker_world():
+    world = World(min_location=Location(0, 0), max_location=Location(2, 2))
+    for x in range(3):
+        world.set_living_at(Location(x, 1))
+
+    return world
+
+
+class TerminalDisplayTestCase(unittest.TestCase, RenderingTestsMixin):
+    def setUp(self):
+        self.set_living_and_dead_cells_to_plus_and_minus()
+        self.file = io.StringIO()
+
+    def test_first_frame_is_drawn_in_full(self):
+        display = TerminalDisplay(file=self.file)
+        display.show(_blinker_world(), title='Turn 0:')
+        expected = (CLEAR_SCREEN + move_cursor(1, 1) + 'Turn 0:\x1b[K\n' +
+                    '---\n' +
+                    '+++\n' +
+                    '---')
+        self.assertEqual(self.file.getvalue(), expected)
+
+    def test_next_frames_only_redraw_changed_cells(self):
+        display = TerminalDisplay(file=self.file)
+        world = _blinker_world()
+        display.show(world)
+        self.file.truncate(0)
+        self.file.seek(0)
+
+        display.show(world.tick())
+        frame = self.file.getvalue()
+
+        self.assertNotIn(CLEAR_SCREEN, frame)
+        for cell_draw in [move_cursor(2, 2) + '+', move_cursor(4, 2) + '+',
+                          move_cursor(3, 1) + '-', move_cursor(3, 3) + '-']:
+            self.assertIn(cell_draw, frame)
+        self.assertNotIn(move_cursor(3, 2), frame)
+
+    def test_frames_are_redrawn_in_full_when_bounds_change(self):
+        display = TerminalDisplay(file=self.file)
+        world = _blinker_world()
+        display.show(world)
+        world.set_living_at(Location(5, 5))
+        display.show(world)
+        self.assertEqual(self.file.getvalue().count(CLEAR_SCREEN), 2)
+
+    def test_headless_display_writes_nothing(self):
+        display = TerminalDisplay(file=self.file, headless=True)
+        display.show(_blinker_world())
+        display.finish()
+        self.assertEqual(self.file.getvalue(), '')
+        self.assertEqual(display.frame_count, 1)
+
+    def test_frames_are_paced_to_target_fps(self):
+        clock = FakeClock()
+        display = TerminalDisplay(file=self.file, fps=4, headless=True,
+                                  clock=clock, sleep=clock.sleep)
+        for _ in range(3):
+            display.show(_blinker_world())
+
+        self.assertEqual(clock.sleeps, [0.25, 0.25])
+        self.assertEqual(display.frames_per_second, 6.0)
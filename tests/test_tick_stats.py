@@ -0,0 +1,62 @@
+import unittest
+
+from game_of_life.location import Location
+from game_of_life.tick_stats import TickStats
+from game_of_life.world import World
+
+
+def _blinker_world():
+    world = World(min_location=Location(-2, -2), max_location=Location(2, 2))
+    for x in range(-1, 2):
+        world.set_living_at(Location(x, 0))
+
+    return world
+
+
+class TickStatsTestCase(unittest.TestCase):
+    def test_phase_accumulates_wall_time(self):
+        stats = TickStats()
+        with stats.phase('a'):
+            pass
+        with stats.phase('a'):
+            pass
+
+        self.assertEqual(list(stats.phase_seconds), ['a'])
+        self.assertGreaterEqual(stats.total_seconds, 0)
+
+    def test_str_lists_counters_and_phases(self):
+        stats = TickStats()
+        stats.generation, stats.births = 3, 2
+        stats.phase_seconds['commit'] = 0.001
+        self.assertEqual(str(stats),
+                         'generation=3 population=0 births=2 deaths=0 '
+                         'evaluated=0 area=0 commit=1.00ms')
+
+
+class WorldTickStatsTestCase(unittest.TestCase):
+    def test_no_stats_recorded_by_default(self):
+        world = _blinker_world()
+        world.tick()
+        self.assertIsNone(world.last_tick_stats)
+
+    def test_collects_stats_of_last_tick(self):
+        world = _blinker_world()
+        world.collect_stats = True
+        world.tick()
+
+        stats = world.last_tick_stats
+        self.assertEqual(stats.generation, 1)
+        self.assertEqual((stats.births, stats.deaths), (2, 2))
+        self.assertEqual(stats.population, 3)
+        self.assertEqual(stats.bounding_box_area, 25)
+        self.assertEqual(stats.locations_evaluated, 15)
+        self.assertEqual(list(stats.phase_seconds),
+                         ['neighbor_count', 'rule_evaluation', 'commit'])
+
+    def test_tick_hooks_are_called_with_stats(self):
+        world = _blinker_world()
+        recorded = []
+        world.add_tick_hook(recorded.append)
+        world.tick()
+        world.tick()
+        self.assertEqual([stats.generation for stats in recorded], [1, 2])
@@ -63,3 +63,24 @@ class TurnRenderingsTestCase(unittest.TestCase, RenderingTestsMixin):
                      '+--+\n' +
                      '+++-')]
         self.assertEqual(list(actual), expected)
+
+    def test_can_render_turns_with_stats(self):
+        world = render_to_world('+++')
+        renderings = list(turn_renderings(world, turns=1, stats=True))
+        self.assertEqual(renderings[0], 'Turn 0:\n+++')
+        self.assertTrue(renderings[1].startswith('Turn 1:\n-+-\n'
+                                                 'generation=1 population=1 '
+                                                 'births=0 deaths=2'))
+
+    def test_rendering_with_stats_restores_collect_stats(self):
+        for collect_stats in (False, True):
+            with self.subTest(collect_stats=collect_stats):
+                world = render_to_world('+++')
+                world.collect_stats = collect_stats
+                renderings = turn_renderings(world, turns=3, stats=True)
+                next(renderings)
+                next(renderings)
+                self.assertTrue(world.collect_stats)
+
+                renderings.close()
+                self.assertEqual(world.collect_stats, collect_stats)
@@ -1,3 +1,4 @@
+from random import Random
 import unittest
 
 from game_of_life.cell import Cell
@@ -224,6 +225,14 @@ class WorldTestCase(unittest.TestCase, RenderingTestsMixin):
         world = World.empty()
         self.assertEqual(world.living_cell_count, 0)
 
+    def test_living_cell_count_drops_when_living_cell_set_dead(self):
+        world = World.empty()
+        world.set_living_at(self.location)
+        world.set_living_at(Location(1, 0))
+        world.set_dead_at(self.location)
+        self.assertEqual(world.living_cell_count, 1)
+        self.assertEqual(world.living_locations, [Location(1, 0)])
+
     def test_can_get_a_random_world(self):
         world = World.random(min_location=Location(0, 0),
                              max_location=Location(3, 3),
@@ -231,5 +240,199 @@ class WorldTestCase(unittest.TestCase, RenderingTestsMixin):
 
         self.assertEqual(world.living_cell_count, 12)
 
+    def test_random_world_can_be_full(self):
+        world = World.random(min_location=Location(0, 0),
+                             max_location=Location(99, 99),
+                             cell_count=10000)
+        self.assertEqual(world.dead_cell_count, 0)
+
+    def test_random_world_with_density(self):
+        world = World.random(min_location=Location(-5, -5),
+                             max_location=Location(4, 4), density=0.25)
+        self.assertEqual(world.living_cell_count, 25)
+        self.assertEqual(world.dimensions, (10, 10))
+        for location in world.living_locations:
+            self.assertTrue(-5 <= location.x <= 4 and -5 <= location.y <= 4)
+
+    def test_random_world_is_reproducible_from_rng(self):
+        worlds = [World.random(min_location=Location(0, 0),
+                               max_location=Location(30, 30), density=0.3,
+                               rng=Random(7))
+                  for _ in range(2)]
+        self.assertEqual(set(worlds[0].living_locations),
+                         set(worlds[1].living_locations))
+
+    def test_random_world_cannot_have_more_cells_than_bounds(self):
+        with self.assertRaises(ValueError):
+            World.random(min_location=Location(0, 0),
+                         max_location=Location(1, 1), cell_count=5)
+
+        with self.assertRaises(ValueError):
+            World.random(cell_count=1, density=0.5)
+
+    def test_from_locations_fits_bounds_to_locations(self):
+        world = World.from_locations([Location(2, -1), Location(-3, 4)])
+        self.assertEqual(world.min_location, Location(-3, -1))
+        self.assertEqual(world.max_location, Location(2, 4))
+        self.assertEqual(world.living_cell_count, 2)
+
+    def test_from_locations_expands_given_bounds(self):
+        world = World.from_locations([Location(5, 5)],
+                                     min_location=Location(0, 0),
+                                     max_location=Location(2, 2))
+        self.assertEqual(world.min_location, Location(0, 0))
+        self.assertEqual(world.max_location, Location(5, 5))
+
+    def test_set_living_and_dead_many(self):
+        world = World.empty()
+        world.set_living_many([Location(x, 0) for x in range(-3, 4)])
+        self.assertEqual(world.living_cell_count, 7)
+        self.assertEqual(world.dimensions, (7, 1))
+
+        world.set_dead_many([Location(-3, 0), Location(3, 0),
+                             Location(9, 9)])
+        self.assertEqual(world.living_cell_count, 5)
+        self.assertFalse(world.is_alive_at(Location(3, 0)))
+
+    def test_set_living_and_dead_many_take_coordinate_pairs(self):
+        world = World.empty()
+        world.set_living_many([(1, 1), (2, 1)])
+        world.set_dead_many([(1, 1)])
+        self.assertEqual(world.living_locations, [Location(2, 1)])
+
+    def test_locations_beyond_key_range_are_rejected(self):
+        world = World.empty()
+        with self.assertRaises(OverflowError):
+            world.set_living_at(Location(2 ** 31, 0))
+        with self.assertRaises(OverflowError):
+            world.set_living_many([Location(1, 1), Location(-2 ** 31 - 1, 1)])
+
+        self.assertFalse(world.is_alive_at(Location(-2 ** 31, 1)))
+        self.assertEqual(world.living_locations, [Location(1, 1)])
+        self.assertEqual(world.dimensions, (2, 2))
+
+    def test_locations_beyond_key_range_are_dead(self):
+        world = World.empty()
+        world.set_living_at(Location(0, 0))
+        location = Location(2 ** 31, 0)
+
+        world.set_dead_at(location)
+        world.set_dead_many([location, (-2 ** 31 - 1, 0)])
+
+        self.assertFalse(world.is_alive_at(location))
+        self.assertFalse(world.get_cell_at(location).alive)
+        self.assertEqual(world.count_living_in(location, Location(2 ** 40, 5)),
+                         0)
+        self.assertEqual(world.living_locations, [Location(0, 0)])
+
+    def test_shrinking_bounds_follow_a_glider(self):
+        world = World.empty(shrink_bounds=True)
+        for coordinates in [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]:
+            world.set_living_at(Location(*coordinates))
+
+        for _ in range(40):
+            world.tick()
+
+        self.assertEqual(world.living_cell_count, 5)
+        self.assertEqual(world.dimensions, (3, 3))
+        self.assertEqual(world.min_location, Location(10, 10))
+
+    def test_shrinking_bounds_keep_margin_around_living_cells(self):
+        world = World.empty(min_location=Location(-50, -50),
+                            max_location=Location(50, 50),
+                            shrink_bounds=True, bounds_margin=2)
+        for coordinates in [(-1, 0), (0, 0), (1, 0)]:
+            world.set_living_at(Location(*coordinates))
+
+        world.tick()
+        self.assertEqual(world.min_location, Location(-2, -3))
+        self.assertEqual(world.max_location, Location(2, 3))
+
+    def test_bounds_do_not_shrink_by_default(self):
+        world = World.empty(min_location=Location(-50, -50),
+                            max_location=Location(50, 50))
+        world.set_living_at(self.location)
+        world.tick()
+        self.assertEqual(world.dimensions, (101, 101))
+
+    def test_active_region_ticks_match_full_ticks(self):
+        for shrink_bounds in (False, True):
+            world = World.random(min_location=Location(-20, -20),
+                                 max_location=Location(20, 20),
+                                 cell_count=600, shrink_bounds=shrink_bounds)
+            active_world = World(world.min_location, world.max_location,
+                                 shrink_bounds=shrink_bounds,
+                                 active_region=True)
+            for location in world.living_locations:
+                active_world.set_living_at(location)
+
+            for turn in range(60):
+                with self.subTest(shrink_bounds=shrink_bounds, turn=turn):
+                    if turn == 30:
+                        for each_world in (world, active_world):
+                            each_world.set_living_at(Location(0, 0))
+                            each_world.set_dead_at(Location(1, 1))
+                            each_world.set_living_at(Location(25, 25))
+
+                    world.tick()
+                    active_world.tick()
+                    self.assertEqual(set(active_world.living_locations),
+                                     set(world.living_locations))
+                    self.assertEqual(active_world.dimensions,
+                                     world.dimensions)
+
+    def test_active_region_ticks_only_evaluate_changes(self):
+        world = World.empty(min_location=Location(0, 0),
+                            max_location=Location(99, 99),
+                            active_region=True)
+        world.collect_stats = True
+        for coordinates in [(10, 10), (11, 10), (10, 11), (11, 11),
+                            (50, 50), (51, 50), (52, 50)]:
+            world.set_living_at(Location(*coordinates))
+
+        world.tick()
+        world.tick()
+        # The four cells of the blinker that changed and their neighbors
+        self.assertEqual(world.last_tick_stats.locations_evaluated, 21)
+
+    def test_changes_are_only_tracked_with_active_region(self):
+        world = World.random(min_location=Location(0, 0),
+                             max_location=Location(20, 20), cell_count=100)
+        world.tick()
+        world.set_living_at(Location(5, 5))
+        self.assertIsNone(world._changed_keys)
+
+        world.active_region = True
+        world.tick()
+        self.assertIsNotNone(world._changed_keys)
+
+        world.active_region = False
+        self.assertIsNone(world._changed_keys)
+        world.tick()
+        self.assertIsNone(world._changed_keys)
+
+    def test_region_queries_follow_ticks_and_edits(self):
+        world = World.random(min_location=Location(-30, -30),
+                             max_location=Location(30, 30), cell_count=900)
+        min_location, max_location = Location(-12, -3), Location(20, 9)
+
+        for turn in range(20):
+            with self.subTest(turn=turn):
+                if turn == 10:
+                    world.set_living_at(Location(0, 0))
+                    world.set_dead_at(Location(1, 1))
+                    world.set_living_many([Location(2, 2), Location(3, 2)])
+
+                expected = {location for location in world.living_locations
+                            if min_location.x <= location.x <= max_location.x
+                            and min_location.y <= location.y <= max_location.y}
+                self.assertEqual(
+                    world.count_living_in(min_location, max_location),
+                    len(expected))
+                self.assertEqual(
+                    set(world.living_in(min_location, max_location)),
+                    expected)
+                world.tick()
+
     # TODO: check to make sure max/min location change as well when setting
     # living cell somewhere.
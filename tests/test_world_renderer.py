@@ -1,3 +1,4 @@
+import io
 import unittest
 from unittest.mock import patch
 
@@ -68,3 +69,43 @@ class WorldRendererTestCase(unittest.TestCase, RenderingTestsMixin):
         render = WorldRenderer(world).render()
         expected = 'XOX'
         self.assertEqual(render, expected)
+
+    def test_viewport_renders_only_given_rectangle(self):
+        world = World.empty()
+        for coordinates in [(0, 0), (1, 1), (5, 5), (-5, -5)]:
+            world.set_living_at(Location(*coordinates))
+
+        render = WorldRenderer(world).render(
+            viewport=(Location(0, 0), Location(2, 1)))
+        expected = ('-+-\n'
+                    '+--')
+        self.assertEqual(render, expected)
+
+    def test_viewport_can_extend_beyond_world(self):
+        world = World.empty()
+        world.set_living_at(Location(0, 0))
+        render = WorldRenderer(world).render(
+            viewport=(Location(-1, 0), Location(1, 0)))
+        self.assertEqual(render, '-+-')
+
+    def test_viewport_can_extend_beyond_key_range(self):
+        world = World.empty()
+        world.set_living_at(Location(2 ** 31 - 1, 0))
+        render = WorldRenderer(world).render(
+            viewport=(Location(2 ** 31 - 1, 0), Location(2 ** 31, 0)))
+        self.assertEqual(render, '+-')
+
+    def test_render_rows_yields_rows_from_top_down(self):
+        world = World.empty()
+        world.set_living_at(Location(0, 0))
+        world.set_living_at(Location(1, 2))
+        rows = list(WorldRenderer(world).render_rows())
+        self.assertEqual(rows, ['-+', '--', '+-'])
+
+    def test_write_streams_rendering_to_file(self):
+        world = World.empty()
+        world.set_living_at(Location(0, 0))
+        world.set_living_at(Location(0, 2))
+        file = io.StringIO()
+        WorldRenderer(world).write(file)
+        self.assertEqual(file.getvalue(), WorldRenderer(world).render())